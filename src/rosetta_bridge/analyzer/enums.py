@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
 from sqlalchemy import text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
+
+from rosetta_bridge.analyzer.sql import estimated_row_count, quote_identifier, table_ref
 
 
 _ENUM_TYPES = {
@@ -19,6 +22,7 @@ _ENUM_TYPES = {
     "bigint",
     "smallint",
 }
+_INTEGER_TYPES = {"int", "integer", "bigint", "smallint"}
 
 
 def detect_enum_values(
@@ -47,3 +51,233 @@ def detect_enum_values(
             return None
         values = connection.execute(values_stmt, {}).scalars().all()
         return list(values)
+
+_UNKNOWN_COVERAGE_CONFIDENCE = 0.5
+
+
+@dataclass(frozen=True)
+class EnumProfile:
+    values: dict[str, list[Any]]
+    strategy: str
+    confidence: float
+
+
+def _column_types(columns: list[dict[str, Any]]) -> dict[str, str]:
+    return {
+        column["name"]: str(column.get("type", "")).strip().lower()
+        for column in columns
+        if column.get("name")
+    }
+
+
+def enum_candidates(columns: list[dict[str, Any]]) -> list[str]:
+    candidates = []
+    for column in columns:
+        name = column.get("name")
+        column_type = str(column.get("type", "")).strip().lower()
+        if name and column_type in _ENUM_TYPES:
+            candidates.append(name)
+    return candidates
+
+
+def _scan_enum_values(
+    connection: Connection,
+    dialect_name: str,
+    source: str,
+    candidates: list[str],
+    max_values: int,
+    params: dict[str, Any] | None = None,
+    count_rows: bool = False,
+) -> tuple[dict[str, list[Any]], int | None]:
+    params = params or {}
+    selects = [
+        f"COUNT(DISTINCT {quote_identifier(name)}) AS c{index}"
+        for index, name in enumerate(candidates)
+    ]
+    if count_rows:
+        selects.append("COUNT(*) AS row_count")
+    counts = connection.execute(
+        text("SELECT " + ", ".join(selects) + f" FROM {source}"), params
+    ).one()
+    row_count = counts[-1] if count_rows else None
+    low_cardinality = [
+        name for name, count in zip(candidates, counts) if count < max_values
+    ]
+    if not low_cardinality:
+        return {}, row_count
+
+    if dialect_name == "postgresql":
+        values_stmt = text(
+            "SELECT "
+            + ", ".join(
+                f"array_agg(DISTINCT {quote_identifier(name)} ORDER BY {quote_identifier(name)}) AS v{index}"
+                for index, name in enumerate(low_cardinality)
+            )
+            + f" FROM {source}"
+        )
+        row = connection.execute(values_stmt, params).one()
+        values_by_column = {
+            name: list(values or []) for name, values in zip(low_cardinality, row)
+        }
+    else:
+        values_stmt = text(
+            " UNION ALL ".join(
+                f"SELECT DISTINCT {index} AS idx, {quote_identifier(name)} AS value FROM {source}"
+                for index, name in enumerate(low_cardinality)
+            )
+            + " ORDER BY idx, value"
+        )
+        values_by_column = {name: [] for name in low_cardinality}
+        for index, value in connection.execute(values_stmt, params):
+            values_by_column[low_cardinality[index]].append(value)
+
+    values = {name: found for name, found in values_by_column.items() if found}
+    return values, row_count
+
+
+def profile_enum_columns(
+    engine: Engine,
+    table_name: str,
+    columns: list[dict[str, Any]],
+    max_values: int = 20,
+) -> dict[str, list[Any]]:
+    candidates = enum_candidates(columns)
+    if not candidates:
+        return {}
+
+    with engine.connect() as connection:
+        values, _ = _scan_enum_values(
+            connection,
+            engine.dialect.name,
+            table_ref(table_name),
+            candidates,
+            max_values,
+        )
+    return values
+
+
+def _profile_from_tablesample(
+    engine: Engine,
+    table_name: str,
+    candidates: list[str],
+    row_budget: int,
+    max_values: int,
+) -> EnumProfile:
+    projection = ", ".join(quote_identifier(name) for name in candidates)
+    source_table = table_ref(table_name)
+    params: dict[str, Any] = {"row_budget": row_budget}
+
+    with engine.connect() as connection:
+        estimated_rows = None
+        sample_clause = ""
+        if engine.dialect.name == "postgresql":
+            estimated_rows = estimated_row_count(connection, table_name)
+            if estimated_rows is not None and estimated_rows > row_budget:
+                params["percent"] = min(100.0, row_budget / estimated_rows * 100)
+                sample_clause = " TABLESAMPLE SYSTEM (:percent) REPEATABLE (0)"
+
+        source = (
+            f"(SELECT {projection} FROM {source_table}{sample_clause} "
+            "LIMIT :row_budget) AS sample"
+        )
+        values, row_count = _scan_enum_values(
+            connection,
+            engine.dialect.name,
+            source,
+            candidates,
+            max_values,
+            params=params,
+            count_rows=True,
+        )
+
+    if row_count is not None and row_count < row_budget and not sample_clause:
+        confidence = 1.0
+    elif estimated_rows:
+        confidence = min(1.0, row_budget / estimated_rows)
+    else:
+        confidence = _UNKNOWN_COVERAGE_CONFIDENCE
+    return EnumProfile(values=values, strategy="tablesample", confidence=confidence)
+
+
+_PG_STATS_SQL = """
+SELECT attname, n_distinct, null_frac,
+       most_common_vals::text::text[] AS most_common_vals,
+       most_common_freqs
+FROM pg_catalog.pg_stats
+WHERE schemaname = COALESCE(:schema, current_schema())
+  AND tablename = :table
+  AND attname = ANY(:columns)
+"""
+
+
+def _profile_from_stats(
+    engine: Engine,
+    table_name: str,
+    candidates: list[str],
+    column_types: dict[str, str],
+    max_values: int,
+) -> EnumProfile | None:
+    schema, _, table = table_name.rpartition(".")
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text(_PG_STATS_SQL),
+            {"schema": schema or None, "table": table, "columns": candidates},
+        ).mappings().all()
+        if not rows:
+            return None
+        estimated_rows = estimated_row_count(connection, table_name) or 0.0
+
+    values: dict[str, list[Any]] = {}
+    coverages: list[float] = []
+    for row in rows:
+        n_distinct = row["n_distinct"] or 0
+        if n_distinct < 0:
+            n_distinct = -n_distinct * estimated_rows
+        common_values = row["most_common_vals"]
+        if not common_values or n_distinct >= max_values:
+            continue
+        # pg_stats only exposes most_common_vals as text; restore native types so
+        # the result matches the exact and tablesample strategies.
+        if column_types.get(row["attname"]) in _INTEGER_TYPES:
+            try:
+                common_values = [int(value) for value in common_values]
+            except ValueError:
+                continue
+        values[row["attname"]] = sorted(common_values)
+        coverage = sum(row["most_common_freqs"] or []) + (row["null_frac"] or 0)
+        coverages.append(min(1.0, coverage))
+
+    confidence = min(coverages) if coverages else 1.0
+    ordered = {name: values[name] for name in candidates if name in values}
+    return EnumProfile(values=ordered, strategy="stats", confidence=confidence)
+
+
+def profile_table_enums(
+    engine: Engine,
+    table_name: str,
+    columns: list[dict[str, Any]],
+    strategy: str = "exact",
+    row_budget: int = 100_000,
+    max_values: int = 20,
+) -> EnumProfile:
+    candidates = enum_candidates(columns)
+    if not candidates:
+        return EnumProfile(values={}, strategy=strategy, confidence=1.0)
+
+    if strategy == "stats":
+        profile = None
+        if engine.dialect.name == "postgresql":
+            profile = _profile_from_stats(
+                engine, table_name, candidates, _column_types(columns), max_values
+            )
+        if profile is not None:
+            return profile
+        strategy = "tablesample"
+
+    if strategy == "tablesample":
+        return _profile_from_tablesample(
+            engine, table_name, candidates, row_budget, max_values
+        )
+
+    values = profile_enum_columns(engine, table_name, columns, max_values=max_values)
+    return EnumProfile(values=values, strategy="exact", confidence=1.0)
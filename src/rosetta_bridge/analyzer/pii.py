@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import re
+import threading
+from typing import Any, Iterable, Mapping
+
+
+_PII_PATTERNS = {
+    "email": r"\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b",
+    "ssn": r"\b\d{3}-\d{2}-\d{4}\b",
+    "phone": r"\b(?:\+?\d{1,3}[\s.-]?)?(?:\(\d{3}\)|\d{3})[\s.-]?\d{3}[\s.-]?\d{4}\b",
+}
+PII_KINDS = tuple(_PII_PATTERNS)
+
+_PII_RE = re.compile(
+    "|".join(f"(?P<{kind}>{pattern})" for kind, pattern in _PII_PATTERNS.items()),
+    re.IGNORECASE,
+)
+# Cheap prefilter: every email contains an "@", and every SSN or phone number
+# ends in two digits, an optional separator and four more digits. Both start with
+# a required literal or digit, so the regex engine skips ahead between hits.
+_CANDIDATE_RES = (
+    re.compile(r"@"),
+    re.compile(r"\d\d[\s.-]?\d{4}"),
+)
+_KIND_RES = {kind: re.compile(pattern, re.IGNORECASE) for kind, pattern in _PII_PATTERNS.items()}
+# NUL is neither a word nor a whitespace character, so no pattern can match
+# across two joined values and a whole value can serve as a scan window.
+_VALUE_SEPARATOR = "\x00"
+# Scan results keyed by a digest of the joined column text, so the cache never
+# holds raw sample data.
+_SCAN_CACHE_SIZE = 256
+_scan_cache: OrderedDict[bytes, tuple[tuple[str, ...], int]] = OrderedDict()
+_scan_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class PiiFinding:
+    column: str
+    kinds: tuple[str, ...]
+    matches: int
+
+
+def _value_span(text: str, start: int, end: int) -> tuple[int, int]:
+    value_end = text.find(_VALUE_SEPARATOR, end)
+    return text.rfind(_VALUE_SEPARATOR, 0, start) + 1, len(text) if value_end < 0 else value_end
+
+
+def _candidate_windows(text: str) -> list[tuple[int, int]]:
+    windows: set[tuple[int, int]] = set()
+    for candidate_re in _CANDIDATE_RES:
+        found = candidate_re.search(text)
+        while found is not None:
+            window = _value_span(text, found.start(), found.end())
+            windows.add(window)
+            found = candidate_re.search(text, window[1])
+    return sorted(windows)
+
+
+def _scan_uncached(text: str) -> tuple[tuple[str, ...], int]:
+    kinds: set[str] = set()
+    matches = 0
+    matched: list[tuple[int, int]] = []
+    for start, end in _candidate_windows(text):
+        before = matches
+        for match in _PII_RE.finditer(text, start, end):
+            kinds.add(match.lastgroup)
+            matches += 1
+        if matches > before:
+            matched.append((start, end))
+    if kinds and len(kinds) < len(PII_KINDS):
+        # The alternation reports one kind per span, so a kind overlapped by
+        # another match (a phone number inside an email) is searched for again,
+        # but only in values where something matched.
+        kinds.update(
+            kind
+            for kind, pattern in _KIND_RES.items()
+            if kind not in kinds
+            and any(pattern.search(text, start, end) for start, end in matched)
+        )
+    return tuple(kind for kind in PII_KINDS if kind in kinds), matches
+
+
+def _scan_text(text: str) -> tuple[tuple[str, ...], int]:
+    key = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    with _scan_cache_lock:
+        cached = _scan_cache.get(key)
+        if cached is not None:
+            _scan_cache.move_to_end(key)
+            return cached
+    result = _scan_uncached(text)
+    with _scan_cache_lock:
+        _scan_cache[key] = result
+        while len(_scan_cache) > _SCAN_CACHE_SIZE:
+            _scan_cache.popitem(last=False)
+    return result
+
+
+def _joined(values: Iterable[Any]) -> str:
+    return _VALUE_SEPARATOR.join(str(value) for value in values if value is not None)
+
+
+def scan_values(values: Iterable[Any]) -> tuple[str, ...]:
+    return _scan_text(_joined(values))[0]
+
+
+def scan_columns(
+    samples_by_column: Mapping[str, Iterable[Any]],
+    memoize: bool = True,
+) -> dict[str, PiiFinding]:
+    """Scan each column's values; memoize=False suits batches that never repeat."""
+    scan = _scan_text if memoize else _scan_uncached
+    findings: dict[str, PiiFinding] = {}
+    for column, values in samples_by_column.items():
+        kinds, matches = scan(_joined(values))
+        if kinds:
+            findings[column] = PiiFinding(column=column, kinds=kinds, matches=matches)
+    return findings
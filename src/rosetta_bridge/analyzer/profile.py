@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field, replace
+import json
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy.engine import Engine
+
+from rosetta_bridge.analyzer.enums import EnumProfile, profile_table_enums
+from rosetta_bridge.analyzer.pii import scan_columns
+from rosetta_bridge.analyzer.sampler import (
+    ColumnStats,
+    SampleMethod,
+    SampleReport,
+    plan_sample_projection,
+    stream_sample_rows,
+)
+from rosetta_bridge.codegen.writer import write_chunks
+from rosetta_bridge.inspector.snapshot import TableSchema
+
+
+_PROFILES_VERSION = 1
+# Rows buffered per column before each PII scan while streaming samples.
+_PII_SCAN_BATCH = 500
+
+
+@dataclass(frozen=True)
+class ColumnProfile:
+    name: str
+    type: str
+    comment: str | None = None
+    samples: list[Any] = field(default_factory=list)
+    pii: bool = False
+    pii_kinds: list[str] = field(default_factory=list)
+    enum_values: list[Any] | None = None
+    null_count: int = 0
+    distinct_count: int = 0
+    stats: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class TableProfile:
+    table: str
+    schema_hash: str
+    columns: list[ColumnProfile]
+    sampled: bool
+    sample_rows: int
+    enum_strategy: str
+    enum_confidence: float
+    sample_bytes: int = 0
+    skipped_columns: list[str] = field(default_factory=list)
+
+    @property
+    def enum_values(self) -> dict[str, list[Any]]:
+        return {
+            column.name: column.enum_values
+            for column in self.columns
+            if column.enum_values is not None
+        }
+
+    @property
+    def pii_columns(self) -> list[str]:
+        return [column.name for column in self.columns if column.pii]
+
+    @property
+    def enum_profile(self) -> EnumProfile:
+        return EnumProfile(
+            values=self.enum_values,
+            strategy=self.enum_strategy,
+            confidence=self.enum_confidence,
+        )
+
+    def to_dict(self, keep_samples: bool = True) -> dict[str, Any]:
+        """Serialize the profile; raw values of PII columns are never included."""
+        payload = asdict(self)
+        stripped = False
+        for column in payload["columns"]:
+            if column["pii"]:
+                column["stats"].pop("min", None)
+                column["stats"].pop("max", None)
+            if column["samples"] and (column["pii"] or not keep_samples):
+                column["samples"] = []
+                stripped = True
+        if stripped:
+            # Without its samples the profile cannot serve prompts that need them.
+            payload["sampled"] = False
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> TableProfile:
+        return cls(
+            table=payload["table"],
+            schema_hash=payload["schema_hash"],
+            columns=[ColumnProfile(**column) for column in payload["columns"]],
+            sampled=payload["sampled"],
+            sample_rows=payload["sample_rows"],
+            enum_strategy=payload["enum_strategy"],
+            enum_confidence=payload["enum_confidence"],
+            sample_bytes=payload.get("sample_bytes", 0),
+            skipped_columns=payload.get("skipped_columns", []),
+        )
+
+
+def profile_table(
+    engine: Engine,
+    table: TableSchema,
+    schema_hash: str = "",
+    sample_rows: bool = True,
+    sample_limit: int = 3,
+    strategy: str = "exact",
+    row_budget: int = 100_000,
+    max_values: int = 20,
+    sample_row_budget: int = 1000,
+    sample_byte_budget: int | None = None,
+    sample_method: SampleMethod = "first",
+    max_value_chars: int | None = 256,
+) -> TableProfile:
+    projection = plan_sample_projection(table.columns)
+    names = projection.columns
+    stats = {name: ColumnStats() for name in names}
+    samples: dict[str, list[Any]] = {name: [] for name in names}
+    pii_kinds: dict[str, set[str]] = {name: set() for name in names}
+    pending: dict[str, list[Any]] = {name: [] for name in names}
+
+    def scan_pending() -> None:
+        for name, finding in scan_columns(pending, memoize=False).items():
+            pii_kinds[name].update(finding.kinds)
+        for values in pending.values():
+            values.clear()
+
+    rows = 0
+    report = SampleReport()
+    if sample_rows and names:
+        for row in stream_sample_rows(
+            engine,
+            table.table_name,
+            columns=names,
+            limit=max(sample_limit, sample_row_budget),
+            method=sample_method,
+            byte_budget=sample_byte_budget,
+            truncate=projection.truncated,
+            max_value_chars=max_value_chars,
+            report=report,
+        ):
+            rows += 1
+            for name in names:
+                value = row.get(name)
+                stats[name].add(value)
+                pending[name].append(value)
+                if rows <= sample_limit:
+                    samples[name].append(value)
+            if rows % _PII_SCAN_BATCH == 0:
+                scan_pending()
+        scan_pending()
+
+    enum_profile = profile_table_enums(
+        engine,
+        table.table_name,
+        table.columns,
+        strategy=strategy,
+        row_budget=row_budget,
+        max_values=max_values,
+    )
+
+    columns = []
+    for column in table.columns:
+        name = column.get("name")
+        if not name:
+            continue
+        column_stats = stats.get(name, ColumnStats())
+        columns.append(
+            ColumnProfile(
+                name=name,
+                type=str(column.get("type", "")),
+                comment=column.get("comment"),
+                samples=samples.get(name, []),
+                pii=bool(pii_kinds.get(name)),
+                pii_kinds=sorted(pii_kinds.get(name, ())),
+                enum_values=enum_profile.values.get(name),
+                null_count=column_stats.nulls,
+                distinct_count=column_stats.distinct_count,
+                stats=column_stats.to_dict() if column_stats.count else {},
+            )
+        )
+
+    return TableProfile(
+        table=table.table_name,
+        schema_hash=schema_hash,
+        columns=columns,
+        sampled=sample_rows,
+        sample_rows=rows,
+        enum_strategy=enum_profile.strategy,
+        enum_confidence=enum_profile.confidence,
+        sample_bytes=report.bytes,
+        skipped_columns=projection.skipped,
+    )
+
+
+def resample_profile(
+    engine: Engine,
+    table: TableSchema,
+    profile: TableProfile,
+    sample_limit: int = 3,
+    sample_byte_budget: int | None = None,
+    sample_method: SampleMethod = "first",
+    max_value_chars: int | None = 256,
+) -> TableProfile:
+    """Fetch prompt samples for a profile that was saved without them.
+
+    Enum values, stats and PII flags are kept, so only sample_limit rows are read.
+    The new samples are scanned too, so PII flags can be added but never dropped.
+    """
+    projection = plan_sample_projection(table.columns)
+    names = projection.columns
+    samples: dict[str, list[Any]] = {name: [] for name in names}
+    if names and sample_limit:
+        for row in stream_sample_rows(
+            engine,
+            table.table_name,
+            columns=names,
+            limit=sample_limit,
+            method=sample_method,
+            byte_budget=sample_byte_budget,
+            truncate=projection.truncated,
+            max_value_chars=max_value_chars,
+        ):
+            for name in names:
+                samples[name].append(row.get(name))
+    findings = scan_columns(samples, memoize=False)
+
+    columns = []
+    for column in profile.columns:
+        finding = findings.get(column.name)
+        kinds = set(column.pii_kinds) | set(finding.kinds if finding else ())
+        columns.append(
+            replace(
+                column,
+                samples=samples.get(column.name, []),
+                pii=column.pii or finding is not None,
+                pii_kinds=sorted(kinds),
+            )
+        )
+    return replace(profile, columns=columns, sampled=True)
+
+
+class ProfileStore:
+    """Table profiles reusable while the table's schema hash is unchanged."""
+
+    def __init__(self, profiles: dict[str, TableProfile] | None = None) -> None:
+        self._profiles = dict(profiles or {})
+
+    def get(self, table: str, schema_hash: str, need_samples: bool = False) -> TableProfile | None:
+        profile = self._profiles.get(table)
+        if profile is None or profile.schema_hash != schema_hash:
+            return None
+        if need_samples and not profile.sampled:
+            return None
+        return profile
+
+    def put(self, profile: TableProfile) -> None:
+        self._profiles[profile.table] = profile
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    @classmethod
+    def load(cls, path: Path, settings_hash: str) -> ProfileStore:
+        try:
+            payload = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return cls()
+        if not isinstance(payload, dict):
+            return cls()
+        if payload.get("version") != _PROFILES_VERSION:
+            return cls()
+        if payload.get("settings") != settings_hash:
+            return cls()
+        tables = payload.get("tables")
+        if not isinstance(tables, dict):
+            return cls()
+        try:
+            return cls({name: TableProfile.from_dict(entry) for name, entry in tables.items()})
+        except (KeyError, TypeError):
+            return cls()
+
+    def save(self, path: Path, settings_hash: str, keep_samples: bool = True) -> Path:
+        payload = {
+            "version": _PROFILES_VERSION,
+            "settings": settings_hash,
+            "tables": {
+                name: profile.to_dict(keep_samples=keep_samples)
+                for name, profile in self._profiles.items()
+            },
+        }
+        return write_chunks(path, json.JSONEncoder(indent=2, default=str).iterencode(payload))
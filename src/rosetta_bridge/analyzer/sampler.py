@@ -1,17 +1,51 @@
 from __future__ import annotations
 
-import re
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Literal
 
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
+from rosetta_bridge.analyzer.pii import scan_values
+from rosetta_bridge.analyzer.sql import estimated_row_count, quote_identifier, table_ref
 
-_EMAIL_RE = re.compile(r"\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b", re.IGNORECASE)
-_PHONE_RE = re.compile(
-    r"\b(?:\+?\d{1,3}[\s.-]?)?(?:\(\d{3}\)|\d{3})[\s.-]?\d{3}[\s.-]?\d{4}\b"
-)
-_SSN_RE = re.compile(r"\b\d{3}-\d{2}-\d{4}\b")
+
+SampleMethod = Literal["first", "random", "tablesample"]
+
+_DISTINCT_CAP = 1024
+_BINARY_TYPE_TOKENS = ("bytea", "blob", "binary", "image", "raw")
+_WIDE_TYPE_TOKENS = ("char", "text", "json", "xml", "clob", "string")
+
+
+@dataclass(frozen=True)
+class SampleProjection:
+    columns: list[str]
+    truncated: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+
+
+@dataclass
+class SampleReport:
+    rows: int = 0
+    bytes: int = 0
+
+
+def plan_sample_projection(columns: list[dict[str, Any]]) -> SampleProjection:
+    selected: list[str] = []
+    truncated: list[str] = []
+    skipped: list[str] = []
+    for column in columns:
+        name = column.get("name")
+        if not name:
+            continue
+        column_type = str(column.get("type", "")).lower()
+        if any(token in column_type for token in _BINARY_TYPE_TOKENS):
+            skipped.append(name)
+            continue
+        selected.append(name)
+        if any(token in column_type for token in _WIDE_TYPE_TOKENS):
+            truncated.append(name)
+    return SampleProjection(columns=selected, truncated=truncated, skipped=skipped)
 
 
 def fetch_sample_rows(
@@ -26,17 +60,145 @@ def fetch_sample_rows(
         return list(result.mappings())
 
 
-def detect_pii(values: list[Any]) -> bool:
-    for value in values:
+def _sample_statement(
+    engine: Engine,
+    table_name: str,
+    columns: list[str] | None,
+    method: SampleMethod,
+    estimated_rows: float | None,
+    limit: int,
+    truncate: list[str] | None = None,
+    max_value_chars: int | None = None,
+) -> tuple[str, dict[str, Any]]:
+    params: dict[str, Any] = {"limit": limit}
+    truncated = set(truncate or []) if max_value_chars else set()
+    if truncated:
+        params["max_value_chars"] = max_value_chars
+    expressions = []
+    for name in columns or []:
+        column_ref = quote_identifier(name)
+        if name not in truncated:
+            expressions.append(column_ref)
+        elif engine.dialect.name == "postgresql":
+            expressions.append(
+                f"left(CAST({column_ref} AS text), :max_value_chars) AS {column_ref}"
+            )
+        else:
+            expressions.append(
+                f"substr(CAST({column_ref} AS TEXT), 1, :max_value_chars) AS {column_ref}"
+            )
+    projection = ", ".join(expressions) if expressions else "*"
+    source_table = table_ref(table_name)
+    if method == "tablesample" and engine.dialect.name == "postgresql":
+        if estimated_rows is not None and estimated_rows > limit:
+            params["percent"] = min(100.0, limit / estimated_rows * 100)
+            return (
+                f"SELECT {projection} FROM {source_table} "
+                "TABLESAMPLE SYSTEM (:percent) REPEATABLE (0) LIMIT :limit",
+                params,
+            )
+        method = "first"
+    if method in ("random", "tablesample"):
+        return f"SELECT {projection} FROM {source_table} ORDER BY random() LIMIT :limit", params
+    return f"SELECT {projection} FROM {source_table} LIMIT :limit", params
+
+
+def _value_size(value: Any) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return len(value)
+    return len(str(value))
+
+
+def stream_sample_rows(
+    engine: Engine,
+    table_name: str,
+    columns: list[str] | None = None,
+    limit: int = 1000,
+    method: SampleMethod = "first",
+    byte_budget: int | None = None,
+    batch_size: int = 500,
+    truncate: list[str] | None = None,
+    max_value_chars: int | None = None,
+    report: SampleReport | None = None,
+) -> Iterator[dict[str, Any]]:
+    with engine.connect() as connection:
+        estimated_rows = None
+        if method == "tablesample" and engine.dialect.name == "postgresql":
+            estimated_rows = estimated_row_count(connection, table_name)
+        statement, params = _sample_statement(
+            engine,
+            table_name,
+            columns,
+            method,
+            estimated_rows,
+            limit,
+            truncate=truncate,
+            max_value_chars=max_value_chars,
+        )
+        result = connection.execution_options(
+            stream_results=True,
+            yield_per=batch_size,
+        ).execute(text(statement), params)
+        report = report if report is not None else SampleReport()
+        for row in result.mappings():
+            report.rows += 1
+            report.bytes += sum(_value_size(value) for value in row.values())
+            yield dict(row)
+            if byte_budget is not None and report.bytes >= byte_budget:
+                result.close()
+                return
+
+
+@dataclass
+class ColumnStats:
+    count: int = 0
+    nulls: int = 0
+    minimum: Any = None
+    maximum: Any = None
+    length_histogram: dict[str, int] = field(default_factory=dict)
+    _distinct: set[Any] = field(default_factory=set, repr=False)
+    _comparable: bool = field(default=True, repr=False)
+
+    @property
+    def null_ratio(self) -> float:
+        return self.nulls / self.count if self.count else 0.0
+
+    @property
+    def distinct_count(self) -> int:
+        return len(self._distinct)
+
+    def add(self, value: Any) -> None:
+        self.count += 1
         if value is None:
-            continue
-        text_value = str(value)
-        if not text_value:
-            continue
-        if _EMAIL_RE.search(text_value):
-            return True
-        if _PHONE_RE.search(text_value):
-            return True
-        if _SSN_RE.search(text_value):
-            return True
-    return False
+            self.nulls += 1
+            return
+        if len(self._distinct) < _DISTINCT_CAP:
+            self._distinct.add(repr(value))
+        bucket = f"<={1 << max(0, _value_size(value) - 1).bit_length()}"
+        self.length_histogram[bucket] = self.length_histogram.get(bucket, 0) + 1
+        if not self._comparable or isinstance(value, (bytes, bytearray, memoryview)):
+            return
+        try:
+            if self.minimum is None or value < self.minimum:
+                self.minimum = value
+            if self.maximum is None or value > self.maximum:
+                self.maximum = value
+        except TypeError:
+            self._comparable = False
+            self.minimum = self.maximum = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "null_ratio": self.null_ratio,
+            "distinct_count": self.distinct_count,
+            "min": self.minimum,
+            "max": self.maximum,
+            "length_histogram": dict(self.length_histogram),
+        }
+
+
+def detect_pii(values: list[Any]) -> bool:
+    return bool(scan_values(values))
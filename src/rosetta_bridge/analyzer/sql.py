@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+def quote_identifier(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def table_ref(table_name: str) -> str:
+    return ".".join(quote_identifier(part) for part in table_name.split("."))
+
+
+def estimated_row_count(connection: Connection, table_name: str) -> float | None:
+    """Postgres planner estimate of a table's rows, or None when unknown."""
+    reltuples = connection.execute(
+        text("SELECT reltuples FROM pg_catalog.pg_class WHERE oid = to_regclass(:table_ref)"),
+        {"table_ref": table_ref(table_name)},
+    ).scalar()
+    if reltuples is None or reltuples <= 0:
+        return None
+    return float(reltuples)
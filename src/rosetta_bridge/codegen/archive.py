@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import io
+from typing import Iterable, Iterator
+import zipfile
+
+
+# Encoded bytes buffered per archive member before they are compressed.
+_WRITE_CHUNK_BYTES = 64 * 1024
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, non-seekable sink that hands out whatever zipfile wrote so far."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_zip(files: Iterable[tuple[str, Iterable[str]]]) -> Iterator[bytes]:
+    """Stream a zip archive of (name, text chunks) members without buffering whole files."""
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, chunks in files:
+            with archive.open(name, "w") as member:
+                pending: list[bytes] = []
+                size = 0
+                for chunk in chunks:
+                    data = chunk.encode("utf-8")
+                    pending.append(data)
+                    size += len(data)
+                    if size >= _WRITE_CHUNK_BYTES:
+                        member.write(b"".join(pending))
+                        pending.clear()
+                        size = 0
+                        data = sink.drain()
+                        if data:
+                            yield data
+                if pending:
+                    member.write(b"".join(pending))
+            data = sink.drain()
+            if data:
+                yield data
+    data = sink.drain()
+    if data:
+        yield data
@@ -3,11 +3,30 @@ from __future__ import annotations
 from typing import Iterable
 
 
-def render_audit_log(rows: Iterable[tuple[str, str, str]]) -> str:
+def render_audit_log(
+    rows: Iterable[tuple[str, str, str]],
+    enum_profiles: Iterable[tuple[str, str, float]] = (),
+) -> str:
     lines = [
         "| Table | Original Column | Inferred Meaning |",
         "| --- | --- | --- |",
     ]
     for table, original, inferred in rows:
         lines.append(f"| {table} | {original} | {inferred} |")
+
+    profile_lines = [
+        f"| {table} | {strategy} | {confidence:.2f} |"
+        for table, strategy, confidence in enum_profiles
+    ]
+    if profile_lines:
+        lines.extend(
+            [
+                "",
+                "## Enum profiling",
+                "",
+                "| Table | Strategy | Confidence |",
+                "| --- | --- | --- |",
+                *profile_lines,
+            ]
+        )
     return "\n".join(lines) + "\n"
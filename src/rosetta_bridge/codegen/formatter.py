@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+from pathlib import Path
+import shutil
+import subprocess
+from typing import Any, Callable, Iterable
+
+from rosetta_bridge.codegen.writer import write_chunks
+
+
+FORMAT_STATE_NAME = ".format_state.json"
+_FORMAT_STATE_VERSION = 1
+
+logger = logging.getLogger("rosetta_bridge.codegen.formatter")
+
+
+@dataclass(frozen=True)
+class FormatterBackend:
+    name: str
+    command: list[str] | None = None
+    format_source: Callable[[str], str] | None = None
+
+
+def _ruff_binary() -> str | None:
+    try:
+        from ruff.__main__ import find_ruff_bin
+    except ImportError:
+        return shutil.which("ruff")
+    try:
+        return str(find_ruff_bin())
+    except FileNotFoundError:
+        return shutil.which("ruff")
+
+
+def _black_formatter() -> Callable[[str], str] | None:
+    try:
+        import black
+    except ImportError:
+        return None
+    mode = black.Mode()
+    return lambda source: black.format_str(source, mode=mode)
+
+
+def detect_backend() -> FormatterBackend:
+    """Prefer a ruff binary we can call directly, then black in-process, then uv."""
+    ruff = _ruff_binary()
+    if ruff:
+        return FormatterBackend(name="ruff", command=[ruff, "format", "--quiet"])
+    format_source = _black_formatter()
+    if format_source is not None:
+        return FormatterBackend(name="black", format_source=format_source)
+    return FormatterBackend(name="ruff", command=["uv", "run", "ruff", "format", "--quiet"])
+
+
+def _file_digest(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class FormatStage:
+    """Write generated modules and format them, skipping files unchanged since the last run.
+
+    In-process formatting runs on a worker thread as each file is written; command
+    backends format every pending file in one invocation started by flush().
+    """
+
+    def __init__(self, output_dir: Path, backend: FormatterBackend | None = None) -> None:
+        self._output_dir = output_dir
+        self._backend = backend or detect_backend()
+        self._state_path = output_dir / FORMAT_STATE_NAME
+        self._previous = self._load_state()
+        self._state: dict[str, dict[str, str]] = {}
+        self._pending: dict[str, str] = {}
+        self._futures: list[Future[None]] = []
+        self._process: subprocess.Popen[bytes] | None = None
+        self._process_paths: dict[str, str] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        if self._backend.format_source is not None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        self.skipped: list[str] = []
+        # Files left unformatted, with the reason; reported by close().
+        self.failed: dict[str, str] = {}
+
+    def _load_state(self) -> dict[str, dict[str, str]]:
+        try:
+            payload = json.loads(self._state_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(payload, dict):
+            return {}
+        if payload.get("version") != _FORMAT_STATE_VERSION:
+            return {}
+        if payload.get("formatter") != self._backend.name:
+            return {}
+        files = payload.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def write(self, relative_path: str, chunks: Iterable[str]) -> Path:
+        target = self._output_dir / relative_path
+        previous = self._previous.get(relative_path, {})
+        source_digest = ""
+        replaced = True
+
+        def should_replace(digest: str) -> bool:
+            nonlocal source_digest, replaced
+            source_digest = digest
+            replaced = not (
+                previous.get("source") == digest
+                and previous.get("formatted") == _file_digest(target)
+            )
+            return replaced
+
+        write_chunks(target, chunks, should_replace)
+        if not replaced:
+            self._state[relative_path] = dict(previous)
+            self.skipped.append(relative_path)
+            return target
+
+        if self._executor is not None:
+            self._futures.append(
+                self._executor.submit(self._format_in_process, relative_path, source_digest)
+            )
+        else:
+            self._pending[relative_path] = source_digest
+        return target
+
+    def _format_in_process(self, relative_path: str, source_digest: str) -> None:
+        target = self._output_dir / relative_path
+        try:
+            formatted = self._backend.format_source(target.read_text())
+        except Exception as exc:
+            self._fail([relative_path], f"{self._backend.name} failed: {exc}")
+            return
+        write_chunks(target, [formatted])
+        self._record(relative_path, source_digest)
+
+    def _fail(self, relative_paths: Iterable[str], reason: str) -> None:
+        for relative_path in relative_paths:
+            self.failed[relative_path] = reason
+            logger.warning("Could not format %s: %s", relative_path, reason)
+
+    def _record(self, relative_path: str, source_digest: str) -> None:
+        formatted_digest = _file_digest(self._output_dir / relative_path)
+        if formatted_digest is not None:
+            self._state[relative_path] = {"source": source_digest, "formatted": formatted_digest}
+
+    def flush(self) -> None:
+        """Start formatting everything written so far without waiting for it."""
+        if not self._pending or self._process is not None:
+            return
+        paths = [str(self._output_dir / path) for path in self._pending]
+        try:
+            self._process = subprocess.Popen([*self._backend.command, *paths])
+        except OSError as exc:
+            self._fail(self._pending, f"could not run {self._backend.command[0]}: {exc}")
+            self._pending.clear()
+            return
+        self._process_paths = dict(self._pending)
+        self._pending.clear()
+
+    def close(self) -> dict[str, Any]:
+        """Wait for formatting to finish and persist content hashes for the next run.
+
+        Files that could not be formatted are listed in ``failed``; they get no
+        recorded hash, so the next run formats them again.
+        """
+        self.flush()
+        while self._process is not None:
+            returncode = self._process.wait()
+            if returncode == 0:
+                for relative_path, source_digest in self._process_paths.items():
+                    self._record(relative_path, source_digest)
+            else:
+                self._fail(self._process_paths, f"{self._backend.name} exited with {returncode}")
+            self._process = None
+            self._process_paths = {}
+            self.flush()
+        for future in self._futures:
+            future.result()
+        self._futures.clear()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        payload = {
+            "version": _FORMAT_STATE_VERSION,
+            "formatter": self._backend.name,
+            "files": dict(sorted(self._state.items())),
+        }
+        write_chunks(self._state_path, [json.dumps(payload, indent=2)])
+        return payload
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from rosetta_bridge.codegen.renderer import (
+    get_template,
+    stream_model_base,
+    stream_models,
+    to_field_name,
+    to_pascal,
+)
+from rosetta_bridge.codegen.repos import (
+    repository_class_names,
+    stream_repositories,
+    stream_repository_base,
+)
+
+
+LAYOUTS = ("single", "per-table", "per-schema")
+MODELS_PACKAGE = "models"
+REPOS_PACKAGE = "repos"
+BASE_MODULE = "_base"
+_DEFAULT_SCHEMA_MODULE = "default"
+
+
+def _shard_key(table_name: str, layout: str) -> str:
+    if layout == "per-schema":
+        schema, _, _ = table_name.rpartition(".")
+        return schema or _DEFAULT_SCHEMA_MODULE
+    return table_name
+
+
+def shard_modules(table_names: Iterable[str], layout: str) -> dict[str, str]:
+    """Map each table name to the module that holds it in a sharded layout."""
+    if layout not in LAYOUTS[1:]:
+        raise ValueError(f"Unknown sharded layout: {layout}")
+    modules: dict[str, str] = {}
+    by_key: dict[str, str] = {}
+    used: set[str] = {"__init__"}
+    for table_name in table_names:
+        key = _shard_key(table_name, layout)
+        module = by_key.get(key)
+        if module is None:
+            base = to_field_name(key.replace(".", "_"))
+            module = base
+            suffix = 2
+            while module in used:
+                module = f"{base}_{suffix}"
+                suffix += 1
+            used.add(module)
+            by_key[key] = module
+        modules[table_name] = module
+    return modules
+
+
+def layout_paths(table_names: Iterable[str], layout: str) -> list[str]:
+    if layout == "single":
+        return ["_models.py", "_repos.py"]
+    modules = sorted(set(shard_modules(table_names, layout).values()))
+    paths = []
+    for package in (MODELS_PACKAGE, REPOS_PACKAGE):
+        paths.append(f"{package}/__init__.py")
+        paths.append(f"{package}/{BASE_MODULE}.py")
+        paths.extend(f"{package}/{module}.py" for module in modules)
+    return paths
+
+
+def stream_lazy_init(
+    exports: Iterable[tuple[str, str]],
+    template_dir: Path | None = None,
+) -> Iterator[str]:
+    template = get_template("lazy_init.py.j2", template_dir)
+    return template.generate(exports=list(exports))
+
+
+def render_lazy_init(exports: Iterable[tuple[str, str]], template_dir: Path | None = None) -> str:
+    return "".join(stream_lazy_init(exports, template_dir))
+
+
+def iter_layout(
+    tables: list[dict[str, Any]],
+    layout: str = "single",
+    repo_style: str = "sync",
+    model_style: str = "pydantic",
+) -> Iterator[tuple[str, Iterator[str]]]:
+    """Yield (relative path, source chunks) for the models and repositories of a layout."""
+    if layout == "single":
+        yield "_models.py", stream_models(tables, model_style=model_style)
+        yield "_repos.py", stream_repositories(tables, repo_style=repo_style)
+        return
+
+    modules = shard_modules((table["table_name"] for table in tables), layout)
+    shards: dict[str, list[dict[str, Any]]] = {}
+    for table in tables:
+        shards.setdefault(modules[table["table_name"]], []).append(table)
+
+    model_exports = []
+    repo_exports = []
+    for module, shard in sorted(shards.items()):
+        for table in shard:
+            class_name = to_pascal(table["table_name"])
+            model_exports.append((class_name, module))
+            repo_exports.extend(
+                (name, module)
+                for name in repository_class_names(table["table_name"], repo_style)
+            )
+
+    yield f"{MODELS_PACKAGE}/{BASE_MODULE}.py", stream_model_base(model_style=model_style)
+    yield f"{REPOS_PACKAGE}/{BASE_MODULE}.py", stream_repository_base(repo_style=repo_style)
+    for module, shard in sorted(shards.items()):
+        yield f"{MODELS_PACKAGE}/{module}.py", stream_models(
+            shard, base_module=BASE_MODULE, model_style=model_style
+        )
+        yield f"{REPOS_PACKAGE}/{module}.py", stream_repositories(
+            shard, base_module=BASE_MODULE, repo_style=repo_style
+        )
+    yield f"{MODELS_PACKAGE}/__init__.py", stream_lazy_init(model_exports)
+    yield f"{REPOS_PACKAGE}/__init__.py", stream_lazy_init(repo_exports)
+
+
+def render_layout(
+    tables: list[dict[str, Any]],
+    layout: str = "single",
+    repo_style: str = "sync",
+    model_style: str = "pydantic",
+) -> dict[str, str]:
+    """Render models and repositories as relative path -> source for the given layout."""
+    files = iter_layout(tables, layout, repo_style, model_style)
+    return {path: "".join(chunks) for path, chunks in files}
+
+
+def stale_generated_files(
+    output_dir: Path,
+    generated: Iterable[str],
+    written: Iterable[str],
+) -> list[Path]:
+    """Files a previous run generated (per its manifest) that this run did not write.
+
+    Anything not listed in the manifest, such as handwritten helpers beside the
+    generated modules, is never returned.
+    """
+    stale = []
+    for relative_path in sorted(set(generated) - set(written)):
+        path = Path(relative_path)
+        if path.is_absolute() or ".." in path.parts:
+            continue
+        if (output_dir / path).is_file():
+            stale.append(output_dir / path)
+    return stale
+
+
+def remove_empty_packages(output_dir: Path) -> None:
+    """Drop the models/ and repos/ directories once nothing is left in them."""
+    for package in (MODELS_PACKAGE, REPOS_PACKAGE):
+        try:
+            (output_dir / package).rmdir()
+        except OSError:
+            pass
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Iterable
+
+from rosetta_bridge.codegen.writer import write_chunks
+from rosetta_bridge.inspector.snapshot import TableSchema
+
+
+MANIFEST_NAME = "manifest.json"
+_MANIFEST_VERSION = 2
+
+
+def _digest(payload: Any) -> str:
+    material = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def schema_fingerprint(table: TableSchema) -> str:
+    return _digest(
+        {
+            "table": table.table_name,
+            "comment": table.comment,
+            "primary_key": table.primary_key,
+            "columns": [
+                {
+                    "name": column.get("name"),
+                    "type": str(column.get("type", "")),
+                    "nullable": column.get("nullable"),
+                    "comment": column.get("comment"),
+                }
+                for column in table.columns
+            ],
+        }
+    )
+
+
+def table_fingerprint(schema_hash: str, enum_values: dict[str, list[Any]]) -> str:
+    return _digest({"schema": schema_hash, "enum_values": enum_values})
+
+
+def settings_fingerprint(**settings: Any) -> str:
+    return _digest(settings)
+
+
+def _read_manifest(output_dir: Path) -> dict[str, Any]:
+    path = output_dir / MANIFEST_NAME
+    try:
+        payload = json.loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    if payload.get("version") != _MANIFEST_VERSION:
+        return {}
+    return payload
+
+
+def load_manifest(output_dir: Path, settings_hash: str) -> dict[str, dict[str, Any]]:
+    payload = _read_manifest(output_dir)
+    if payload.get("settings") != settings_hash:
+        return {}
+    tables = payload.get("tables")
+    return tables if isinstance(tables, dict) else {}
+
+
+def load_generated_files(output_dir: Path) -> list[str]:
+    """Relative paths of the modules the last run generated, whatever its settings."""
+    files = _read_manifest(output_dir).get("files")
+    if not isinstance(files, list):
+        return []
+    return [path for path in files if isinstance(path, str)]
+
+
+def write_manifest(
+    output_dir: Path,
+    settings_hash: str,
+    tables: dict[str, dict[str, Any]],
+    files: Iterable[str] = (),
+) -> Path:
+    payload = {
+        "version": _MANIFEST_VERSION,
+        "settings": settings_hash,
+        "tables": tables,
+        "files": sorted(files),
+    }
+    return write_chunks(
+        output_dir / MANIFEST_NAME,
+        json.JSONEncoder(indent=2, default=str).iterencode(payload),
+    )
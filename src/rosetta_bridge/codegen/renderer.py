@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import keyword
 import re
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+from rosetta_bridge.core.config import Settings
+
+
+DEFAULT_TEMPLATE_DIR = Path(__file__).resolve().parents[3] / "templates"
+MODEL_BASE_TEMPLATE = "model_base.py.j2"
+MODEL_STYLES = ("pydantic", "dataclass", "msgspec")
 
 
 @dataclass(frozen=True)
@@ -19,6 +27,10 @@ class ColumnSpec:
     alias: str | None = None
     use_field: bool = False
 
+    @property
+    def renamed(self) -> bool:
+        return self.alias is not None and self.alias != self.field_name
+
 
 @dataclass(frozen=True)
 class TableSpec:
@@ -77,18 +89,75 @@ def _normalize_tables(tables: Iterable[dict[str, Any]]) -> list[TableSpec]:
     return normalized
 
 
+@lru_cache(maxsize=None)
+def get_template_environment(
+    template_dir: Path = DEFAULT_TEMPLATE_DIR,
+    bytecode_cache_dir: Path | None = None,
+) -> Environment:
+    bytecode_cache = None
+    if bytecode_cache_dir is not None:
+        bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+    return Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        bytecode_cache=bytecode_cache,
+    )
+
+
+@lru_cache(maxsize=1)
+def _default_bytecode_cache_dir() -> Path | None:
+    cache_dir = Settings().template_cache_dir
+    return Path(cache_dir) if cache_dir else None
+
+
+def get_template(template_name: str, template_dir: Path | None = None) -> Template:
+    env = get_template_environment(
+        template_dir or DEFAULT_TEMPLATE_DIR,
+        _default_bytecode_cache_dir(),
+    )
+    return env.get_template(template_name)
+
+
 def render_models(
     tables: Iterable[dict[str, Any]],
     template_dir: Path | None = None,
     template_name: str = "models.py.j2",
+    base_module: str | None = None,
+    model_style: str = "pydantic",
 ) -> str:
-    root_dir = Path(__file__).resolve().parents[3]
-    template_dir = template_dir or root_dir / "templates"
-    env = Environment(
-        loader=FileSystemLoader(str(template_dir)),
-        autoescape=False,
-        trim_blocks=True,
-        lstrip_blocks=True,
+    return "".join(stream_models(tables, template_dir, template_name, base_module, model_style))
+
+
+def _check_model_style(model_style: str) -> None:
+    if model_style not in MODEL_STYLES:
+        raise ValueError(f"Unknown model style: {model_style}")
+
+
+def stream_models(
+    tables: Iterable[dict[str, Any]],
+    template_dir: Path | None = None,
+    template_name: str = "models.py.j2",
+    base_module: str | None = None,
+    model_style: str = "pydantic",
+) -> Iterator[str]:
+    """Render model classes; with base_module they import the shared RowModel from it."""
+    _check_model_style(model_style)
+    template = get_template(template_name, template_dir)
+    return template.generate(
+        tables=_normalize_tables(tables),
+        to_pascal=to_pascal,
+        base_module=base_module,
+        model_style=model_style,
     )
-    template = env.get_template(template_name)
-    return template.render(tables=_normalize_tables(tables), to_pascal=to_pascal)
+
+
+def stream_model_base(
+    template_dir: Path | None = None,
+    model_style: str = "pydantic",
+) -> Iterator[str]:
+    _check_model_style(model_style)
+    return get_template(MODEL_BASE_TEMPLATE, template_dir).generate(model_style=model_style)
@@ -1,18 +1,24 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 
-from dataclasses import dataclass
-from jinja2 import Environment, FileSystemLoader
+from dataclasses import dataclass, field
 
-from rosetta_bridge.codegen.renderer import to_pascal
+from rosetta_bridge.codegen.renderer import get_template, to_pascal
+
+
+REPO_BASE_TEMPLATE = "repo_base.py.j2"
+REPO_STYLES = ("sync", "async", "both")
 
 
 @dataclass(frozen=True)
 class RepoTableSpec:
     table_name: str
     column_names: list[str]
+    schema: str | None = None
+    table: str = ""
+    primary_key: list[str] = field(default_factory=list)
 
 
 def _normalize_tables(tables: Iterable[dict[str, Any]]) -> list[RepoTableSpec]:
@@ -24,24 +30,73 @@ def _normalize_tables(tables: Iterable[dict[str, Any]]) -> list[RepoTableSpec]:
             for column in columns
             if column.get("original_name")
         ]
+        schema, _, name = table["table_name"].rpartition(".")
         normalized.append(
-            RepoTableSpec(table_name=table["table_name"], column_names=column_names)
+            RepoTableSpec(
+                table_name=table["table_name"],
+                column_names=column_names,
+                schema=schema or None,
+                table=name,
+                primary_key=list(table.get("primary_key") or []),
+            )
         )
     return normalized
 
 
+def _style_context(repo_style: str) -> dict[str, Any]:
+    if repo_style not in REPO_STYLES:
+        raise ValueError(f"Unknown repository style: {repo_style}")
+    sync_repos = repo_style in ("sync", "both")
+    async_repos = repo_style in ("async", "both")
+    base_classes = []
+    if sync_repos:
+        base_classes.append("ReadOnlyRepository")
+    if async_repos:
+        base_classes.append("AsyncReadOnlyRepository")
+    return {"sync_repos": sync_repos, "async_repos": async_repos, "base_classes": base_classes}
+
+
+def repository_class_names(table_name: str, repo_style: str = "sync") -> list[str]:
+    context = _style_context(repo_style)
+    names = []
+    if context["sync_repos"]:
+        names.append(f"{to_pascal(table_name)}Repository")
+    if context["async_repos"]:
+        names.append(f"Async{to_pascal(table_name)}Repository")
+    return names
+
+
 def render_repositories(
     tables: Iterable[dict[str, Any]],
     template_dir: Path | None = None,
     template_name: str = "repos.py.j2",
+    base_module: str | None = None,
+    repo_style: str = "sync",
 ) -> str:
-    root_dir = Path(__file__).resolve().parents[3]
-    template_dir = template_dir or root_dir / "templates"
-    env = Environment(
-        loader=FileSystemLoader(str(template_dir)),
-        autoescape=False,
-        trim_blocks=True,
-        lstrip_blocks=True,
+    return "".join(
+        stream_repositories(tables, template_dir, template_name, base_module, repo_style)
     )
-    template = env.get_template(template_name)
-    return template.render(tables=_normalize_tables(tables), to_pascal=to_pascal)
+
+
+def stream_repositories(
+    tables: Iterable[dict[str, Any]],
+    template_dir: Path | None = None,
+    template_name: str = "repos.py.j2",
+    base_module: str | None = None,
+    repo_style: str = "sync",
+) -> Iterator[str]:
+    """Render repository classes; with base_module they import the shared base from it."""
+    template = get_template(template_name, template_dir)
+    return template.generate(
+        tables=_normalize_tables(tables),
+        to_pascal=to_pascal,
+        base_module=base_module,
+        **_style_context(repo_style),
+    )
+
+
+def stream_repository_base(
+    template_dir: Path | None = None,
+    repo_style: str = "sync",
+) -> Iterator[str]:
+    return get_template(REPO_BASE_TEMPLATE, template_dir).generate(**_style_context(repo_style))
@@ -1,16 +1,62 @@
 from __future__ import annotations
 
+import hashlib
+import os
 from pathlib import Path
+import stat
 import subprocess
+import tempfile
+from typing import Callable, Iterable
+
+
+_DEFAULT_MODE = 0o644
+
+
+def write_chunks(
+    target_path: Path,
+    chunks: Iterable[str],
+    should_replace: Callable[[str], bool] | None = None,
+) -> Path:
+    """Write text chunks to a temp file beside target_path, then rename it into place.
+
+    should_replace receives the sha256 of the new content; returning False keeps the
+    existing file untouched.
+    """
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(target_path.stat().st_mode)
+    except FileNotFoundError:
+        mode = _DEFAULT_MODE
+    fd, temp_name = tempfile.mkstemp(
+        dir=target_path.parent,
+        prefix=f".{target_path.name}.",
+        suffix=".tmp",
+    )
+    try:
+        digest = hashlib.sha256()
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            for chunk in chunks:
+                handle.write(chunk)
+                if should_replace is not None:
+                    digest.update(chunk.encode("utf-8"))
+        if should_replace is not None and not should_replace(digest.hexdigest()):
+            Path(temp_name).unlink()
+            return target_path
+        os.chmod(temp_name, mode)
+        os.replace(temp_name, target_path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    return target_path
 
 
 def write_python_file(
     target_path: Path,
-    content: str,
+    content: str | Iterable[str],
     format_with_ruff: bool = False,
 ) -> Path:
-    target_path.parent.mkdir(parents=True, exist_ok=True)
-    target_path.write_text(content)
+    chunks = [content] if isinstance(content, str) else content
+    write_chunks(target_path, chunks)
 
     if format_with_ruff:
         subprocess.run(
@@ -1,6 +1,7 @@
 import os
 import re
 from pathlib import Path
+from typing import Literal
 
 import yaml
 from pydantic import BaseModel, Field
@@ -14,11 +15,36 @@ class DatabaseConfig(BaseModel):
 class LLMConfig(BaseModel):
     model: str = "gemini-3-flash-preview"
     temperature: float = 0.0
+    requests_per_minute: int = 60
+    tokens_per_minute: int = 1_000_000
+    max_retries: int = 5
+    timeout_seconds: float = 60.0
+    max_in_flight: int = 8
+    batch_token_budget: int = 0
 
 
 class PrivacyConfig(BaseModel):
     sample_rows: bool = False
     scrub_pii: bool = True
+    prompt_samples: int = 3
+    sample_row_budget: int = 1000
+    sample_byte_budget: int | None = 1_000_000
+    sample_method: Literal["first", "random", "tablesample"] = "first"
+    max_value_chars: int | None = 256
+
+
+class ProfilingConfig(BaseModel):
+    strategy: Literal["exact", "tablesample", "stats"] = "exact"
+    row_budget: int = 100_000
+    max_enum_values: int = 20
+    profiles_path: str = ".rosetta_cache/profiles.json"
+
+
+class CacheConfig(BaseModel):
+    enabled: bool = True
+    path: str = ".rosetta_cache/inference.sqlite"
+    ttl_seconds: int | None = 30 * 24 * 60 * 60
+    max_entries: int | None = 50_000
 
 
 class RosettaMap(BaseModel):
@@ -27,11 +53,20 @@ class RosettaMap(BaseModel):
     whitelist_tables: list[str] = Field(default_factory=list)
     llm_config: LLMConfig = Field(default_factory=LLMConfig)
     privacy: PrivacyConfig = Field(default_factory=PrivacyConfig)
+    profiling: ProfilingConfig = Field(default_factory=ProfilingConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
 
 
 class Settings(BaseSettings):
     database_url: str | None = Field(default=None, alias="DATABASE_URL")
     gemini_api_key: str | None = Field(default=None, alias="GEMINI_API_KEY")
+    engine_cache_size: int = Field(default=8, alias="ROSETTA_ENGINE_CACHE_SIZE")
+    engine_idle_seconds: float = Field(default=600.0, alias="ROSETTA_ENGINE_IDLE_SECONDS")
+    pool_size: int = Field(default=5, alias="ROSETTA_POOL_SIZE")
+    pool_max_overflow: int = Field(default=5, alias="ROSETTA_POOL_MAX_OVERFLOW")
+    pool_pre_ping: bool = Field(default=True, alias="ROSETTA_POOL_PRE_PING")
+    snapshot_ttl_seconds: float = Field(default=300.0, alias="ROSETTA_SNAPSHOT_TTL_SECONDS")
+    template_cache_dir: str | None = Field(default=None, alias="ROSETTA_TEMPLATE_CACHE_DIR")
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -77,6 +112,8 @@ def default_rosetta_map(project_name: str = "rosetta-bridge") -> RosettaMap:
         whitelist_tables=[],
         llm_config=LLMConfig(),
         privacy=PrivacyConfig(),
+        profiling=ProfilingConfig(),
+        cache=CacheConfig(),
     )
 
 
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from contextlib import closing
+import hashlib
+import json
+from pathlib import Path
+import sqlite3
+import time
+from typing import Any, Callable
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS inference_cache (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+def make_cache_key(model_name: str, system_prompt: str, user_prompt: str) -> str:
+    material = json.dumps([model_name, system_prompt, user_prompt], ensure_ascii=False)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class InferenceCache:
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: float | None = None,
+        max_entries: int | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._path = path
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.execute(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self._path, timeout=30)
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self._ttl_seconds is not None and now - created_at > self._ttl_seconds
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        now = self._clock()
+        with closing(self._connect()) as connection, connection:
+            row = connection.execute(
+                "SELECT payload, created_at FROM inference_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            payload, created_at = row
+            if self._is_expired(created_at, now):
+                connection.execute("DELETE FROM inference_cache WHERE key = ?", (key,))
+                return None
+            connection.execute(
+                "UPDATE inference_cache SET accessed_at = ? WHERE key = ?",
+                (now, key),
+            )
+        return json.loads(payload)
+
+    def set(self, key: str, model_name: str, value: dict[str, Any]) -> None:
+        now = self._clock()
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO inference_cache "
+                "(key, model, payload, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, model_name, json.dumps(value), now, now),
+            )
+
+    def prune(self, clear: bool = False) -> int:
+        now = self._clock()
+        with closing(self._connect()) as connection, connection:
+            if clear:
+                return connection.execute("DELETE FROM inference_cache").rowcount
+            removed = 0
+            if self._ttl_seconds is not None:
+                removed += connection.execute(
+                    "DELETE FROM inference_cache WHERE created_at < ?",
+                    (now - self._ttl_seconds,),
+                ).rowcount
+            if self._max_entries is not None:
+                removed += connection.execute(
+                    "DELETE FROM inference_cache WHERE key NOT IN ("
+                    "SELECT key FROM inference_cache ORDER BY accessed_at DESC LIMIT ?)",
+                    (self._max_entries,),
+                ).rowcount
+        return removed
+
+    def __len__(self) -> int:
+        with closing(self._connect()) as connection:
+            return connection.execute("SELECT COUNT(*) FROM inference_cache").fetchone()[0]
@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import random
+import threading
+from typing import Awaitable, Callable
+
 from google import genai
+from google.genai import errors as genai_errors
 
 from rosetta_bridge.core.config import Settings
+from rosetta_bridge.inference.ratelimit import RateLimiter, estimate_tokens
+
+
+AsyncTransport = Callable[[str, str], Awaitable[str]]
+
+_RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+_background_loop_instance: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = threading.Lock()
 
 
 class GeminiClient:
@@ -18,3 +32,92 @@ class GeminiClient:
             contents=table_context,
         )
         return response.text
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, (asyncio.TimeoutError, ConnectionError)):
+        return True
+    if isinstance(exc, genai_errors.APIError):
+        return exc.code in _RETRYABLE_STATUS_CODES
+    return False
+
+
+class AsyncGeminiClient:
+    def __init__(
+        self,
+        model_name: str = "gemini-3-flash-preview",
+        *,
+        requests_per_minute: int = 60,
+        tokens_per_minute: int = 1_000_000,
+        max_retries: int = 5,
+        timeout_seconds: float = 60.0,
+        max_in_flight: int = 8,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+        transport: AsyncTransport | None = None,
+    ) -> None:
+        if transport is None:
+            settings = Settings()
+            self._client = genai.Client(api_key=settings.gemini_api_key)
+            transport = self._genai_transport
+        self._transport = transport
+        self._model_name = model_name
+        self._limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._max_retries = max_retries
+        self._timeout_seconds = timeout_seconds
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+
+    async def _genai_transport(self, model_name: str, contents: str) -> str:
+        response = await self._client.aio.models.generate_content(
+            model=model_name,
+            contents=contents,
+        )
+        return response.text
+
+    def _backoff_delay(self, attempt: int) -> float:
+        ceiling = min(self._backoff_max, self._backoff_base * 2**attempt)
+        return random.uniform(0, ceiling)
+
+    async def agenerate_description(self, table_context: str) -> str:
+        tokens = estimate_tokens(table_context)
+        async with self._semaphore:
+            attempt = 0
+            while True:
+                await self._limiter.acquire(tokens)
+                try:
+                    return await asyncio.wait_for(
+                        self._transport(self._model_name, table_context),
+                        timeout=self._timeout_seconds,
+                    )
+                except Exception as exc:
+                    if attempt >= self._max_retries or not _is_retryable(exc):
+                        raise
+                await asyncio.sleep(self._backoff_delay(attempt))
+                attempt += 1
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _background_loop_instance
+    with _background_loop_lock:
+        if _background_loop_instance is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="gemini-client", daemon=True).start()
+            _background_loop_instance = loop
+        return _background_loop_instance
+
+
+class BlockingGeminiClient(AsyncGeminiClient):
+    """AsyncGeminiClient for synchronous callers such as the CLI's worker threads.
+
+    Every call runs on one background event loop, so retries, timeouts, the rate
+    limiter and the in-flight cap are shared by all calling threads.
+    """
+
+    def generate_description(self, table_context: str) -> str:
+        future = asyncio.run_coroutine_threadsafe(
+            self.agenerate_description(table_context),
+            _background_loop(),
+        )
+        return future.result()
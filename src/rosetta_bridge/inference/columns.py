@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from typing import Any
+
+from rosetta_bridge.analyzer.profile import TableProfile
+
+
+def map_python_type(type_name: str) -> str:
+    normalized = type_name.strip().lower()
+    if any(token in normalized for token in ["int", "bigint", "smallint"]):
+        return "int"
+    if any(token in normalized for token in ["bool"]):
+        return "bool"
+    if any(token in normalized for token in ["numeric", "decimal", "real", "float", "double"]):
+        return "float"
+    return "str"
+
+
+def build_prompt_columns(
+    profile: TableProfile,
+    sample_rows: bool = True,
+    scrub_pii: bool = True,
+) -> list[dict[str, Any]]:
+    """Columns as sent to Gemini, with samples dropped for PII columns when scrubbing."""
+    prompt_columns = []
+    for column in profile.columns:
+        samples = column.samples if sample_rows else []
+        prompt_columns.append(
+            {
+                "name": column.name,
+                "type": column.type,
+                "comment": column.comment,
+                "samples": [] if scrub_pii and column.pii else samples,
+                "pii": column.pii,
+            }
+        )
+    return prompt_columns
+
+
+def build_enriched_columns(profile: TableProfile) -> list[dict[str, Any]]:
+    """Columns as rendered before inference: original names, enum values as descriptions."""
+    enriched_columns = []
+    for column in profile.columns:
+        description = None
+        if column.enum_values:
+            description = f"Allowed values: {', '.join(map(str, column.enum_values))}"
+        enriched_columns.append(
+            {
+                "original_name": column.name,
+                "python_type": map_python_type(column.type),
+                "semantic_name": column.name,
+                "description": description,
+            }
+        )
+    return enriched_columns
+
+
+def apply_inference(
+    table: str,
+    enriched_columns: list[dict[str, Any]],
+    inferred: dict[str, dict[str, str]],
+) -> list[tuple[str, str, str]]:
+    """Merge Gemini's names and descriptions into enriched_columns and return audit rows."""
+    audit_rows: list[tuple[str, str, str]] = []
+    for column in enriched_columns:
+        name = column["original_name"]
+        inference = inferred.get(name, {})
+        semantic_name = inference.get("semantic_name") or name
+        description = inference.get("description") or column.get("description")
+        if column.get("description") and inference.get("description"):
+            description = f"{inference.get('description')} {column.get('description')}"
+        column["semantic_name"] = semantic_name
+        column["description"] = description
+
+        audit_value = semantic_name
+        if semantic_name != name:
+            audit_value = f"{semantic_name} (Inferred)"
+        audit_rows.append((table, name, audit_value))
+    return audit_rows
@@ -15,16 +15,30 @@ def get_system_prompt() -> str:
     )
 
 
-def build_user_prompt(
+def get_batch_system_prompt() -> str:
+    return (
+        "You are a Data Architect. Given several database tables and their columns, "
+        "infer business meaning, propose clear semantic names, and describe intent "
+        "for every column of every table. "
+        "Return STRICT JSON only, keyed by the exact table names given, with this shape:\n"
+        '{ "tables": { "<table>": { "columns": [ '
+        '{ "name": "...", "semantic_name": "...", "description": "..." } ] } } }'
+    )
+
+
+def build_table_payload(
     table_name: str,
     columns: list[dict[str, Any]],
     scrub_pii: bool = True,
     table_comment: str | None = None,
-) -> str:
+) -> dict[str, Any]:
     sanitized_columns = []
     for column in columns:
         samples = list(column.get("samples", []))
-        if scrub_pii and detect_pii(samples):
+        pii = column.get("pii")
+        if pii is None:
+            pii = detect_pii(samples)
+        if scrub_pii and pii:
             samples = []
         sanitized_columns.append(
             {
@@ -35,25 +49,39 @@ def build_user_prompt(
             }
         )
 
-    payload = {
+    return {
         "table": table_name,
         "table_comment": table_comment,
         "columns": sanitized_columns,
     }
 
+
+def build_user_prompt(
+    table_name: str,
+    columns: list[dict[str, Any]],
+    scrub_pii: bool = True,
+    table_comment: str | None = None,
+) -> str:
+    payload = build_table_payload(
+        table_name,
+        columns,
+        scrub_pii=scrub_pii,
+        table_comment=table_comment,
+    )
     return (
         "Use the following schema context to infer semantic names and descriptions.\n"
         + json.dumps(payload, indent=2, default=str)
     )
 
 
-def parse_gemini_response(response: str) -> dict[str, dict[str, str]]:
-    try:
-        payload = json.loads(response)
-    except json.JSONDecodeError:
-        return {}
+def build_batch_user_prompt(payloads: list[dict[str, Any]]) -> str:
+    return (
+        "Use the following schema context to infer semantic names and descriptions "
+        "for each table.\n" + json.dumps({"tables": payloads}, indent=2, default=str)
+    )
 
-    columns = payload.get("columns", [])
+
+def _parse_columns(columns: Any) -> dict[str, dict[str, str]]:
     if not isinstance(columns, list):
         return {}
 
@@ -73,3 +101,44 @@ def parse_gemini_response(response: str) -> dict[str, dict[str, str]]:
             if entry:
                 parsed[name] = entry
     return parsed
+
+
+def parse_gemini_response(response: str) -> dict[str, dict[str, str]]:
+    try:
+        payload = json.loads(response)
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    return _parse_columns(payload.get("columns", []))
+
+
+def parse_batch_gemini_response(
+    response: str,
+    table_names: list[str],
+) -> dict[str, dict[str, dict[str, str]]]:
+    try:
+        payload = json.loads(response)
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+
+    tables = payload.get("tables", {})
+    if isinstance(tables, list):
+        tables = {
+            entry.get("table"): entry
+            for entry in tables
+            if isinstance(entry, dict) and isinstance(entry.get("table"), str)
+        }
+    if not isinstance(tables, dict):
+        return {}
+
+    parsed: dict[str, dict[str, dict[str, str]]] = {}
+    for table_name in table_names:
+        entry = tables.get(table_name)
+        if isinstance(entry, dict):
+            columns = _parse_columns(entry.get("columns", []))
+            if columns:
+                parsed[table_name] = columns
+    return parsed
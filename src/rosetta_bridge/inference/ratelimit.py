@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        per_minute: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if per_minute <= 0:
+            raise ValueError("per_minute must be positive")
+        self._capacity = float(per_minute)
+        self._refill_per_second = per_minute / 60.0
+        self._tokens = self._capacity
+        self._clock = clock
+        self._updated_at = clock()
+        self._lock = asyncio.Lock()
+
+    @property
+    def capacity(self) -> float:
+        return self._capacity
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated_at)
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._refill_per_second)
+        self._updated_at = now
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        amount = min(float(amount), self._capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                await asyncio.sleep((amount - self._tokens) / self._refill_per_second)
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._requests = TokenBucket(requests_per_minute, clock=clock)
+        self._tokens = TokenBucket(tokens_per_minute, clock=clock)
+
+    async def acquire(self, tokens: int) -> None:
+        await self._requests.acquire(1)
+        await self._tokens.acquire(tokens)
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
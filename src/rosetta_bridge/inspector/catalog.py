@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+
+SYSTEM_SCHEMAS = ("information_schema", "pg_catalog", "pg_toast")
+
+
+@dataclass(frozen=True)
+class TableSummary:
+    schema: str | None
+    table: str
+    column_count: int
+    row_estimate: int | None = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.schema}.{self.table}" if self.schema else self.table
+
+
+_PG_TABLES_SQL = r"""
+SELECT n.nspname AS schema_name, c.relname AS table_name,
+       count(a.attnum) AS column_count, c.reltuples AS row_estimate
+FROM pg_catalog.pg_class c
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+LEFT JOIN pg_catalog.pg_attribute a
+  ON a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped
+WHERE c.relkind IN ('r', 'p', 'v', 'm', 'f')
+  AND NOT c.relispartition
+  AND n.nspname <> ALL(:system_schemas)
+  AND n.nspname NOT LIKE 'pg\_temp\_%'
+  AND (CAST(:schema AS text) IS NULL OR n.nspname = CAST(:schema AS text))
+  AND lower(c.relname) LIKE :pattern
+GROUP BY n.nspname, c.relname, c.reltuples
+HAVING count(a.attnum) >= :min_columns
+"""
+
+
+def _like_prefix(prefix: str | None) -> str:
+    if not prefix:
+        return "%"
+    escaped = prefix.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+def _tables_from_pg_catalog(
+    engine: Engine,
+    schema: str | None,
+    prefix: str | None,
+    min_columns: int,
+) -> list[TableSummary]:
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text(_PG_TABLES_SQL),
+            {
+                "system_schemas": list(SYSTEM_SCHEMAS),
+                "schema": schema,
+                "pattern": _like_prefix(prefix),
+                "min_columns": min_columns,
+            },
+        ).mappings()
+        return [
+            TableSummary(
+                schema=row["schema_name"],
+                table=row["table_name"],
+                column_count=int(row["column_count"]),
+                row_estimate=int(row["row_estimate"]) if row["row_estimate"] >= 0 else None,
+            )
+            for row in rows
+        ]
+
+
+def _tables_from_inspector(
+    engine: Engine,
+    schema: str | None,
+    prefix: str | None,
+    min_columns: int,
+) -> list[TableSummary]:
+    inspector = inspect(engine)
+    if schema is None:
+        schemas = [name for name in inspector.get_schema_names() if name not in SYSTEM_SCHEMAS]
+    else:
+        schemas = [schema]
+
+    lowered = (prefix or "").lower()
+    summaries: list[TableSummary] = []
+    for name in schemas:
+        for (_, table), columns in inspector.get_multi_columns(schema=name).items():
+            if not table.lower().startswith(lowered) or len(columns) < min_columns:
+                continue
+            summaries.append(TableSummary(schema=name, table=table, column_count=len(columns)))
+    return summaries
+
+
+def list_tables(
+    engine: Engine,
+    schema: str | None = None,
+    prefix: str | None = None,
+    min_columns: int = 0,
+) -> list[TableSummary]:
+    summaries: list[TableSummary] | None = None
+    if engine.dialect.name == "postgresql":
+        try:
+            summaries = _tables_from_pg_catalog(engine, schema, prefix, min_columns)
+        except SQLAlchemyError:
+            summaries = None
+    if summaries is None:
+        summaries = _tables_from_inspector(engine, schema, prefix, min_columns)
+    summaries.sort(key=lambda item: (-item.column_count, item.name))
+    return summaries
@@ -1,16 +1,34 @@
 from __future__ import annotations
 
-from typing import Any
+from collections import OrderedDict
+from dataclasses import dataclass
+import hashlib
+import threading
+import time
+from typing import Any, Callable
 
-from sqlalchemy import create_engine, inspect
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
 
 from rosetta_bridge.core.config import Settings
 
 
+_POOL_SIZING_OPTIONS = ("pool_size", "max_overflow")
+
+
+def _supports_pool_sizing(connection_string: str, engine_options: dict[str, Any]) -> bool:
+    pool_class = engine_options.get("poolclass")
+    if pool_class is None:
+        url = make_url(connection_string)
+        pool_class = url.get_dialect().get_pool_class(url)
+    return issubclass(pool_class, QueuePool)
+
+
 def get_engine(
     connection_string: str | None = None,
     settings: Settings | None = None,
+    **engine_options: Any,
 ) -> Engine:
     if connection_string is None:
         settings = settings or Settings()
@@ -19,7 +37,174 @@ def get_engine(
     if not connection_string:
         raise ValueError("DATABASE_URL must be set to connect to the database")
 
-    return create_engine(connection_string)
+    # In-memory SQLite uses SingletonThreadPool/StaticPool, which reject pool sizing.
+    if not _supports_pool_sizing(connection_string, engine_options):
+        for option in _POOL_SIZING_OPTIONS:
+            engine_options.pop(option, None)
+    return create_engine(connection_string, **engine_options)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    url: str
+    checkouts: int
+    checkins: int
+    connects: int
+    checked_out: int
+    idle_seconds: float
+
+
+@dataclass
+class _RegistryEntry:
+    engine: Engine
+    last_used: float
+    checkouts: int = 0
+    checkins: int = 0
+    connects: int = 0
+
+
+class EngineRegistry:
+    """Process-wide LRU of engines keyed by connection string."""
+
+    def __init__(
+        self,
+        max_engines: int = 8,
+        idle_seconds: float | None = 600.0,
+        pool_size: int = 5,
+        max_overflow: int = 5,
+        pool_pre_ping: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_engines < 1:
+            raise ValueError("max_engines must be at least 1")
+        self._max_engines = max_engines
+        self._idle_seconds = idle_seconds
+        self._pool_size = pool_size
+        self._max_overflow = max_overflow
+        self._pool_pre_ping = pool_pre_ping
+        self._clock = clock
+        self._entries: OrderedDict[str, _RegistryEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        # Pool events fire on whichever thread checks a connection in or out.
+        self._counts_lock = threading.Lock()
+
+    def _engine_options(self) -> dict[str, Any]:
+        return {
+            "pool_pre_ping": self._pool_pre_ping,
+            "pool_size": self._pool_size,
+            "max_overflow": self._max_overflow,
+        }
+
+    def _create_entry(self, connection_string: str, now: float) -> _RegistryEntry:
+        engine = get_engine(connection_string, **self._engine_options())
+        entry = _RegistryEntry(engine=engine, last_used=now)
+
+        def on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+            with self._counts_lock:
+                entry.connects += 1
+
+        def on_checkout(dbapi_connection: Any, connection_record: Any, proxy: Any) -> None:
+            with self._counts_lock:
+                entry.checkouts += 1
+
+        def on_checkin(dbapi_connection: Any, connection_record: Any) -> None:
+            with self._counts_lock:
+                entry.checkins += 1
+
+        event.listen(engine, "connect", on_connect)
+        event.listen(engine, "checkout", on_checkout)
+        event.listen(engine, "checkin", on_checkin)
+        return entry
+
+    def get(self, connection_string: str) -> Engine:
+        if not connection_string:
+            raise ValueError("DATABASE_URL must be set to connect to the database")
+        with self._lock:
+            now = self._clock()
+            evicted = self._pop_idle(now)
+            entry = self._entries.get(connection_string)
+            if entry is None:
+                entry = self._create_entry(connection_string, now)
+                self._entries[connection_string] = entry
+                while len(self._entries) > self._max_engines:
+                    _, oldest = self._entries.popitem(last=False)
+                    evicted.append(oldest)
+            else:
+                self._entries.move_to_end(connection_string)
+            entry.last_used = now
+        for stale in evicted:
+            stale.engine.dispose()
+        return entry.engine
+
+    def _pop_idle(self, now: float) -> list[_RegistryEntry]:
+        if self._idle_seconds is None:
+            return []
+        idle = [
+            key
+            for key, entry in self._entries.items()
+            if now - entry.last_used > self._idle_seconds
+            and entry.checkouts == entry.checkins
+        ]
+        return [self._entries.pop(key) for key in idle]
+
+    def dispose_idle(self) -> int:
+        with self._lock:
+            evicted = self._pop_idle(self._clock())
+        for entry in evicted:
+            entry.engine.dispose()
+        return len(evicted)
+
+    def dispose_all(self) -> None:
+        with self._lock:
+            evicted = list(self._entries.values())
+            self._entries.clear()
+        for entry in evicted:
+            entry.engine.dispose()
+
+    def stats(self) -> list[PoolStats]:
+        with self._lock:
+            now = self._clock()
+            return [
+                PoolStats(
+                    url=make_url(key).render_as_string(hide_password=True),
+                    checkouts=entry.checkouts,
+                    checkins=entry.checkins,
+                    connects=entry.connects,
+                    checked_out=entry.checkouts - entry.checkins,
+                    idle_seconds=now - entry.last_used,
+                )
+                for key, entry in self._entries.items()
+            ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_registry: EngineRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def engine_registry(settings: Settings | None = None) -> EngineRegistry:
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            settings = settings or Settings()
+            _registry = EngineRegistry(
+                max_engines=settings.engine_cache_size,
+                idle_seconds=settings.engine_idle_seconds,
+                pool_size=settings.pool_size,
+                max_overflow=settings.pool_max_overflow,
+                pool_pre_ping=settings.pool_pre_ping,
+            )
+        return _registry
+
+
+def get_cached_engine(connection_string: str) -> Engine:
+    return engine_registry().get(connection_string)
+
+
+def connection_fingerprint(connection_string: str) -> str:
+    return hashlib.sha256(connection_string.encode("utf-8")).hexdigest()
 
 
 def inspect_schema(table_name: str, engine: Engine) -> list[dict[str, Any]]:
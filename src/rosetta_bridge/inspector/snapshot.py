@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import threading
+import time
+from typing import Any, Callable, Iterable
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.reflection import ObjectKind
+from sqlalchemy.exc import NoSuchTableError, SQLAlchemyError
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    table_name: str
+    columns: list[dict[str, Any]]
+    comment: str | None = None
+    primary_key: list[str] = field(default_factory=list)
+    foreign_keys: list[dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class SchemaSnapshot:
+    tables: dict[str, TableSchema] = field(default_factory=dict)
+
+    def __contains__(self, table_name: str) -> bool:
+        return table_name in self.tables
+
+    def table(self, table_name: str) -> TableSchema:
+        try:
+            return self.tables[table_name]
+        except KeyError:
+            raise NoSuchTableError(table_name) from None
+
+    def columns(self, table_name: str) -> list[dict[str, Any]]:
+        return self.table(table_name).columns
+
+    def comment(self, table_name: str) -> str | None:
+        return self.table(table_name).comment
+
+
+def _split_table_name(table_name: str) -> tuple[str | None, str]:
+    if "." in table_name:
+        schema, table = table_name.split(".", 1)
+        return schema, table
+    return None, table_name
+
+
+_PG_RELATIONS_SQL = """
+SELECT c.oid AS oid, n.nspname AS schema_name, c.relname AS table_name,
+       obj_description(c.oid, 'pg_class') AS comment
+FROM pg_catalog.pg_class c
+JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+WHERE c.relkind IN ('r', 'p', 'v', 'm', 'f')
+  AND n.nspname = ANY(:schemas)
+  AND c.relname = ANY(:names)
+"""
+
+_PG_COLUMNS_SQL = """
+SELECT a.attrelid AS oid, a.attname AS name,
+       format_type(a.atttypid, a.atttypmod) AS type,
+       NOT a.attnotnull AS nullable,
+       col_description(a.attrelid, a.attnum) AS comment
+FROM pg_catalog.pg_attribute a
+WHERE a.attrelid = ANY(CAST(:oids AS oid[]))
+  AND a.attnum > 0
+  AND NOT a.attisdropped
+ORDER BY a.attrelid, a.attnum
+"""
+
+_PG_CONSTRAINTS_SQL = """
+SELECT con.conrelid AS oid, con.contype AS kind, con.conname AS name,
+       ARRAY(
+           SELECT a.attname
+           FROM unnest(con.conkey) WITH ORDINALITY AS k(attnum, ord)
+           JOIN pg_catalog.pg_attribute a
+             ON a.attrelid = con.conrelid AND a.attnum = k.attnum
+           ORDER BY k.ord
+       ) AS constrained_columns,
+       rn.nspname AS referred_schema,
+       rc.relname AS referred_table,
+       ARRAY(
+           SELECT a.attname
+           FROM unnest(con.confkey) WITH ORDINALITY AS k(attnum, ord)
+           JOIN pg_catalog.pg_attribute a
+             ON a.attrelid = con.confrelid AND a.attnum = k.attnum
+           ORDER BY k.ord
+       ) AS referred_columns
+FROM pg_catalog.pg_constraint con
+LEFT JOIN pg_catalog.pg_class rc ON rc.oid = con.confrelid
+LEFT JOIN pg_catalog.pg_namespace rn ON rn.oid = rc.relnamespace
+WHERE con.conrelid = ANY(CAST(:oids AS oid[]))
+  AND con.contype IN ('p', 'f')
+ORDER BY con.conrelid, con.conname
+"""
+
+
+def _snapshot_from_pg_catalog(engine: Engine, table_names: list[str]) -> SchemaSnapshot:
+    with engine.connect() as connection:
+        default_schema = connection.execute(text("SELECT current_schema()")).scalar_one()
+        wanted: dict[tuple[str, str], str] = {}
+        for table_name in table_names:
+            schema, table = _split_table_name(table_name)
+            wanted[(schema or default_schema, table)] = table_name
+
+        relations = connection.execute(
+            text(_PG_RELATIONS_SQL),
+            {
+                "schemas": sorted({schema for schema, _ in wanted}),
+                "names": sorted({table for _, table in wanted}),
+            },
+        ).mappings()
+
+        names_by_oid: dict[int, str] = {}
+        comments: dict[str, str | None] = {}
+        for row in relations:
+            table_name = wanted.get((row["schema_name"], row["table_name"]))
+            if table_name is None:
+                continue
+            names_by_oid[row["oid"]] = table_name
+            comments[table_name] = row["comment"]
+
+        columns: dict[str, list[dict[str, Any]]] = {name: [] for name in comments}
+        primary_keys: dict[str, list[str]] = {}
+        foreign_keys: dict[str, list[dict[str, Any]]] = {}
+        if names_by_oid:
+            oids = list(names_by_oid)
+            for row in connection.execute(text(_PG_COLUMNS_SQL), {"oids": oids}).mappings():
+                columns[names_by_oid[row["oid"]]].append(
+                    {
+                        "name": row["name"],
+                        "type": row["type"],
+                        "nullable": row["nullable"],
+                        "comment": row["comment"],
+                    }
+                )
+            for row in connection.execute(text(_PG_CONSTRAINTS_SQL), {"oids": oids}).mappings():
+                table_name = names_by_oid[row["oid"]]
+                if row["kind"] == "p":
+                    primary_keys[table_name] = list(row["constrained_columns"])
+                    continue
+                foreign_keys.setdefault(table_name, []).append(
+                    {
+                        "name": row["name"],
+                        "constrained_columns": list(row["constrained_columns"]),
+                        "referred_schema": row["referred_schema"],
+                        "referred_table": row["referred_table"],
+                        "referred_columns": list(row["referred_columns"]),
+                    }
+                )
+
+    return SchemaSnapshot(
+        tables={
+            table_name: TableSchema(
+                table_name=table_name,
+                columns=columns[table_name],
+                comment=comments[table_name],
+                primary_key=primary_keys.get(table_name, []),
+                foreign_keys=foreign_keys.get(table_name, []),
+            )
+            for table_name in table_names
+            if table_name in comments
+        }
+    )
+
+
+def _snapshot_from_inspector(engine: Engine, table_names: list[str]) -> SchemaSnapshot:
+    inspector = inspect(engine)
+    by_schema: dict[str | None, dict[str, str]] = {}
+    for table_name in table_names:
+        schema, table = _split_table_name(table_name)
+        by_schema.setdefault(schema, {})[table] = table_name
+
+    tables: dict[str, TableSchema] = {}
+    for schema, names in by_schema.items():
+        # ObjectKind.ANY keeps views and materialized views, like the pg_catalog path.
+        options = {"schema": schema, "filter_names": list(names), "kind": ObjectKind.ANY}
+        columns = inspector.get_multi_columns(**options)
+        primary_keys = inspector.get_multi_pk_constraint(**options)
+        foreign_keys = inspector.get_multi_foreign_keys(**options)
+        try:
+            comments = inspector.get_multi_table_comment(**options)
+        except NotImplementedError:
+            comments = {}
+
+        for table, table_name in names.items():
+            key = (schema, table)
+            if key not in columns:
+                continue
+            comment = comments.get(key)
+            tables[table_name] = TableSchema(
+                table_name=table_name,
+                columns=columns[key],
+                comment=comment.get("text") if isinstance(comment, dict) else None,
+                primary_key=list(
+                    (primary_keys.get(key) or {}).get("constrained_columns") or []
+                ),
+                foreign_keys=list(foreign_keys.get(key) or []),
+            )
+
+    return SchemaSnapshot(tables={name: tables[name] for name in table_names if name in tables})
+
+
+def build_schema_snapshot(engine: Engine, table_names: Iterable[str]) -> SchemaSnapshot:
+    names = list(dict.fromkeys(table_names))
+    if not names:
+        return SchemaSnapshot()
+    if engine.dialect.name == "postgresql":
+        try:
+            return _snapshot_from_pg_catalog(engine, names)
+        except SQLAlchemyError:
+            pass
+    return _snapshot_from_inspector(engine, names)
+
+
+@dataclass
+class _CachedSnapshot:
+    snapshot: SchemaSnapshot
+    reflected: set[str]
+    created_at: float
+
+
+class SnapshotCache:
+    """Schema snapshots keyed by connection fingerprint, filled in table by table."""
+
+    def __init__(
+        self,
+        ttl_seconds: float | None = 300.0,
+        max_entries: int = 32,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: dict[str, _CachedSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def _live_entry(self, key: str, now: float) -> _CachedSnapshot:
+        entry = self._entries.get(key)
+        if entry is not None and (
+            self._ttl_seconds is None or now - entry.created_at <= self._ttl_seconds
+        ):
+            return entry
+        entry = _CachedSnapshot(snapshot=SchemaSnapshot(), reflected=set(), created_at=now)
+        self._entries.pop(key, None)
+        self._entries[key] = entry
+        while len(self._entries) > self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        return entry
+
+    def get(
+        self,
+        key: str,
+        table_names: Iterable[str],
+        load: Callable[[list[str]], SchemaSnapshot],
+    ) -> SchemaSnapshot:
+        names = list(dict.fromkeys(table_names))
+        with self._lock:
+            entry = self._live_entry(key, self._clock())
+            missing = [name for name in names if name not in entry.reflected]
+        if missing:
+            loaded = load(missing)
+            with self._lock:
+                entry.snapshot.tables.update(loaded.tables)
+                entry.reflected.update(missing)
+        tables = entry.snapshot.tables
+        return SchemaSnapshot(tables={name: tables[name] for name in names if name in tables})
+
+    def invalidate(self, key: str | None = None) -> int:
+        with self._lock:
+            if key is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            return 1 if self._entries.pop(key, None) is not None else 0
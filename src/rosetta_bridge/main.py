@@ -1,26 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 import json
+from typing import Any
 
 import typer
+from sqlalchemy.engine import Engine
 
 from rosetta_bridge import __version__
-from rosetta_bridge.analyzer.enums import detect_enum_values
-from rosetta_bridge.analyzer.sampler import detect_pii, fetch_sample_rows
+from rosetta_bridge.analyzer.profile import (
+    ProfileStore,
+    TableProfile,
+    profile_table,
+    resample_profile,
+)
 from rosetta_bridge.codegen.audit import render_audit_log
+from rosetta_bridge.codegen.formatter import FormatStage
 from rosetta_bridge.codegen.functions import render_function_schemas
-from rosetta_bridge.codegen.renderer import render_models
-from rosetta_bridge.codegen.repos import render_repositories
-from rosetta_bridge.codegen.writer import write_python_file
-from rosetta_bridge.core.config import load_rosetta_map, write_default_rosetta_map
-from rosetta_bridge.inference.client import GeminiClient
+from rosetta_bridge.codegen.layout import (
+    LAYOUTS,
+    iter_layout,
+    layout_paths,
+    remove_empty_packages,
+    stale_generated_files,
+)
+from rosetta_bridge.codegen.manifest import (
+    load_generated_files,
+    load_manifest,
+    schema_fingerprint,
+    settings_fingerprint,
+    table_fingerprint,
+    write_manifest,
+)
+from rosetta_bridge.codegen.renderer import MODEL_STYLES
+from rosetta_bridge.codegen.repos import REPO_STYLES
+from rosetta_bridge.codegen.writer import write_chunks, write_python_file
+from rosetta_bridge.core.config import (
+    CacheConfig,
+    RosettaMap,
+    load_rosetta_map,
+    write_default_rosetta_map,
+)
+from rosetta_bridge.inference.cache import InferenceCache, make_cache_key
+from rosetta_bridge.inference.client import BlockingGeminiClient
+from rosetta_bridge.inference.columns import (
+    apply_inference,
+    build_enriched_columns,
+    build_prompt_columns,
+)
 from rosetta_bridge.inference.prompts import (
+    build_batch_user_prompt,
+    build_table_payload,
     build_user_prompt,
+    get_batch_system_prompt,
     get_system_prompt,
+    parse_batch_gemini_response,
     parse_gemini_response,
 )
-from rosetta_bridge.inspector.db import get_engine, get_table_comment, inspect_schema
+from rosetta_bridge.inference.ratelimit import estimate_tokens
+from rosetta_bridge.inspector.db import get_engine
+from rosetta_bridge.inspector.snapshot import SchemaSnapshot, build_schema_snapshot
 
 app = typer.Typer(add_completion=False)
+cache_app = typer.Typer(help="Manage the on-disk inference cache.")
+app.add_typer(cache_app, name="cache")
 
 
 @app.callback()
@@ -64,46 +108,371 @@ def inspect(
     tables = rosetta_map.whitelist_tables
     typer.echo(f"Found {len(tables)} tables in whitelist.")
 
+    snapshot = build_schema_snapshot(engine, tables)
+    profiles_path = Path(rosetta_map.profiling.profiles_path)
+    profiles_hash = _profiles_fingerprint(rosetta_map)
+    profiles = ProfileStore.load(profiles_path, profiles_hash)
     for table in tables:
-        columns = inspect_schema(table, engine)
+        columns = snapshot.columns(table)
         typer.echo(f"[!] Table {table} has {len(columns)} columns.")
 
-        sample_rows = []
-        if rosetta_map.privacy.sample_rows:
-            sample_rows = fetch_sample_rows(engine, table, limit=3)
-
-        samples_by_column: dict[str, list[object]] = {}
-        for row in sample_rows:
-            for name, value in row.items():
-                samples_by_column.setdefault(name, []).append(value)
-
-        enum_count = 0
-        pii_count = 0
-        for column in columns:
-            name = column.get("name")
-            column_type = str(column.get("type", "")).lower()
-            if name and detect_enum_values(engine, table, name, column_type):
-                enum_count += 1
-            if name:
-                values = samples_by_column.get(name, [])
-                if values and detect_pii(values):
-                    pii_count += 1
+        profile = _table_profile(
+            engine,
+            snapshot,
+            table,
+            rosetta_map,
+            profiles,
+            reuse=False,
+        )
+        enum_count = len(profile.enum_values)
+        pii_count = len(profile.pii_columns)
+
+        if profile.sample_rows:
+            typer.echo(
+                f"[i] Sampled {profile.sample_rows} rows ({profile.sample_bytes} bytes) "
+                f"from {table}."
+            )
+        if profile.skipped_columns:
+            skipped = ", ".join(profile.skipped_columns)
+            typer.echo(f"[i] Skipped binary columns in {table}: {skipped}.")
 
         if enum_count:
             typer.echo(f"[i] Detected {enum_count} potential Enums in {table}.")
         if pii_count:
             typer.echo(f"[i] Detected {pii_count} potential PII columns in {table}.")
+    profiles.save(profiles_path, profiles_hash, keep_samples=not rosetta_map.privacy.scrub_pii)
+
+
+def _profiles_fingerprint(rosetta_map: RosettaMap) -> str:
+    return settings_fingerprint(
+        profiling=rosetta_map.profiling.model_dump(exclude={"profiles_path"}),
+        sampling=rosetta_map.privacy.model_dump(exclude={"sample_rows"}),
+    )
+
+
+def _table_profile(
+    engine: Engine,
+    snapshot: SchemaSnapshot,
+    table: str,
+    rosetta_map: RosettaMap,
+    profiles: ProfileStore,
+    reuse: bool = True,
+) -> TableProfile:
+    table_schema = snapshot.table(table)
+    schema_hash = schema_fingerprint(table_schema)
+    sample_rows = rosetta_map.privacy.sample_rows
+    profile = profiles.get(table, schema_hash) if reuse else None
+    if profile is not None and sample_rows and not profile.sampled:
+        if profile.sample_rows:
+            # Saved without its samples (scrub_pii): its enum values and PII flags
+            # still hold, so only the prompt samples are fetched again.
+            profile = resample_profile(
+                engine,
+                table_schema,
+                profile,
+                sample_limit=rosetta_map.privacy.prompt_samples,
+                sample_byte_budget=rosetta_map.privacy.sample_byte_budget,
+                sample_method=rosetta_map.privacy.sample_method,
+                max_value_chars=rosetta_map.privacy.max_value_chars,
+            )
+            profiles.put(profile)
+        else:
+            profile = None
+    if profile is None:
+        profile = profile_table(
+            engine,
+            table_schema,
+            schema_hash=schema_hash,
+            sample_rows=sample_rows,
+            sample_limit=rosetta_map.privacy.prompt_samples,
+            strategy=rosetta_map.profiling.strategy,
+            row_budget=rosetta_map.profiling.row_budget,
+            max_values=rosetta_map.profiling.max_enum_values,
+            sample_row_budget=rosetta_map.privacy.sample_row_budget,
+            sample_byte_budget=rosetta_map.privacy.sample_byte_budget,
+            sample_method=rosetta_map.privacy.sample_method,
+            max_value_chars=rosetta_map.privacy.max_value_chars,
+        )
+        profiles.put(profile)
+    return profile
+
+
+@dataclass(frozen=True)
+class _GeneratedTable:
+    rendered_table: dict[str, Any]
+    audit_rows: list[tuple[str, str, str]]
+    enum_profile: tuple[str, str, float]
+    schema_hash: str = ""
+    fingerprint: str = ""
+    reused: bool = False
+    # False when Gemini returned nothing usable; such tables are retried next run.
+    inferred: bool = True
+
+    def to_manifest_entry(self) -> dict[str, Any]:
+        return {
+            "schema_hash": self.schema_hash,
+            "fingerprint": self.fingerprint,
+            "rendered_table": self.rendered_table,
+            "audit_rows": [list(row) for row in self.audit_rows],
+            "enum_profile": list(self.enum_profile),
+        }
+
+    @classmethod
+    def from_manifest_entry(cls, entry: dict[str, Any]) -> "_GeneratedTable":
+        return cls(
+            rendered_table=entry["rendered_table"],
+            audit_rows=[tuple(row) for row in entry["audit_rows"]],
+            enum_profile=tuple(entry["enum_profile"]),
+            schema_hash=entry["schema_hash"],
+            fingerprint=entry["fingerprint"],
+            reused=True,
+        )
 
 
-def _map_python_type(type_name: str) -> str:
-    normalized = type_name.strip().lower()
-    if any(token in normalized for token in ["int", "bigint", "smallint"]):
-        return "int"
-    if any(token in normalized for token in ["bool"]):
-        return "bool"
-    if any(token in normalized for token in ["numeric", "decimal", "real", "float", "double"]):
-        return "float"
-    return "str"
+@dataclass(frozen=True)
+class _PreparedTable:
+    table: str
+    enriched_columns: list[dict[str, Any]]
+    payload: dict[str, Any]
+    user_prompt: str
+    enum_profile: tuple[str, str, float]
+    schema_hash: str
+    fingerprint: str
+    primary_key: list[str] = field(default_factory=list)
+
+
+def _prepare_table(
+    table: str,
+    engine: Engine,
+    snapshot: SchemaSnapshot,
+    rosetta_map: RosettaMap,
+    previous: dict[str, dict[str, Any]] | None = None,
+    check_enums: bool = False,
+    profiles: ProfileStore | None = None,
+) -> _GeneratedTable | _PreparedTable:
+    table_schema = snapshot.table(table)
+    table_comment = table_schema.comment
+    schema_hash = schema_fingerprint(table_schema)
+    previous_entry = (previous or {}).get(table)
+    if previous_entry and previous_entry.get("schema_hash") == schema_hash and not check_enums:
+        return _GeneratedTable.from_manifest_entry(previous_entry)
+
+    profile = _table_profile(
+        engine,
+        snapshot,
+        table,
+        rosetta_map,
+        profiles if profiles is not None else ProfileStore(),
+        reuse=not check_enums,
+    )
+    fingerprint = table_fingerprint(schema_hash, profile.enum_values)
+    if previous_entry and previous_entry.get("fingerprint") == fingerprint:
+        return _GeneratedTable.from_manifest_entry(previous_entry)
+
+    prompt_columns = build_prompt_columns(
+        profile,
+        sample_rows=rosetta_map.privacy.sample_rows,
+        scrub_pii=rosetta_map.privacy.scrub_pii,
+    )
+
+    return _PreparedTable(
+        table=table,
+        enriched_columns=build_enriched_columns(profile),
+        payload=build_table_payload(
+            table,
+            prompt_columns,
+            scrub_pii=rosetta_map.privacy.scrub_pii,
+            table_comment=table_comment,
+        ),
+        user_prompt=build_user_prompt(
+            table,
+            prompt_columns,
+            scrub_pii=rosetta_map.privacy.scrub_pii,
+            table_comment=table_comment,
+        ),
+        enum_profile=(table, profile.enum_strategy, profile.enum_confidence),
+        schema_hash=schema_hash,
+        fingerprint=fingerprint,
+        primary_key=list(table_schema.primary_key),
+    )
+
+
+def _infer_table(
+    prepared: _PreparedTable,
+    gemini: BlockingGeminiClient,
+    model_name: str,
+    system_prompt: str,
+    cache: InferenceCache | None = None,
+) -> dict[str, dict[str, str]]:
+    cache_key = make_cache_key(model_name, system_prompt, prepared.user_prompt)
+    inferred = cache.get(cache_key) if cache is not None else None
+    if inferred is None:
+        gemini_response = gemini.generate_description(
+            f"{system_prompt}\n\n{prepared.user_prompt}"
+        )
+        inferred = parse_gemini_response(gemini_response)
+        if cache is not None and inferred:
+            cache.set(cache_key, model_name, inferred)
+    return inferred
+
+
+def _infer_batch(
+    batch: list[_PreparedTable],
+    gemini: BlockingGeminiClient,
+    model_name: str,
+    system_prompt: str,
+    cache: InferenceCache | None = None,
+) -> list[dict[str, dict[str, str]]]:
+    if len(batch) == 1:
+        return [_infer_table(batch[0], gemini, model_name, system_prompt, cache)]
+
+    batch_prompt = build_batch_user_prompt([prepared.payload for prepared in batch])
+    gemini_response = gemini.generate_description(
+        f"{get_batch_system_prompt()}\n\n{batch_prompt}"
+    )
+    parsed = parse_batch_gemini_response(
+        gemini_response, [prepared.table for prepared in batch]
+    )
+
+    results = []
+    for prepared in batch:
+        inferred = parsed.get(prepared.table)
+        if inferred is None:
+            inferred = _infer_table(prepared, gemini, model_name, system_prompt, cache)
+        elif cache is not None:
+            cache_key = make_cache_key(model_name, system_prompt, prepared.user_prompt)
+            cache.set(cache_key, model_name, inferred)
+        results.append(inferred)
+    return results
+
+
+def _pack_batches(
+    pending: list[_PreparedTable],
+    token_budget: int,
+) -> list[list[_PreparedTable]]:
+    batches: list[list[_PreparedTable]] = []
+    current: list[_PreparedTable] = []
+    current_tokens = 0
+    for prepared in pending:
+        tokens = estimate_tokens(json.dumps(prepared.payload, default=str))
+        if current and current_tokens + tokens > token_budget:
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(prepared)
+        current_tokens += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _finish_table(
+    prepared: _PreparedTable,
+    inferred: dict[str, dict[str, str]],
+) -> _GeneratedTable:
+    table = prepared.table
+    enriched_columns = prepared.enriched_columns
+    audit_rows = apply_inference(table, enriched_columns, inferred)
+
+    return _GeneratedTable(
+        rendered_table={
+            "table_name": table,
+            "columns": enriched_columns,
+            "primary_key": prepared.primary_key,
+        },
+        audit_rows=audit_rows,
+        enum_profile=prepared.enum_profile,
+        schema_hash=prepared.schema_hash,
+        fingerprint=prepared.fingerprint,
+        inferred=bool(inferred),
+    )
+
+
+def _generate_table(
+    table: str,
+    engine: Engine,
+    snapshot: SchemaSnapshot,
+    rosetta_map: RosettaMap,
+    gemini: BlockingGeminiClient,
+    system_prompt: str,
+    cache: InferenceCache | None = None,
+    previous: dict[str, dict[str, Any]] | None = None,
+    check_enums: bool = False,
+    profiles: ProfileStore | None = None,
+) -> _GeneratedTable:
+    prepared = _prepare_table(
+        table,
+        engine,
+        snapshot,
+        rosetta_map,
+        previous=previous,
+        check_enums=check_enums,
+        profiles=profiles,
+    )
+    if isinstance(prepared, _GeneratedTable):
+        return prepared
+    inferred = _infer_table(
+        prepared, gemini, rosetta_map.llm_config.model, system_prompt, cache
+    )
+    return _finish_table(prepared, inferred)
+
+
+def _generate_batched(
+    tables: list[str],
+    executor: ThreadPoolExecutor,
+    token_budget: int,
+    engine: Engine,
+    snapshot: SchemaSnapshot,
+    rosetta_map: RosettaMap,
+    gemini: BlockingGeminiClient,
+    system_prompt: str,
+    cache: InferenceCache | None = None,
+    previous: dict[str, dict[str, Any]] | None = None,
+    check_enums: bool = False,
+    profiles: ProfileStore | None = None,
+) -> list[_GeneratedTable]:
+    prepare = partial(
+        _prepare_table,
+        engine=engine,
+        snapshot=snapshot,
+        rosetta_map=rosetta_map,
+        previous=previous,
+        check_enums=check_enums,
+        profiles=profiles,
+    )
+    prepared_tables = list(executor.map(prepare, tables))
+
+    model_name = rosetta_map.llm_config.model
+    inferred_by_table: dict[str, dict[str, dict[str, str]]] = {}
+    pending: list[_PreparedTable] = []
+    for prepared in prepared_tables:
+        if isinstance(prepared, _GeneratedTable):
+            continue
+        cached = None
+        if cache is not None:
+            cached = cache.get(make_cache_key(model_name, system_prompt, prepared.user_prompt))
+        if cached is not None:
+            inferred_by_table[prepared.table] = cached
+        else:
+            pending.append(prepared)
+
+    infer = partial(
+        _infer_batch,
+        gemini=gemini,
+        model_name=model_name,
+        system_prompt=system_prompt,
+        cache=cache,
+    )
+    batches = _pack_batches(pending, token_budget)
+    for batch, inferred in zip(batches, executor.map(infer, batches)):
+        for prepared, result in zip(batch, inferred):
+            inferred_by_table[prepared.table] = result
+
+    return [
+        prepared
+        if isinstance(prepared, _GeneratedTable)
+        else _finish_table(prepared, inferred_by_table[prepared.table])
+        for prepared in prepared_tables
+    ]
 
 
 @app.command()
@@ -123,109 +492,217 @@ def generate(
     format_with_ruff: bool = typer.Option(
         False,
         "--format",
-        help="Format generated files with ruff",
+        help="Format generated files (ruff, or black in-process when installed)",
+    ),
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        "-j",
+        min=1,
+        help="Number of tables to process in parallel",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Always call Gemini instead of reusing cached inferences",
+    ),
+    full: bool = typer.Option(
+        False,
+        "--full",
+        help="Regenerate every table, ignoring the fingerprint manifest",
+    ),
+    check_enums: bool = typer.Option(
+        False,
+        "--check-enums",
+        help="Re-profile enum values of tables whose schema is unchanged",
+    ),
+    batch_tokens: int | None = typer.Option(
+        None,
+        "--batch-tokens",
+        min=0,
+        help="Pack several tables per Gemini request up to this many prompt tokens",
+    ),
+    layout: str = typer.Option(
+        "single",
+        "--layout",
+        help="Output layout: single, per-table or per-schema (lazy package imports)",
+    ),
+    repo_style: str = typer.Option(
+        "sync",
+        "--repo-style",
+        help="Repositories to generate: sync (Engine), async (AsyncEngine) or both",
+    ),
+    model_style: str = typer.Option(
+        "pydantic",
+        "--model-style",
+        help="Models to generate: pydantic, dataclass (slots) or msgspec",
     ),
 ) -> None:
+    if layout not in LAYOUTS:
+        raise typer.BadParameter(f"--layout must be one of {', '.join(LAYOUTS)}")
+    if repo_style not in REPO_STYLES:
+        raise typer.BadParameter(f"--repo-style must be one of {', '.join(REPO_STYLES)}")
+    if model_style not in MODEL_STYLES:
+        raise typer.BadParameter(f"--model-style must be one of {', '.join(MODEL_STYLES)}")
     rosetta_map = load_rosetta_map(config)
-    engine = get_engine(rosetta_map.database.connection_string)
+    engine_options = {}
+    if concurrency > 1:
+        engine_options = {"pool_size": concurrency, "max_overflow": 0}
+    engine = get_engine(rosetta_map.database.connection_string, **engine_options)
     tables = rosetta_map.whitelist_tables
     if not tables:
         typer.echo("No tables in whitelist.")
         return
 
-    gemini = GeminiClient(model_name=rosetta_map.llm_config.model)
+    llm_config = rosetta_map.llm_config
+    gemini = BlockingGeminiClient(
+        model_name=llm_config.model,
+        requests_per_minute=llm_config.requests_per_minute,
+        tokens_per_minute=llm_config.tokens_per_minute,
+        max_retries=llm_config.max_retries,
+        timeout_seconds=llm_config.timeout_seconds,
+        max_in_flight=llm_config.max_in_flight,
+    )
     system_prompt = get_system_prompt()
 
-    rendered_tables = []
-    audit_rows: list[tuple[str, str, str]] = []
-
-    for table in tables:
-        columns = inspect_schema(table, engine)
-        table_comment = get_table_comment(table, engine)
-        sample_rows = []
-        if rosetta_map.privacy.sample_rows:
-            sample_rows = fetch_sample_rows(engine, table, limit=3)
-
-        samples_by_column: dict[str, list[object]] = {}
-        for row in sample_rows:
-            for name, value in row.items():
-                samples_by_column.setdefault(name, []).append(value)
-
-        prompt_columns = []
-        enriched_columns = []
-        for column in columns:
-            name = column.get("name")
-            if not name:
-                continue
-            column_type = str(column.get("type", ""))
-            samples = samples_by_column.get(name, [])
-            scrub_pii = rosetta_map.privacy.scrub_pii and detect_pii(samples)
-            prompt_columns.append(
-                {
-                    "name": name,
-                    "type": column_type,
-                    "comment": column.get("comment"),
-                    "samples": [] if scrub_pii else samples,
-                }
-            )
-            python_type = _map_python_type(column_type)
-            semantic_name = name
-            enum_values = detect_enum_values(engine, table, name, column_type)
-            description = None
-            if enum_values:
-                description = f"Allowed values: {', '.join(map(str, enum_values))}"
-
-            enriched_columns.append(
-                {
-                    "original_name": name,
-                    "python_type": python_type,
-                    "semantic_name": semantic_name,
-                    "description": description,
-                }
+    cache = None
+    if rosetta_map.cache.enabled and not no_cache:
+        cache = _open_cache(rosetta_map.cache)
+
+    settings_hash = settings_fingerprint(
+        model=rosetta_map.llm_config.model,
+        system_prompt=system_prompt,
+        privacy=rosetta_map.privacy.model_dump(),
+        profiling=rosetta_map.profiling.model_dump(exclude={"profiles_path"}),
+        format_with_ruff=format_with_ruff,
+        layout=layout,
+        repo_style=repo_style,
+        model_style=model_style,
+    )
+    previous = {} if full else load_manifest(output_dir, settings_hash)
+    generated_files = load_generated_files(output_dir)
+
+    snapshot = build_schema_snapshot(engine, tables)
+    profiles_path = Path(rosetta_map.profiling.profiles_path)
+    profiles_hash = _profiles_fingerprint(rosetta_map)
+    profiles = ProfileStore.load(profiles_path, profiles_hash)
+    worker = partial(
+        _generate_table,
+        engine=engine,
+        snapshot=snapshot,
+        rosetta_map=rosetta_map,
+        gemini=gemini,
+        system_prompt=system_prompt,
+        cache=cache,
+        previous=previous,
+        check_enums=check_enums,
+        profiles=profiles,
+    )
+    token_budget = rosetta_map.llm_config.batch_token_budget
+    if batch_tokens is not None:
+        token_budget = batch_tokens
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        if token_budget:
+            results = _generate_batched(
+                tables,
+                executor,
+                token_budget,
+                engine=engine,
+                snapshot=snapshot,
+                rosetta_map=rosetta_map,
+                gemini=gemini,
+                system_prompt=system_prompt,
+                cache=cache,
+                previous=previous,
+                check_enums=check_enums,
+                profiles=profiles,
             )
+        else:
+            results = list(executor.map(worker, tables))
+    if cache is not None:
+        cache.prune()
+    profiles.save(profiles_path, profiles_hash, keep_samples=not rosetta_map.privacy.scrub_pii)
+
+    outputs = [*layout_paths(tables, layout), "audit_log.md", "functions.json"]
+    regenerated = [result for result in results if not result.reused]
+    if (
+        not regenerated
+        and list(previous) == list(tables)
+        and all((output_dir / name).exists() for name in outputs)
+    ):
+        typer.echo(f"No schema changes; {output_dir} is up to date.")
+        return
 
-        user_prompt = build_user_prompt(
-            table,
-            prompt_columns,
-            scrub_pii=rosetta_map.privacy.scrub_pii,
-            table_comment=table_comment,
-        )
-        gemini_response = gemini.generate_description(f"{system_prompt}\n\n{user_prompt}")
-        inferred = parse_gemini_response(gemini_response)
+    rendered_tables = [result.rendered_table for result in results]
+    audit_rows = [row for result in results for row in result.audit_rows]
+    enum_profiles = [result.enum_profile for result in results]
+
+    formatter = FormatStage(output_dir) if format_with_ruff else None
+    written = []
+    for relative_path, chunks in iter_layout(
+        rendered_tables, layout, repo_style, model_style
+    ):
+        if formatter is not None:
+            formatter.write(relative_path, chunks)
+        else:
+            write_python_file(output_dir / relative_path, chunks)
+        written.append(relative_path)
+    if formatter is not None:
+        formatter.flush()
+    for stale in stale_generated_files(output_dir, generated_files, written):
+        stale.unlink()
+    remove_empty_packages(output_dir)
+    write_chunks(output_dir / "audit_log.md", [render_audit_log(audit_rows, enum_profiles)])
+    write_chunks(
+        output_dir / "functions.json",
+        json.JSONEncoder(indent=2).iterencode(render_function_schemas(rendered_tables)),
+    )
+    if formatter is not None:
+        formatter.close()
+        for relative_path, reason in formatter.failed.items():
+            typer.echo(f"[!] Left {relative_path} unformatted: {reason}", err=True)
+    write_manifest(
+        output_dir,
+        settings_hash,
+        {
+            table: result.to_manifest_entry()
+            for table, result in zip(tables, results)
+            if result.inferred
+        },
+        files=written,
+    )
+
+    typer.echo(f"Regenerated {len(regenerated)} of {len(results)} tables.")
+    typer.echo(f"Wrote {output_dir}")
 
-        for column in enriched_columns:
-            name = column["original_name"]
-            inference = inferred.get(name, {})
-            semantic_name = inference.get("semantic_name") or name
-            description = inference.get("description") or column.get("description")
-            if column.get("description") and inference.get("description"):
-                description = f"{inference.get('description')} {column.get('description')}"
-            column["semantic_name"] = semantic_name
-            column["description"] = description
-
-            audit_value = semantic_name
-            if semantic_name != name:
-                audit_value = f"{semantic_name} (Inferred)"
-            audit_rows.append((table, name, audit_value))
-
-        rendered_tables.append(
-            {
-                "table_name": table,
-                "columns": enriched_columns,
-            }
-        )
 
-    models_code = render_models(rendered_tables)
-    repos_code = render_repositories(rendered_tables)
-    write_python_file(output_dir / "_models.py", models_code, format_with_ruff)
-    write_python_file(output_dir / "_repos.py", repos_code, format_with_ruff)
-    output_dir.mkdir(parents=True, exist_ok=True)
-    (output_dir / "audit_log.md").write_text(render_audit_log(audit_rows))
-    (output_dir / "functions.json").write_text(
-        json.dumps(render_function_schemas(rendered_tables), indent=2)
+def _open_cache(cache_config: CacheConfig) -> InferenceCache:
+    return InferenceCache(
+        Path(cache_config.path),
+        ttl_seconds=cache_config.ttl_seconds,
+        max_entries=cache_config.max_entries,
     )
 
-    typer.echo(f"Wrote {output_dir}")
+
+@cache_app.command("prune")
+def cache_prune(
+    config: Path = typer.Option(
+        "rosetta_map.yaml",
+        "--config",
+        "-c",
+        help="Path to rosetta_map.yaml",
+    ),
+    clear: bool = typer.Option(
+        False,
+        "--all",
+        help="Remove every cached inference, not just expired ones",
+    ),
+) -> None:
+    """Evict expired or excess entries from the inference cache."""
+    rosetta_map = load_rosetta_map(config)
+    cache = _open_cache(rosetta_map.cache)
+    removed = cache.prune(clear=clear)
+    typer.echo(f"Removed {removed} cached inferences ({len(cache)} remaining).")
 
 
 @app.command()
@@ -2,45 +2,107 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from functools import partial
 import json
 from pathlib import Path
 import logging
-from typing import Any
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Iterator, Literal, TypeVar
+
+import anyio
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from sqlalchemy.engine import Engine
 
-from rosetta_bridge.analyzer.enums import detect_enum_values
-from rosetta_bridge.analyzer.sampler import detect_pii, fetch_sample_rows
+from rosetta_bridge.analyzer.profile import ProfileStore, TableProfile, profile_table
+from rosetta_bridge.codegen.archive import iter_zip
 from rosetta_bridge.codegen.audit import render_audit_log
 from rosetta_bridge.codegen.functions import render_function_schemas
-from rosetta_bridge.codegen.renderer import render_models
-from rosetta_bridge.codegen.repos import render_repositories
+from rosetta_bridge.codegen.manifest import schema_fingerprint
+from rosetta_bridge.codegen.renderer import render_models, stream_models
+from rosetta_bridge.codegen.repos import stream_repositories
 from rosetta_bridge.core.config import (
     DatabaseConfig,
     LLMConfig,
     PrivacyConfig,
+    ProfilingConfig,
     RosettaMap,
+    Settings,
+)
+from rosetta_bridge.inference.client import AsyncGeminiClient
+from rosetta_bridge.inference.columns import (
+    apply_inference,
+    build_enriched_columns,
+    build_prompt_columns,
 )
-from rosetta_bridge.inference.client import GeminiClient
 from rosetta_bridge.inference.prompts import (
     build_user_prompt,
     get_system_prompt,
     parse_gemini_response,
 )
-from rosetta_bridge.inspector.db import get_engine, get_table_comment, inspect_schema
+from rosetta_bridge.inspector.catalog import TableSummary, list_tables
+from rosetta_bridge.inspector.db import (
+    connection_fingerprint,
+    engine_registry,
+    get_cached_engine,
+)
+from rosetta_bridge.inspector.snapshot import (
+    SchemaSnapshot,
+    SnapshotCache,
+    build_schema_snapshot,
+)
+
+
+async def _sweep_idle_engines(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        await _run_blocking(engine_registry().dispose_idle)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    idle_seconds = Settings().engine_idle_seconds
+    sweeper = None
+    if idle_seconds > 0:
+        sweeper = asyncio.create_task(_sweep_idle_engines(idle_seconds / 2))
+    try:
+        yield
+    finally:
+        if sweeper is not None:
+            sweeper.cancel()
+        engine_registry().dispose_all()
+
 
 app = FastAPI(
     title="Rosetta Bridge",
     description="Legacy-to-Agent Semantic Mapper",
     version="1.0.0",
+    lifespan=_lifespan,
 )
 
 logger = logging.getLogger("rosetta_bridge.web")
+T = TypeVar("T")
 _DEMO_TABLE_LIMIT = 12
+_DEMO_SCHEMA = "public"
+_DEMO_MIN_COLUMNS = 3
+# Worker threads shared by every request for blocking DB work.
+_BLOCKING_WORKERS = 16
+# Tables a single request may process at once.
+_REQUEST_CONCURRENCY = 4
+_blocking_limiter_instance: anyio.CapacityLimiter | None = None
+_snapshot_cache_instance: SnapshotCache | None = None
+# Profile stores kept per (connection, strategy); expire with the schema snapshot TTL.
+_PROFILE_STORE_LIMIT = 32
+_profile_stores: OrderedDict[tuple[str, str], tuple[float, ProfileStore]] = OrderedDict()
+_profile_stores_lock = threading.Lock()
 _DEMO_BLOCKLIST_TOKENS = {
     "tmp",
     "temp",
@@ -59,7 +121,7 @@ _DEMO_BLOCKLIST_TOKENS = {
 
 
 def _is_demo_table(schema: str, table: str) -> bool:
-    if schema != "public":
+    if schema != _DEMO_SCHEMA:
         return False
     lowered = table.lower()
     if lowered.startswith(("pg_", "sql_")):
@@ -81,6 +143,16 @@ class ConnectionRequest(BaseModel):
     database_url: str
 
 
+class ConnectRequest(ConnectionRequest):
+    search: str | None = None
+    limit: int = Field(default=_DEMO_TABLE_LIMIT, ge=1, le=500)
+    offset: int = Field(default=0, ge=0)
+
+
+class InvalidateRequest(BaseModel):
+    database_url: str | None = None
+
+
 class GenerateRequest(BaseModel):
     database_url: str
     gemini_api_key: str
@@ -88,6 +160,7 @@ class GenerateRequest(BaseModel):
     model: str = "gemini-3-flash-preview"
     sample_rows: bool = True
     scrub_pii: bool = True
+    profiling_strategy: Literal["exact", "tablesample", "stats"] = "exact"
 
 
 class TableInfo(BaseModel):
@@ -95,17 +168,7 @@ class TableInfo(BaseModel):
     column_count: int
     enum_count: int
     pii_count: int
-
-
-def _map_python_type(type_name: str) -> str:
-    normalized = type_name.strip().lower()
-    if any(token in normalized for token in ["int", "bigint", "smallint"]):
-        return "int"
-    if any(token in normalized for token in ["bool"]):
-        return "bool"
-    if any(token in normalized for token in ["numeric", "decimal", "real", "float", "double"]):
-        return "float"
-    return "str"
+    sample_bytes: int = 0
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -118,30 +181,171 @@ async def root():
     return HTMLResponse(content=index_path.read_text())
 
 
+def _blocking_limiter() -> anyio.CapacityLimiter:
+    global _blocking_limiter_instance
+    if _blocking_limiter_instance is None:
+        _blocking_limiter_instance = anyio.CapacityLimiter(_BLOCKING_WORKERS)
+    return _blocking_limiter_instance
+
+
+async def _run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking DB call on the shared worker pool instead of the event loop."""
+    return await anyio.to_thread.run_sync(
+        partial(func, *args, **kwargs),
+        limiter=_blocking_limiter(),
+    )
+
+
+def _snapshot_cache() -> SnapshotCache:
+    global _snapshot_cache_instance
+    if _snapshot_cache_instance is None:
+        _snapshot_cache_instance = SnapshotCache(
+            ttl_seconds=Settings().snapshot_ttl_seconds,
+        )
+    return _snapshot_cache_instance
+
+
+def _cached_snapshot(database_url: str, tables: list[str]) -> SchemaSnapshot:
+    """Reflect only the tables this connection has not reflected recently."""
+    engine = get_cached_engine(database_url)
+    return _snapshot_cache().get(
+        connection_fingerprint(database_url),
+        tables,
+        lambda missing: build_schema_snapshot(engine, missing),
+    )
+
+
+def _discover_tables(
+    database_url: str,
+    search: str | None = None,
+    limit: int = _DEMO_TABLE_LIMIT,
+    offset: int = 0,
+) -> tuple[list[TableSummary], int]:
+    engine = get_cached_engine(database_url)
+    summaries = [
+        summary
+        for summary in list_tables(
+            engine,
+            schema=_DEMO_SCHEMA,
+            prefix=search,
+            min_columns=_DEMO_MIN_COLUMNS,
+        )
+        if _is_demo_table(summary.schema or "", summary.table)
+    ]
+    return summaries[offset : offset + limit], len(summaries)
+
+
+def _profile_store(key: tuple[str, str]) -> ProfileStore:
+    now = time.monotonic()
+    ttl_seconds = Settings().snapshot_ttl_seconds
+    with _profile_stores_lock:
+        entry = _profile_stores.get(key)
+        if entry is None or now - entry[0] > ttl_seconds:
+            entry = (now, ProfileStore())
+            _profile_stores[key] = entry
+        _profile_stores.move_to_end(key)
+        while len(_profile_stores) > _PROFILE_STORE_LIMIT:
+            _profile_stores.popitem(last=False)
+        return entry[1]
+
+
+def _table_profile(
+    database_url: str,
+    engine: Engine,
+    snapshot: SchemaSnapshot,
+    table: str,
+    profiling: ProfilingConfig,
+    privacy: PrivacyConfig,
+    sample_rows: bool = True,
+) -> TableProfile:
+    """Profile a table once per schema version, shared by inspect and generate."""
+    table_schema = snapshot.table(table)
+    schema_hash = schema_fingerprint(table_schema)
+    key = (connection_fingerprint(database_url), profiling.strategy)
+    store = _profile_store(key)
+    profile = store.get(table, schema_hash, need_samples=sample_rows)
+    if profile is None:
+        profile = profile_table(
+            engine,
+            table_schema,
+            schema_hash=schema_hash,
+            sample_rows=sample_rows,
+            sample_limit=privacy.prompt_samples,
+            strategy=profiling.strategy,
+            row_budget=profiling.row_budget,
+            max_values=profiling.max_enum_values,
+            sample_row_budget=privacy.sample_row_budget,
+            sample_byte_budget=privacy.sample_byte_budget,
+            sample_method=privacy.sample_method,
+            max_value_chars=privacy.max_value_chars,
+        )
+        store.put(profile)
+    return profile
+
+
+def _inspect_table(
+    database_url: str,
+    engine: Engine,
+    snapshot: SchemaSnapshot,
+    table: str,
+) -> TableInfo:
+    profile = _table_profile(
+        database_url,
+        engine,
+        snapshot,
+        table,
+        ProfilingConfig(),
+        PrivacyConfig(),
+    )
+    return TableInfo(
+        name=table,
+        column_count=len(snapshot.columns(table)),
+        enum_count=len(profile.enum_values),
+        pii_count=len(profile.pii_columns),
+        sample_bytes=profile.sample_bytes,
+    )
+
+
+@app.post("/api/cache/invalidate")
+async def invalidate_cache(request: InvalidateRequest) -> JSONResponse:
+    """Drop cached schema snapshots and profiles for one database, or for all of them."""
+    key = connection_fingerprint(request.database_url) if request.database_url else None
+    removed = _snapshot_cache().invalidate(key)
+    with _profile_stores_lock:
+        for store_key in list(_profile_stores):
+            if key is None or store_key[0] == key:
+                del _profile_stores[store_key]
+    return JSONResponse({"success": True, "invalidated": removed})
+
+
 @app.post("/api/connect")
-async def connect(request: ConnectionRequest) -> JSONResponse:
+async def connect(request: ConnectRequest) -> JSONResponse:
     """Test database connection and list tables."""
     try:
-        engine = get_engine(request.database_url)
-        from sqlalchemy import inspect as sa_inspect
-
-        inspector = sa_inspect(engine)
-        schemas = inspector.get_schema_names()
-        candidates: list[tuple[str, int]] = []
-        for schema in schemas:
-            if schema in ("information_schema", "pg_catalog", "pg_toast"):
-                continue
-            for table in inspector.get_table_names(schema=schema):
-                if not _is_demo_table(schema, table):
-                    continue
-                columns = inspector.get_columns(table, schema=schema)
-                if len(columns) < 3:
-                    continue
-                candidates.append((f"{schema}.{table}", len(columns)))
-
-        candidates.sort(key=lambda item: (-item[1], item[0]))
-        demo_tables = [name for name, _ in candidates[:_DEMO_TABLE_LIMIT]]
-        return JSONResponse({"success": True, "tables": demo_tables})
+        page, total = await _run_blocking(
+            _discover_tables,
+            request.database_url,
+            search=request.search,
+            limit=request.limit,
+            offset=request.offset,
+        )
+        return JSONResponse(
+            {
+                "success": True,
+                "tables": [summary.name for summary in page],
+                "details": [
+                    {
+                        "name": summary.name,
+                        "column_count": summary.column_count,
+                        "row_estimate": summary.row_estimate,
+                    }
+                    for summary in page
+                ],
+                "total": total,
+                "offset": request.offset,
+                "limit": request.limit,
+            }
+        )
     except Exception as e:
         logger.exception("connect failed: %s", str(e))
         return JSONResponse({"success": False, "error": str(e)}, status_code=400)
@@ -151,184 +355,259 @@ async def connect(request: ConnectionRequest) -> JSONResponse:
 async def inspect_tables(request: ConnectionRequest, tables: list[str]) -> JSONResponse:
     """Inspect selected tables."""
     try:
-        engine = get_engine(request.database_url)
-        results: list[TableInfo] = []
-
-        for table in tables:
-            columns = inspect_schema(table, engine)
-            sample_rows = fetch_sample_rows(engine, table, limit=3)
-
-            samples_by_column: dict[str, list[object]] = {}
-            for row in sample_rows:
-                for name, value in row.items():
-                    samples_by_column.setdefault(name, []).append(value)
-
-            enum_count = 0
-            pii_count = 0
-            for column in columns:
-                name = column.get("name")
-                column_type = str(column.get("type", "")).lower()
-                if name and detect_enum_values(engine, table, name, column_type):
-                    enum_count += 1
-                if name:
-                    values = samples_by_column.get(name, [])
-                    if values and detect_pii(values):
-                        pii_count += 1
-
-            results.append(
-                TableInfo(
-                    name=table,
-                    column_count=len(columns),
-                    enum_count=enum_count,
-                    pii_count=pii_count,
+        engine = get_cached_engine(request.database_url)
+        snapshot = await _run_blocking(_cached_snapshot, request.database_url, tables)
+        slots = asyncio.Semaphore(_REQUEST_CONCURRENCY)
+
+        async def inspect_one(table: str) -> TableInfo:
+            async with slots:
+                return await _run_blocking(
+                    _inspect_table, request.database_url, engine, snapshot, table
                 )
-            )
 
+        results = await asyncio.gather(*(inspect_one(table) for table in tables))
         return JSONResponse({"success": True, "tables": [r.model_dump() for r in results]})
     except Exception as e:
         logger.exception("inspect failed: %s", str(e))
         return JSONResponse({"success": False, "error": str(e)}, status_code=400)
 
 
-@app.post("/api/generate")
-async def generate(request: GenerateRequest) -> JSONResponse:
-    """Generate models, repos, audit log, and function schemas."""
-    try:
-        engine = get_engine(request.database_url)
-
-        # Build config
-        rosetta_map = RosettaMap(
-            project_name="rosetta-bridge",
-            database=DatabaseConfig(connection_string=request.database_url),
-            whitelist_tables=request.tables,
-            llm_config=LLMConfig(model=request.model),
-            privacy=PrivacyConfig(sample_rows=request.sample_rows, scrub_pii=request.scrub_pii),
-        )
+def _prepare_table(
+    database_url: str,
+    engine: Engine,
+    snapshot: SchemaSnapshot,
+    table: str,
+    rosetta_map: RosettaMap,
+) -> dict[str, Any]:
+    sample_rows = rosetta_map.privacy.sample_rows
+    profile = _table_profile(
+        database_url,
+        engine,
+        snapshot,
+        table,
+        rosetta_map.profiling,
+        rosetta_map.privacy,
+        sample_rows=sample_rows,
+    )
+
+    prompt_columns = build_prompt_columns(
+        profile,
+        sample_rows=sample_rows,
+        scrub_pii=rosetta_map.privacy.scrub_pii,
+    )
+
+    return {
+        "sample_rows": profile.sample_rows if sample_rows else 0,
+        "sample_bytes": profile.sample_bytes if sample_rows else 0,
+        "enum_profile": profile.enum_profile,
+        "enriched_columns": build_enriched_columns(profile),
+        "user_prompt": build_user_prompt(
+            table,
+            prompt_columns,
+            scrub_pii=rosetta_map.privacy.scrub_pii,
+            table_comment=snapshot.comment(table),
+        ),
+    }
+
+
+_ARTIFACT_FILES = {
+    "models": "_models.py",
+    "repos": "_repos.py",
+    "audit_log": "audit_log.md",
+    "functions": "functions.json",
+}
 
-        # Initialize Gemini client
-        import os
-
-        os.environ["GEMINI_API_KEY"] = request.gemini_api_key
-        gemini = GeminiClient(model_name=rosetta_map.llm_config.model)
-        system_prompt = get_system_prompt()
-
-        rendered_tables: list[dict[str, Any]] = []
-        audit_rows: list[tuple[str, str, str]] = []
-        failed_tables: list[dict[str, str]] = []
-
-        for table in request.tables:
-            try:
-                columns = inspect_schema(table, engine)
-                table_comment = get_table_comment(table, engine)
-                sample_rows = []
-                if rosetta_map.privacy.sample_rows:
-                    sample_rows = fetch_sample_rows(engine, table, limit=3)
-
-                samples_by_column: dict[str, list[object]] = {}
-                for row in sample_rows:
-                    for name, value in row.items():
-                        samples_by_column.setdefault(name, []).append(value)
-
-                prompt_columns = []
-                enriched_columns: list[dict[str, Any]] = []
-                for column in columns:
-                    name = column.get("name")
-                    if not name:
-                        continue
-                    column_type = str(column.get("type", ""))
-                    samples = samples_by_column.get(name, [])
-                    scrub_pii = rosetta_map.privacy.scrub_pii and detect_pii(samples)
-                    prompt_columns.append(
-                        {
-                            "name": name,
-                            "type": column_type,
-                            "comment": column.get("comment"),
-                            "samples": [] if scrub_pii else samples,
-                        }
-                    )
-                    python_type = _map_python_type(column_type)
-                    semantic_name = name
-                    enum_values = detect_enum_values(engine, table, name, column_type)
-                    description = None
-                    if enum_values:
-                        description = f"Allowed values: {', '.join(map(str, enum_values))}"
-
-                    enriched_columns.append(
-                        {
-                            "original_name": name,
-                            "python_type": python_type,
-                            "semantic_name": semantic_name,
-                            "description": description,
-                        }
-                    )
-
-                user_prompt = build_user_prompt(
+
+def _artifact_chunks(
+    rendered_tables: list[dict[str, Any]],
+    audit_log: str,
+    function_schemas: list[dict[str, Any]],
+) -> dict[str, Iterator[str]]:
+    return {
+        "models": stream_models(rendered_tables),
+        "repos": stream_repositories(rendered_tables),
+        "audit_log": iter([audit_log]),
+        "functions": json.JSONEncoder(indent=2).iterencode(function_schemas),
+    }
+
+
+async def _generate_events(
+    request: GenerateRequest,
+    render_outputs: bool = True,
+) -> AsyncIterator[dict[str, Any]]:
+    engine = get_cached_engine(request.database_url)
+
+    # Build config
+    rosetta_map = RosettaMap(
+        project_name="rosetta-bridge",
+        database=DatabaseConfig(connection_string=request.database_url),
+        whitelist_tables=request.tables,
+        llm_config=LLMConfig(model=request.model),
+        privacy=PrivacyConfig(sample_rows=request.sample_rows, scrub_pii=request.scrub_pii),
+        profiling=ProfilingConfig(strategy=request.profiling_strategy),
+    )
+
+    # Initialize Gemini client
+    import os
+
+    os.environ["GEMINI_API_KEY"] = request.gemini_api_key
+    llm_config = rosetta_map.llm_config
+    gemini = AsyncGeminiClient(
+        model_name=llm_config.model,
+        requests_per_minute=llm_config.requests_per_minute,
+        tokens_per_minute=llm_config.tokens_per_minute,
+        max_retries=llm_config.max_retries,
+        timeout_seconds=llm_config.timeout_seconds,
+        max_in_flight=llm_config.max_in_flight,
+    )
+    system_prompt = get_system_prompt()
+
+    results: list[tuple[dict[str, Any], list[tuple[str, str, str]], tuple[str, str, float]] | None]
+    results = [None] * len(request.tables)
+    failures: list[dict[str, str] | None] = [None] * len(request.tables)
+
+    yield {"event": "started", "tables": request.tables}
+    snapshot = await _run_blocking(_cached_snapshot, request.database_url, request.tables)
+
+    events: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+    slots = asyncio.Semaphore(_REQUEST_CONCURRENCY)
+
+    async def process(index: int, table: str) -> None:
+        try:
+            async with slots:
+                columns = snapshot.columns(table)
+                await events.put(
+                    {"event": "introspected", "table": table, "column_count": len(columns)}
+                )
+
+                prepared = await _run_blocking(
+                    _prepare_table,
+                    request.database_url,
+                    engine,
+                    snapshot,
                     table,
-                    prompt_columns,
-                    scrub_pii=rosetta_map.privacy.scrub_pii,
-                    table_comment=table_comment,
+                    rosetta_map,
+                )
+                enum_profile = prepared["enum_profile"]
+                enriched_columns = prepared["enriched_columns"]
+                await events.put(
+                    {
+                        "event": "sampled",
+                        "table": table,
+                        "sample_rows": prepared["sample_rows"],
+                        "sample_bytes": prepared["sample_bytes"],
+                        "enum_count": len(enum_profile.values),
+                    }
+                )
+
+                gemini_response = await gemini.agenerate_description(
+                    f"{system_prompt}\n\n{prepared['user_prompt']}"
                 )
-                gemini_response = gemini.generate_description(f"{system_prompt}\n\n{user_prompt}")
                 inferred = parse_gemini_response(gemini_response)
+                await events.put(
+                    {"event": "inferred", "table": table, "inferred_columns": len(inferred)}
+                )
+
+                table_audit_rows = apply_inference(table, enriched_columns, inferred)
+
+                rendered_table = {
+                    "table_name": table,
+                    "columns": enriched_columns,
+                    "primary_key": snapshot.table(table).primary_key,
+                }
+                results[index] = (
+                    rendered_table,
+                    table_audit_rows,
+                    (table, enum_profile.strategy, enum_profile.confidence),
+                )
+                await events.put(
+                    {"event": "rendered", "table": table, "models": render_models([rendered_table])}
+                )
+        except Exception as e:
+            logger.exception("generate failed for table=%s: %s", table, str(e))
+            failures[index] = {"table": table, "error": str(e)}
+            await events.put({"event": "failed", "table": table, "error": str(e)})
+        finally:
+            await events.put(None)
+
+    tasks = [
+        asyncio.create_task(process(index, table))
+        for index, table in enumerate(request.tables)
+    ]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            event = await events.get()
+            if event is None:
+                remaining -= 1
+                continue
+            yield event
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    completed = [result for result in results if result is not None]
+    failed_tables = [failure for failure in failures if failure is not None]
+    if not completed:
+        yield {
+            "event": "error",
+            "error": "No tables could be processed.",
+            "failed_tables": failed_tables,
+        }
+        return
+
+    rendered_tables = [rendered_table for rendered_table, _, _ in completed]
+    audit_rows = [row for _, table_audit_rows, _ in completed for row in table_audit_rows]
+    enum_profiles = [enum_profile for _, _, enum_profile in completed]
+
+    audit_log = render_audit_log(audit_rows, enum_profiles)
+    if failed_tables:
+        audit_log += "\n\n## Skipped tables\n"
+        for failure in failed_tables:
+            table = failure.get("table", "unknown")
+            error = failure.get("error", "unknown error")
+            audit_log += f"- {table}: {error}\n"
+    function_schemas = render_function_schemas(rendered_tables)
+    artifacts = _artifact_chunks(rendered_tables, audit_log, function_schemas)
+
+    if not render_outputs:
+        yield {
+            "event": "complete",
+            "files": [(_ARTIFACT_FILES[key], chunks) for key, chunks in artifacts.items()],
+            "failed_tables": failed_tables,
+        }
+        return
+
+    yield {
+        "event": "complete",
+        "outputs": {key: "".join(chunks) for key, chunks in artifacts.items()},
+        "failed_tables": failed_tables,
+    }
+
 
-                for column in enriched_columns:
-                    name = column["original_name"]
-                    inference = inferred.get(name, {})
-                    semantic_name = inference.get("semantic_name") or name
-                    description = inference.get("description") or column.get("description")
-                    if column.get("description") and inference.get("description"):
-                        description = f"{inference.get('description')} {column.get('description')}"
-                    column["semantic_name"] = semantic_name
-                    column["description"] = description
-
-                    audit_value = semantic_name
-                    if semantic_name != name:
-                        audit_value = f"{semantic_name} (Inferred)"
-                    audit_rows.append((table, name, audit_value))
-
-                rendered_tables.append(
+@app.post("/api/generate")
+async def generate(request: GenerateRequest) -> JSONResponse:
+    """Generate models, repos, audit log, and function schemas."""
+    try:
+        async for event in _generate_events(request):
+            if event["event"] == "error":
+                return JSONResponse(
+                    {
+                        "success": False,
+                        "error": event["error"],
+                        "failed_tables": event["failed_tables"],
+                    },
+                    status_code=400,
+                )
+            if event["event"] == "complete":
+                return JSONResponse(
                     {
-                        "table_name": table,
-                        "columns": enriched_columns,
+                        "success": True,
+                        "outputs": event["outputs"],
+                        "failed_tables": event["failed_tables"],
                     }
                 )
-            except Exception as e:
-                logger.exception("generate failed for table=%s: %s", table, str(e))
-                failed_tables.append({"table": table, "error": str(e)})
-
-        if not rendered_tables:
-            return JSONResponse(
-                {
-                    "success": False,
-                    "error": "No tables could be processed.",
-                    "failed_tables": failed_tables,
-                },
-                status_code=400,
-            )
-
-        models_code = render_models(rendered_tables)
-        repos_code = render_repositories(rendered_tables)
-        audit_log = render_audit_log(audit_rows)
-        if failed_tables:
-            audit_log += "\n\n## Skipped tables\n"
-            for failure in failed_tables:
-                table = failure.get("table", "unknown")
-                error = failure.get("error", "unknown error")
-                audit_log += f"- {table}: {error}\n"
-        function_schemas = render_function_schemas(rendered_tables)
-
-        return JSONResponse(
-            {
-                "success": True,
-                "outputs": {
-                    "models": models_code,
-                    "repos": repos_code,
-                    "audit_log": audit_log,
-                    "functions": json.dumps(function_schemas, indent=2),
-                },
-                "failed_tables": failed_tables,
-            }
-        )
+        raise RuntimeError("generate finished without a result")
     except Exception as e:
         import traceback
         logger.exception("generate failed: %s", str(e))
@@ -338,7 +617,51 @@ async def generate(request: GenerateRequest) -> JSONResponse:
         )
 
 
+@app.post("/api/generate/stream")
+async def generate_stream(request: GenerateRequest) -> StreamingResponse:
+    """Stream per-table progress as NDJSON, ending with the generated artifacts."""
+
+    async def lines() -> AsyncIterator[str]:
+        try:
+            async for event in _generate_events(request):
+                yield json.dumps(event, default=str) + "\n"
+        except Exception as e:
+            logger.exception("generate stream failed: %s", str(e))
+            yield json.dumps({"event": "error", "error": str(e), "failed_tables": []}) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.post("/api/generate/archive", response_model=None)
+async def generate_archive(request: GenerateRequest) -> StreamingResponse | JSONResponse:
+    """Generate the artifacts and stream them back as a zip archive."""
+    try:
+        async for event in _generate_events(request, render_outputs=False):
+            if event["event"] == "error":
+                return JSONResponse(
+                    {
+                        "success": False,
+                        "error": event["error"],
+                        "failed_tables": event["failed_tables"],
+                    },
+                    status_code=400,
+                )
+            if event["event"] == "complete":
+                return StreamingResponse(
+                    iter_zip(event["files"]),
+                    media_type="application/zip",
+                    headers={
+                        "Content-Disposition": 'attachment; filename="rosetta_bridge.zip"'
+                    },
+                )
+        raise RuntimeError("generate finished without a result")
+    except Exception as e:
+        logger.exception("generate archive failed: %s", str(e))
+        return JSONResponse({"success": False, "error": str(e)}, status_code=400)
+
+
 # Mount static files
 static_dir = Path(__file__).parent / "static"
 if static_dir.exists():
     app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+
@@ -0,0 +1,72 @@
+import importlib.util
+import sys
+import time
+import types
+
+from rosetta_bridge.codegen.renderer import MODEL_STYLES, render_models
+
+
+_ROWS = 10_000
+_COLUMNS = 20
+_ROUNDS = 3
+
+
+def _table() -> dict:
+    columns = []
+    for index in range(_COLUMNS):
+        column = {
+            "original_name": f"c_{index}",
+            "python_type": "int" if index % 2 else "str",
+        }
+        if index % 4 == 0:
+            column["semantic_name"] = f"column_{index}"
+        columns.append(column)
+    return {"table_name": "public.events", "columns": columns}
+
+
+def _rows() -> list[dict]:
+    return [
+        {
+            f"c_{index}": row * index if index % 2 else f"value {row}"
+            for index in range(_COLUMNS)
+        }
+        for row in range(_ROWS)
+    ]
+
+
+def _load(model_style: str) -> type:
+    module = types.ModuleType(f"bench_{model_style}_models")
+    sys.modules[module.__name__] = module
+    exec(render_models([_table()], model_style=model_style), module.__dict__)
+    return module.PublicEvents
+
+
+def _rows_per_second(func, rows: list[dict]) -> float:
+    timings = []
+    for _ in range(_ROUNDS):
+        started = time.perf_counter()
+        func(rows)
+        timings.append(time.perf_counter() - started)
+    return len(rows) / min(timings)
+
+
+def main() -> int:
+    rows = _rows()
+    print(f"{_ROWS} rows x {_COLUMNS} columns (rows/sec, best of {_ROUNDS})")
+    for model_style in MODEL_STYLES:
+        if model_style == "msgspec" and importlib.util.find_spec("msgspec") is None:
+            print(f"  {model_style:<10} skipped (msgspec not installed)")
+            continue
+        model = _load(model_style)
+        if model_style == "pydantic":
+            per_row = _rows_per_second(lambda batch: [model(**row) for row in batch], rows)
+            print(f"  {model_style:<10} per-row init:   {per_row:>12,.0f}")
+        validated = _rows_per_second(model.validate_rows, rows)
+        constructed = _rows_per_second(model.construct_rows, rows)
+        print(f"  {model_style:<10} validate_rows:  {validated:>12,.0f}")
+        print(f"  {model_style:<10} construct_rows: {constructed:>12,.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
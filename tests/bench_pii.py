@@ -0,0 +1,86 @@
+import random
+import re
+import sys
+import time
+
+from rosetta_bridge.analyzer import pii
+from rosetta_bridge.analyzer.pii import scan_columns
+
+
+_ROWS = 5_000
+_COLUMNS = 20
+_BATCH = 500
+
+_EMAIL_RE = re.compile(r"\b[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}\b", re.IGNORECASE)
+_PHONE_RE = re.compile(
+    r"\b(?:\+?\d{1,3}[\s.-]?)?(?:\(\d{3}\)|\d{3})[\s.-]?\d{3}[\s.-]?\d{4}\b"
+)
+_SSN_RE = re.compile(r"\b\d{3}-\d{2}-\d{4}\b")
+
+
+def _per_value_scan(values: list[object]) -> bool:
+    for value in values:
+        if value is None:
+            continue
+        text_value = str(value)
+        if not text_value:
+            continue
+        if _EMAIL_RE.search(text_value):
+            return True
+        if _PHONE_RE.search(text_value):
+            return True
+        if _SSN_RE.search(text_value):
+            return True
+    return False
+
+
+def _sample_columns() -> dict[str, list[object]]:
+    rng = random.Random(0)
+    columns: dict[str, list[object]] = {}
+    for index in range(_COLUMNS):
+        if index == 0:
+            columns["email"] = [f"user{i}@example.com" for i in range(_ROWS)]
+            continue
+        columns[f"c_{index}"] = [
+            None if rng.random() < 0.1 else f"value {rng.randint(0, 10_000)} status A"
+            for _ in range(_ROWS)
+        ]
+    return columns
+
+
+def main() -> int:
+    columns = _sample_columns()
+
+    started = time.perf_counter()
+    legacy = {name: _per_value_scan(values) for name, values in columns.items()}
+    legacy_elapsed = time.perf_counter() - started
+
+    pii._scan_cache.clear()
+    started = time.perf_counter()
+    findings = scan_columns(columns)
+    combined_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scan_columns(columns)
+    memoized_elapsed = time.perf_counter() - started
+
+    # profile_table scans streamed rows in batches that never repeat.
+    started = time.perf_counter()
+    for offset in range(0, _ROWS, _BATCH):
+        scan_columns(
+            {name: values[offset : offset + _BATCH] for name, values in columns.items()},
+            memoize=False,
+        )
+    batched_elapsed = time.perf_counter() - started
+
+    assert {name for name, found in legacy.items() if found} == set(findings)
+    print(f"{_ROWS} rows x {_COLUMNS} columns")
+    print(f"  per-value regexes: {legacy_elapsed * 1000:.1f} ms")
+    print(f"  combined scan:     {combined_elapsed * 1000:.1f} ms")
+    print(f"  memoized rescan:   {memoized_elapsed * 1000:.1f} ms")
+    print(f"  {_BATCH}-row batches:   {batched_elapsed * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+import sys
+import time
+
+from jinja2 import Environment, FileSystemLoader
+
+from rosetta_bridge.codegen.renderer import (
+    DEFAULT_TEMPLATE_DIR,
+    _normalize_tables,
+    render_models,
+    to_pascal,
+)
+from rosetta_bridge.codegen.repos import render_repositories
+
+
+_TABLES = 1_000
+_COLUMNS = 20
+_ROUNDS = 5
+
+
+def _tables() -> list[dict]:
+    return [
+        {
+            "table_name": f"public.table_{index}",
+            "columns": [
+                {
+                    "original_name": f"c_{column}",
+                    "python_type": "str",
+                    "semantic_name": f"column_{column}",
+                    "description": "Allowed values: A, C" if column % 5 == 0 else None,
+                }
+                for column in range(_COLUMNS)
+            ],
+        }
+        for index in range(_TABLES)
+    ]
+
+
+def _render_with_fresh_environment(tables: list[dict]) -> str:
+    env = Environment(
+        loader=FileSystemLoader(str(DEFAULT_TEMPLATE_DIR)),
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+    template = env.get_template("models.py.j2")
+    return template.render(tables=_normalize_tables(tables), to_pascal=to_pascal)
+
+
+def _best_of(func, tables: list[dict]) -> float:
+    timings = []
+    for _ in range(_ROUNDS):
+        started = time.perf_counter()
+        func(tables)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> int:
+    tables = _tables()
+    single = tables[:1]
+
+    started = time.perf_counter()
+    render_models(tables)
+    cold = time.perf_counter() - started
+
+    print(f"{_TABLES} tables x {_COLUMNS} columns")
+    print(f"  models, first render:        {cold * 1000:.1f} ms")
+    print(f"  models, cached environment:  {_best_of(render_models, tables) * 1000:.1f} ms")
+    print(f"  repos, cached environment:   {_best_of(render_repositories, tables) * 1000:.1f} ms")
+    print("1 table (per-request overhead)")
+    print(f"  fresh environment:           {_best_of(_render_with_fresh_environment, single) * 1000:.2f} ms")
+    print(f"  cached environment:          {_best_of(render_models, single) * 1000:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
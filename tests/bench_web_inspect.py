@@ -0,0 +1,89 @@
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from sqlalchemy import create_engine, text
+
+from rosetta_bridge.analyzer import profile as profile_module
+from rosetta_bridge.web import app as web_app
+
+
+_CONCURRENT_INSPECTS = 20
+_SIMULATED_LATENCY_SECONDS = 0.2
+
+
+def _create_database(path: Path) -> str:
+    url = f"sqlite:///{path}"
+    engine = create_engine(url)
+    with engine.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE customers (id INTEGER PRIMARY KEY, name TEXT, status TEXT)")
+        )
+        connection.execute(
+            text("INSERT INTO customers (name, status) VALUES ('Ada', 'A'), ('Bob', 'C')")
+        )
+    engine.dispose()
+    return url
+
+
+def _slow_stream_sample_rows(stream):
+    def wrapper(engine, table, **kwargs):
+        time.sleep(_SIMULATED_LATENCY_SECONDS)
+        return stream(engine, table, **kwargs)
+
+    return wrapper
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+async def _run(url: str) -> tuple[list[float], float]:
+    transport = httpx.ASGITransport(app=web_app.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        body = {"request": {"database_url": url}, "tables": ["customers"]}
+        started = time.perf_counter()
+        inspects = [
+            asyncio.create_task(client.post("/api/inspect", json=body))
+            for _ in range(_CONCURRENT_INSPECTS)
+        ]
+
+        latencies: list[float] = []
+        while not all(task.done() for task in inspects):
+            probe_started = time.perf_counter()
+            await client.get("/")
+            latencies.append(time.perf_counter() - probe_started)
+            await asyncio.sleep(0.01)
+
+        responses = await asyncio.gather(*inspects)
+        elapsed = time.perf_counter() - started
+        failed = [r for r in responses if not r.json().get("success")]
+        if failed:
+            raise RuntimeError(f"{len(failed)} inspect calls failed: {failed[0].text}")
+    return latencies, elapsed
+
+
+def main() -> int:
+    profile_module.stream_sample_rows = _slow_stream_sample_rows(profile_module.stream_sample_rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        url = _create_database(Path(tmp) / "bench.sqlite")
+        latencies, elapsed = asyncio.run(_run(url))
+
+    if not latencies:
+        print("Inspect calls finished before any probe ran")
+        return 1
+    print(f"{_CONCURRENT_INSPECTS} concurrent /api/inspect calls in {elapsed:.2f}s")
+    print(f"GET / probes: {len(latencies)}")
+    print(f"  p50: {statistics.median(latencies) * 1000:.1f} ms")
+    print(f"  p95: {_percentile(latencies, 95) * 1000:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
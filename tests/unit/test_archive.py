@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import io
+import zipfile
+
+from rosetta_bridge.codegen.archive import iter_zip
+
+
+def test_iter_zip_streams_members_in_pieces() -> None:
+    big = (f"line {index}\n" for index in range(50_000))
+    parts = list(iter_zip([("a.py", iter(["x = 1\n", "y = 2\n"])), ("big.txt", big)]))
+
+    assert len(parts) > 2
+    with zipfile.ZipFile(io.BytesIO(b"".join(parts))) as archive:
+        assert archive.namelist() == ["a.py", "big.txt"]
+        assert archive.read("a.py") == b"x = 1\ny = 2\n"
+        assert archive.read("big.txt").decode().splitlines()[-1] == "line 49999"
+        assert archive.testzip() is None
@@ -13,3 +13,13 @@ def test_render_audit_log_has_header_and_rows() -> None:
 
     assert "| Table | Original Column | Inferred Meaning |" in output
     assert "| users | email | User email address |" in output
+
+
+def test_render_audit_log_records_enum_profiling_strategy() -> None:
+    output = render_audit_log(
+        [("users", "status", "Account status")],
+        enum_profiles=[("users", "tablesample", 0.25)],
+    )
+
+    assert "## Enum profiling" in output
+    assert "| users | tablesample | 0.25 |" in output
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from sqlalchemy import create_engine, text
+
+from rosetta_bridge.inspector.catalog import TableSummary, list_tables
+
+
+def test_list_tables_counts_columns_and_filters_by_prefix() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE cust_accounts (id INTEGER, a TEXT, b TEXT, c TEXT)"))
+        connection.execute(text("CREATE TABLE cust_notes (id INTEGER, body TEXT)"))
+        connection.execute(text("CREATE TABLE orders (id INTEGER, a TEXT, b TEXT)"))
+
+    assert [(t.name, t.column_count) for t in list_tables(engine, schema="main")] == [
+        ("main.cust_accounts", 4),
+        ("main.orders", 3),
+        ("main.cust_notes", 2),
+    ]
+    assert [t.table for t in list_tables(engine, schema="main", prefix="CUST")] == [
+        "cust_accounts",
+        "cust_notes",
+    ]
+    assert [t.table for t in list_tables(engine, schema="main", min_columns=3)] == [
+        "cust_accounts",
+        "orders",
+    ]
+
+
+def test_list_tables_uses_single_pg_catalog_query() -> None:
+    statements = []
+
+    class DummyResult:
+        def mappings(self):
+            return [
+                {"schema_name": "public", "table_name": "small", "column_count": 3, "row_estimate": -1.0},
+                {"schema_name": "public", "table_name": "wide", "column_count": 9, "row_estimate": 1200.0},
+            ]
+
+    class DummyConnection:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def execute(self, statement, params=None):
+            statements.append((str(statement), params))
+            return DummyResult()
+
+    class DummyDialect:
+        name = "postgresql"
+
+    class DummyEngine:
+        dialect = DummyDialect()
+
+        def connect(self):
+            return DummyConnection()
+
+    tables = list_tables(DummyEngine(), schema="public", prefix="100%_", min_columns=3)
+
+    assert len(statements) == 1
+    sql, params = statements[0]
+    assert "reltuples" in sql
+    assert params["schema"] == "public"
+    assert params["pattern"] == "100\\%\\_%"
+    assert params["min_columns"] == 3
+    assert tables == [
+        TableSummary(schema="public", table="wide", column_count=9, row_estimate=1200),
+        TableSummary(schema="public", table="small", column_count=3, row_estimate=None),
+    ]
@@ -26,6 +26,17 @@ def test_get_engine_errors_when_missing_connection_string(
         db_inspector.get_engine(settings=db_inspector.Settings(_env_file=None))
 
 
+def test_get_engine_drops_pool_sizing_for_non_queue_pools(tmp_path) -> None:
+    for url in ["sqlite://", "sqlite:///:memory:"]:
+        engine = db_inspector.get_engine(url, pool_size=4, max_overflow=0)
+        assert type(engine.pool).__name__ == "SingletonThreadPool"
+        engine.dispose()
+
+    engine = db_inspector.get_engine(f"sqlite:///{tmp_path / 'file.db'}", pool_size=4, max_overflow=0)
+    assert engine.pool.size() == 4
+    engine.dispose()
+
+
 def test_inspect_schema_returns_columns(monkeypatch: pytest.MonkeyPatch) -> None:
     class DummyInspector:
         def get_columns(self, table_name: str, schema: str | None = None):
@@ -59,3 +70,60 @@ def test_inspect_schema_handles_schema(monkeypatch: pytest.MonkeyPatch) -> None:
     columns = db_inspector.inspect_schema("public.users", engine="engine")
 
     assert columns == [{"name": "id", "type": "INTEGER"}]
+
+
+def test_engine_registry_reuses_engine_per_url(tmp_path) -> None:
+    registry = db_inspector.EngineRegistry(max_engines=2)
+    url = f"sqlite:///{tmp_path / 'a.db'}"
+
+    first = registry.get(url)
+    second = registry.get(url)
+
+    assert first is second
+    assert len(registry) == 1
+    registry.dispose_all()
+
+
+def test_engine_registry_evicts_least_recently_used(tmp_path, monkeypatch) -> None:
+    disposed = []
+    monkeypatch.setattr(db_inspector.Engine, "dispose", lambda self: disposed.append(self))
+    registry = db_inspector.EngineRegistry(max_engines=2)
+    urls = [f"sqlite:///{tmp_path / name}" for name in ("a.db", "b.db", "c.db")]
+
+    engine_a = registry.get(urls[0])
+    registry.get(urls[1])
+    registry.get(urls[0])
+    registry.get(urls[2])
+
+    assert len(registry) == 2
+    assert [str(engine.url) for engine in disposed] == [urls[1]]
+    assert registry.get(urls[0]) is engine_a
+
+
+def test_engine_registry_disposes_idle_engines(tmp_path) -> None:
+    now = [0.0]
+    registry = db_inspector.EngineRegistry(idle_seconds=60, clock=lambda: now[0])
+    registry.get(f"sqlite:///{tmp_path / 'a.db'}")
+
+    now[0] = 30.0
+    assert registry.dispose_idle() == 0
+    now[0] = 120.0
+    assert registry.dispose_idle() == 1
+    assert len(registry) == 0
+
+
+def test_engine_registry_counts_pool_checkouts(tmp_path) -> None:
+    from sqlalchemy import text
+
+    registry = db_inspector.EngineRegistry()
+    engine = registry.get(f"sqlite:///{tmp_path / 'a.db'}")
+    for _ in range(3):
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+    [stats] = registry.stats()
+    assert stats.checkouts == 3
+    assert stats.checkins == 3
+    assert stats.checked_out == 0
+    assert stats.connects == 1
+    registry.dispose_all()
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from rosetta_bridge.analyzer.enums import detect_enum_values
+from sqlalchemy import create_engine, event, text
+
+from rosetta_bridge.analyzer.enums import (
+    detect_enum_values,
+    profile_enum_columns,
+    profile_table_enums,
+)
 
 
 def test_detect_enum_values_returns_none_for_non_textual_column() -> None:
@@ -80,3 +86,178 @@ def test_detect_enum_values_returns_none_for_high_cardinality() -> None:
     )
 
     assert values is None
+
+
+def test_profile_enum_columns_scans_all_candidates_together() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE accounts (id INTEGER, c_sts TEXT, flg_act_y TEXT, payload JSON)")
+        )
+        for index in range(30):
+            connection.execute(
+                text("INSERT INTO accounts VALUES (:id, :status, :flag, '{}')"),
+                {"id": index, "status": ["new", "active", "closed"][index % 3], "flag": "Y"},
+            )
+
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    values = profile_enum_columns(
+        engine,
+        "accounts",
+        [
+            {"name": "id", "type": "INTEGER"},
+            {"name": "c_sts", "type": "TEXT"},
+            {"name": "flg_act_y", "type": "TEXT"},
+            {"name": "payload", "type": "JSON"},
+        ],
+        max_values=20,
+    )
+
+    assert values == {"c_sts": ["active", "closed", "new"], "flg_act_y": ["Y"]}
+    assert len(statements) == 2
+    assert '"payload"' not in statements[0]
+    assert '"id"' not in statements[1]
+
+
+def test_profile_enum_columns_short_circuits_high_cardinality() -> None:
+    statements = []
+
+    class DummyResult:
+        def one(self):
+            return (50, 80)
+
+    class DummyConnection:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def execute(self, statement, params):
+            statements.append(str(statement))
+            return DummyResult()
+
+    class DummyDialect:
+        name = "postgresql"
+
+    class DummyEngine:
+        dialect = DummyDialect()
+
+        def connect(self):
+            return DummyConnection()
+
+    values = profile_enum_columns(
+        DummyEngine(),
+        "accounts",
+        [{"name": "email", "type": "text"}, {"name": "id", "type": "bigint"}],
+    )
+
+    assert values == {}
+    assert len(statements) == 1
+
+
+def test_profile_table_enums_falls_back_to_bounded_sample_on_sqlite() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE accounts (c_sts TEXT)"))
+        for status in ["new", "active", "new", "closed"]:
+            connection.execute(text("INSERT INTO accounts VALUES (:status)"), {"status": status})
+
+    columns = [{"name": "c_sts", "type": "TEXT"}]
+
+    whole = profile_table_enums(engine, "accounts", columns, strategy="stats", row_budget=10)
+    assert whole.strategy == "tablesample"
+    assert whole.confidence == 1.0
+    assert whole.values == {"c_sts": ["active", "closed", "new"]}
+
+    partial = profile_table_enums(engine, "accounts", columns, strategy="tablesample", row_budget=2)
+    assert partial.strategy == "tablesample"
+    assert partial.confidence < 1.0
+
+    exact = profile_table_enums(engine, "accounts", columns)
+    assert (exact.strategy, exact.confidence) == ("exact", 1.0)
+
+
+def test_profile_table_enums_reads_pg_stats() -> None:
+    class DummyResult:
+        def __init__(self, rows):
+            self._rows = rows
+
+        def mappings(self):
+            return self
+
+        def all(self):
+            return self._rows
+
+        def scalar(self):
+            return self._rows
+
+    class DummyConnection:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def execute(self, statement, params):
+            if "pg_stats" in str(statement):
+                assert params == {
+                    "schema": "public",
+                    "table": "accounts",
+                    "columns": ["c_sts", "id", "n_lvl"],
+                }
+                return DummyResult(
+                    [
+                        {
+                            "attname": "c_sts",
+                            "n_distinct": 2,
+                            "null_frac": 0.0,
+                            "most_common_vals": ["closed", "active"],
+                            "most_common_freqs": [0.5, 0.45],
+                        },
+                        {
+                            "attname": "id",
+                            "n_distinct": -1,
+                            "null_frac": 0.0,
+                            "most_common_vals": None,
+                            "most_common_freqs": None,
+                        },
+                        {
+                            "attname": "n_lvl",
+                            "n_distinct": 3,
+                            "null_frac": 0.0,
+                            "most_common_vals": ["10", "2", "1"],
+                            "most_common_freqs": [0.4, 0.3, 0.3],
+                        },
+                    ]
+                )
+            return DummyResult(1_000_000.0)
+
+    class DummyDialect:
+        name = "postgresql"
+
+    class DummyEngine:
+        dialect = DummyDialect()
+
+        def connect(self):
+            return DummyConnection()
+
+    profile = profile_table_enums(
+        DummyEngine(),
+        "public.accounts",
+        [
+            {"name": "c_sts", "type": "text"},
+            {"name": "id", "type": "bigint"},
+            {"name": "n_lvl", "type": "integer"},
+        ],
+        strategy="stats",
+    )
+
+    assert profile.strategy == "stats"
+    assert profile.values == {"c_sts": ["active", "closed"], "n_lvl": [1, 2, 10]}
+    assert profile.confidence == 0.95
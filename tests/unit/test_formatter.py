@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+from rosetta_bridge.codegen.formatter import FormatStage, FormatterBackend
+
+
+def _in_process_backend(calls: list[str]) -> FormatterBackend:
+    def format_source(source: str) -> str:
+        calls.append(source)
+        return "# formatted\n" + source
+
+    return FormatterBackend(name="fake", format_source=format_source)
+
+
+def test_format_stage_formats_in_process_and_skips_unchanged_files(tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    stage = FormatStage(tmp_path, _in_process_backend(calls))
+    stage.write("models/a.py", iter(["a = 1\n"]))
+    stage.write("models/b.py", iter(["b = 1\n"]))
+    stage.close()
+
+    assert (tmp_path / "models" / "a.py").read_text() == "# formatted\na = 1\n"
+    assert len(calls) == 2
+
+    stage = FormatStage(tmp_path, _in_process_backend(calls))
+    stage.write("models/a.py", iter(["a = 1\n"]))
+    stage.write("models/b.py", iter(["b = 2\n"]))
+    stage.close()
+
+    assert stage.skipped == ["models/a.py"]
+    assert (tmp_path / "models" / "a.py").read_text() == "# formatted\na = 1\n"
+    assert (tmp_path / "models" / "b.py").read_text() == "# formatted\nb = 2\n"
+    assert calls[2:] == ["b = 2\n"]
+
+
+def test_format_stage_reformats_files_edited_by_hand(tmp_path: Path) -> None:
+    calls: list[str] = []
+    stage = FormatStage(tmp_path, _in_process_backend(calls))
+    stage.write("_models.py", ["a = 1\n"])
+    stage.close()
+
+    (tmp_path / "_models.py").write_text("edited\n")
+    stage = FormatStage(tmp_path, _in_process_backend(calls))
+    stage.write("_models.py", ["a = 1\n"])
+    stage.close()
+
+    assert stage.skipped == []
+    assert (tmp_path / "_models.py").read_text() == "# formatted\na = 1\n"
+
+
+def test_format_stage_batches_files_into_one_command(tmp_path: Path) -> None:
+    log = tmp_path / "invocations.log"
+    script = (
+        "import sys\n"
+        f"open({str(log)!r}, 'a').write(str(len(sys.argv) - 1) + '\\n')\n"
+        "for path in sys.argv[1:]:\n"
+        "    open(path, 'a').write('# formatted\\n')\n"
+    )
+    backend = FormatterBackend(name="script", command=[sys.executable, "-c", script])
+    output_dir = tmp_path / "out"
+
+    stage = FormatStage(output_dir, backend)
+    for name in ["a", "b", "c"]:
+        stage.write(f"repos/{name}.py", [f"{name} = 1\n"])
+    stage.flush()
+    stage.close()
+
+    assert log.read_text() == "3\n"
+    assert (output_dir / "repos" / "a.py").read_text() == "a = 1\n# formatted\n"
+
+    stage = FormatStage(output_dir, backend)
+    for name in ["a", "b", "c"]:
+        stage.write(f"repos/{name}.py", [f"{name} = 1\n"])
+    stage.close()
+
+    assert log.read_text() == "3\n"
+    assert stage.skipped == ["repos/a.py", "repos/b.py", "repos/c.py"]
+
+
+def test_format_stage_reports_files_it_could_not_format(tmp_path: Path, caplog) -> None:
+    def format_source(source: str) -> str:
+        raise ValueError("cannot parse")
+
+    stage = FormatStage(tmp_path, FormatterBackend(name="fake", format_source=format_source))
+    stage.write("_models.py", ["a = (\n"])
+    payload = stage.close()
+
+    assert stage.failed == {"_models.py": "fake failed: cannot parse"}
+    assert payload["files"] == {}
+    assert "Could not format _models.py" in caplog.text
+
+    backend = FormatterBackend(name="script", command=[sys.executable, "-c", "raise SystemExit(2)"])
+    stage = FormatStage(tmp_path / "out", backend)
+    stage.write("_repos.py", ["b = 1\n"])
+    stage.close()
+
+    assert stage.failed == {"_repos.py": "script exited with 2"}
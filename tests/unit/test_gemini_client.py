@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
+from google.genai import errors as genai_errors
 
-from rosetta_bridge.inference.client import GeminiClient
+from rosetta_bridge.inference.client import (
+    AsyncGeminiClient,
+    BlockingGeminiClient,
+    GeminiClient,
+)
 
 
 def test_generate_description_returns_text(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -27,3 +34,93 @@ def test_generate_description_returns_text(monkeypatch: pytest.MonkeyPatch) -> N
     result = client.generate_description("hello world")
 
     assert result == "ok"
+
+
+def test_agenerate_description_retries_rate_limits() -> None:
+    calls = []
+
+    async def transport(model_name: str, contents: str) -> str:
+        calls.append((model_name, contents))
+        if len(calls) < 3:
+            raise genai_errors.APIError(429, {"error": {"status": "RESOURCE_EXHAUSTED"}})
+        return "ok"
+
+    client = AsyncGeminiClient(transport=transport, backoff_base=0.001)
+
+    assert asyncio.run(client.agenerate_description("hello")) == "ok"
+    assert calls == [("gemini-3-flash-preview", "hello")] * 3
+
+
+def test_blocking_client_retries_for_worker_threads() -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    failures = {"a": 2, "b": 1}
+
+    async def transport(model_name: str, contents: str) -> str:
+        if failures[contents]:
+            failures[contents] -= 1
+            raise genai_errors.APIError(429, {"error": {"status": "RESOURCE_EXHAUSTED"}})
+        return contents.upper()
+
+    client = BlockingGeminiClient(transport=transport, backoff_base=0.001, max_in_flight=1)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(client.generate_description, ["a", "b"])) == ["A", "B"]
+    assert failures == {"a": 0, "b": 0}
+
+
+def test_agenerate_description_does_not_retry_client_errors() -> None:
+    calls = []
+
+    async def transport(model_name: str, contents: str) -> str:
+        calls.append(contents)
+        raise genai_errors.APIError(400, {"error": {"status": "INVALID_ARGUMENT"}})
+
+    client = AsyncGeminiClient(transport=transport, backoff_base=0.001)
+
+    with pytest.raises(genai_errors.APIError):
+        asyncio.run(client.agenerate_description("hello"))
+    assert len(calls) == 1
+
+
+def test_agenerate_description_times_out_and_gives_up() -> None:
+    calls = []
+
+    async def transport(model_name: str, contents: str) -> str:
+        calls.append(contents)
+        await asyncio.sleep(1)
+        return "late"
+
+    client = AsyncGeminiClient(
+        transport=transport,
+        timeout_seconds=0.01,
+        max_retries=1,
+        backoff_base=0.001,
+    )
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(client.agenerate_description("hello"))
+    assert len(calls) == 2
+
+
+def test_agenerate_description_bounds_in_flight_calls() -> None:
+    in_flight = 0
+    peak = 0
+
+    async def transport(model_name: str, contents: str) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return contents
+
+    client = AsyncGeminiClient(transport=transport, max_in_flight=2)
+
+    async def run() -> list[str]:
+        return await asyncio.gather(
+            *(client.agenerate_description(f"table {index}") for index in range(6))
+        )
+
+    assert asyncio.run(run()) == [f"table {index}" for index in range(6)]
+    assert peak == 2
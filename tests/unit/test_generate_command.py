@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
+import time
 
+import pytest
 from typer.testing import CliRunner
 
+from rosetta_bridge.analyzer.enums import EnumProfile
+from rosetta_bridge.inspector.snapshot import SchemaSnapshot, TableSchema
 from rosetta_bridge.main import app
 
 
 def test_generate_command_writes_outputs(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
     config_path = tmp_path / "rosetta_map.yaml"
     output_dir = tmp_path / "generated"
     config_path.write_text(
@@ -28,36 +34,37 @@ def test_generate_command_writes_outputs(tmp_path: Path, monkeypatch) -> None:
     def fake_get_engine(connection_string):
         return "engine"
 
-    def fake_inspect_schema(table, engine):
-        return [
-            {"name": "email", "type": "varchar"},
-            {"name": "status", "type": "varchar"},
-        ]
+    def fake_build_schema_snapshot(engine, tables):
+        return SchemaSnapshot(
+            tables={
+                "public.users": TableSchema(
+                    table_name="public.users",
+                    columns=[
+                        {"name": "email", "type": "varchar"},
+                        {"name": "status", "type": "varchar"},
+                    ],
+                )
+            }
+        )
 
-    def fake_fetch_sample_rows(engine, table, limit=3):
+    def fake_stream_sample_rows(engine, table, **kwargs):
         return [{"email": "a@example.com", "status": "active"}]
 
-    def fake_detect_pii(values):
-        return "@" in str(values[0])
-
-    def fake_detect_enum_values(engine, table, column_name, column_type, max_values=20):
-        if column_name == "status":
-            return ["active", "closed"]
-        return None
+    def fake_profile_table_enums(engine, table, columns, **kwargs):
+        return EnumProfile(values={"status": ["active", "closed"]}, strategy="exact", confidence=1.0)
 
     class DummyGemini:
-        def __init__(self, model_name):
+        def __init__(self, model_name, **options):
             self.model_name = model_name
 
         def generate_description(self, prompt):
             return "ok"
 
     monkeypatch.setattr("rosetta_bridge.main.get_engine", fake_get_engine)
-    monkeypatch.setattr("rosetta_bridge.main.inspect_schema", fake_inspect_schema)
-    monkeypatch.setattr("rosetta_bridge.main.fetch_sample_rows", fake_fetch_sample_rows)
-    monkeypatch.setattr("rosetta_bridge.main.detect_pii", fake_detect_pii)
-    monkeypatch.setattr("rosetta_bridge.main.detect_enum_values", fake_detect_enum_values)
-    monkeypatch.setattr("rosetta_bridge.main.GeminiClient", DummyGemini)
+    monkeypatch.setattr("rosetta_bridge.main.build_schema_snapshot", fake_build_schema_snapshot)
+    monkeypatch.setattr("rosetta_bridge.analyzer.profile.stream_sample_rows", fake_stream_sample_rows)
+    monkeypatch.setattr("rosetta_bridge.analyzer.profile.profile_table_enums", fake_profile_table_enums)
+    monkeypatch.setattr("rosetta_bridge.main.BlockingGeminiClient", DummyGemini)
 
     runner = CliRunner()
     result = runner.invoke(
@@ -74,3 +81,501 @@ def test_generate_command_writes_outputs(tmp_path: Path, monkeypatch) -> None:
     repos_text = (output_dir / "_repos.py").read_text()
     assert "commit()" not in repos_text
     assert "UPDATE" not in repos_text
+
+
+def test_generate_command_writes_per_table_layout(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / "rosetta_map.yaml"
+    output_dir = tmp_path / "generated"
+    tables = ["public.users", "billing.invoices"]
+    config_path.write_text(
+        "\n".join(
+            [
+                "project_name: demo",
+                "database:",
+                "  connection_string: postgresql://example/db",
+                "whitelist_tables:",
+                *[f"  - {table}" for table in tables],
+            ]
+        )
+    )
+
+    def fake_build_schema_snapshot(engine, tables):
+        return SchemaSnapshot(
+            tables={
+                table: TableSchema(table_name=table, columns=[{"name": "id", "type": "integer"}])
+                for table in tables
+            }
+        )
+
+    class DummyGemini:
+        def __init__(self, model_name, **options):
+            self.model_name = model_name
+
+        def generate_description(self, prompt):
+            return json.dumps({"columns": [{"name": "id", "semantic_name": "id"}]})
+
+    monkeypatch.setattr("rosetta_bridge.main.get_engine", lambda connection_string: "engine")
+    monkeypatch.setattr("rosetta_bridge.main.build_schema_snapshot", fake_build_schema_snapshot)
+    monkeypatch.setattr(
+        "rosetta_bridge.analyzer.profile.stream_sample_rows",
+        lambda engine, table, **kwargs: [{"id": 1}],
+    )
+    monkeypatch.setattr(
+        "rosetta_bridge.analyzer.profile.profile_table_enums",
+        lambda engine, table, columns, **kwargs: EnumProfile(values={}, strategy="exact", confidence=1.0),
+    )
+    monkeypatch.setattr("rosetta_bridge.main.BlockingGeminiClient", DummyGemini)
+    runner = CliRunner()
+    args = ["generate", "--config", str(config_path), "--output-dir", str(output_dir)]
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.output
+    assert (output_dir / "_models.py").exists()
+    (output_dir / "models").mkdir()
+    (output_dir / "models" / "custom_helpers.py").write_text("HELPER = 1\n")
+
+    result = runner.invoke(app, [*args, "--layout", "per-table"])
+
+    assert result.exit_code == 0, result.output
+    assert not (output_dir / "_models.py").exists()
+    assert not (output_dir / "_repos.py").exists()
+    assert (output_dir / "models" / "custom_helpers.py").read_text() == "HELPER = 1\n"
+    for package in ["models", "repos"]:
+        assert (output_dir / package / "public_users.py").exists()
+        assert (output_dir / package / "billing_invoices.py").exists()
+    init_text = (output_dir / "models" / "__init__.py").read_text()
+    assert "def __getattr__(name: str)" in init_text
+    assert '"PublicUsers": ".public_users"' in init_text
+
+    result = runner.invoke(app, [*args, "--layout", "per-table"])
+    assert "up to date" in result.output
+
+    config_path.write_text(config_path.read_text().replace("\n  - billing.invoices", ""))
+    result = runner.invoke(app, [*args, "--layout", "per-table"])
+    assert result.exit_code == 0, result.output
+    assert not (output_dir / "models" / "billing_invoices.py").exists()
+    assert (output_dir / "models" / "public_users.py").exists()
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.output
+    assert (output_dir / "_models.py").exists()
+    assert not (output_dir / "repos").exists()
+    assert sorted(path.name for path in (output_dir / "models").iterdir()) == ["custom_helpers.py"]
+
+    result = runner.invoke(app, [*args, "--layout", "flat"])
+    assert result.exit_code != 0
+
+
+def test_generate_command_keeps_whitelist_order_with_concurrency(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / "rosetta_map.yaml"
+    output_dir = tmp_path / "generated"
+    tables = ["public.slow", "public.medium", "public.fast"]
+    config_path.write_text(
+        "\n".join(
+            [
+                "project_name: demo",
+                "database:",
+                "  connection_string: postgresql://example/db",
+                "whitelist_tables:",
+                *[f"  - {table}" for table in tables],
+            ]
+        )
+    )
+    engine_options = {}
+
+    def fake_get_engine(connection_string, **options):
+        engine_options.update(options)
+        return "engine"
+
+    def fake_build_schema_snapshot(engine, names):
+        return SchemaSnapshot(
+            tables={
+                name: TableSchema(table_name=name, columns=[{"name": "id", "type": "integer"}])
+                for name in names
+            }
+        )
+
+    def fake_profile_table_enums(engine, table, columns, **kwargs):
+        return EnumProfile(values={}, strategy="exact", confidence=1.0)
+
+    delays = {"slow": 0.2, "medium": 0.1, "fast": 0.0}
+
+    class DummyGemini:
+        def __init__(self, model_name, **options):
+            self.model_name = model_name
+
+        def generate_description(self, prompt):
+            table = next(name for name in delays if f'"public.{name}"' in prompt)
+            time.sleep(delays[table])
+            return json.dumps(
+                {"columns": [{"name": "id", "semantic_name": f"{table}_id"}]}
+            )
+
+    monkeypatch.setattr("rosetta_bridge.main.get_engine", fake_get_engine)
+    monkeypatch.setattr("rosetta_bridge.main.build_schema_snapshot", fake_build_schema_snapshot)
+    monkeypatch.setattr("rosetta_bridge.analyzer.profile.profile_table_enums", fake_profile_table_enums)
+    monkeypatch.setattr("rosetta_bridge.main.BlockingGeminiClient", DummyGemini)
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "generate",
+            "--config",
+            str(config_path),
+            "--output-dir",
+            str(output_dir),
+            "--concurrency",
+            "3",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert engine_options["pool_size"] == 3
+    functions = json.loads((output_dir / "functions.json").read_text())
+    assert [schema["name"] for schema in functions] == ["get_slow", "get_medium", "get_fast"]
+    audit_log = (output_dir / "audit_log.md").read_text()
+    assert audit_log.index("slow_id") < audit_log.index("medium_id") < audit_log.index("fast_id")
+    models = (output_dir / "_models.py").read_text()
+    assert models.index("PublicSlow") < models.index("PublicMedium") < models.index("PublicFast")
+
+
+def test_generate_command_reuses_cached_inferences(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / "rosetta_map.yaml"
+    output_dir = tmp_path / "generated"
+    config_path.write_text(
+        "\n".join(
+            [
+                "project_name: demo",
+                "database:",
+                "  connection_string: postgresql://example/db",
+                "whitelist_tables:",
+                "  - public.users",
+                "cache:",
+                f"  path: {tmp_path / 'cache.sqlite'}",
+            ]
+        )
+    )
+    prompts = []
+
+    def fake_build_schema_snapshot(engine, names):
+        return SchemaSnapshot(
+            tables={
+                "public.users": TableSchema(
+                    table_name="public.users", columns=[{"name": "c_sts", "type": "text"}]
+                )
+            }
+        )
+
+    def fake_profile_table_enums(engine, table, columns, **kwargs):
+        return EnumProfile(values={}, strategy="exact", confidence=1.0)
+
+    class DummyGemini:
+        def __init__(self, model_name, **options):
+            self.model_name = model_name
+
+        def generate_description(self, prompt):
+            prompts.append(prompt)
+            return json.dumps(
+                {"columns": [{"name": "c_sts", "semantic_name": "status"}]}
+            )
+
+    monkeypatch.setattr("rosetta_bridge.main.get_engine", lambda url, **options: "engine")
+    monkeypatch.setattr("rosetta_bridge.main.build_schema_snapshot", fake_build_schema_snapshot)
+    monkeypatch.setattr("rosetta_bridge.analyzer.profile.profile_table_enums", fake_profile_table_enums)
+    monkeypatch.setattr("rosetta_bridge.main.BlockingGeminiClient", DummyGemini)
+
+    args = ["generate", "--config", str(config_path), "--output-dir", str(output_dir), "--full"]
+    runner = CliRunner()
+    assert runner.invoke(app, args).exit_code == 0
+    assert runner.invoke(app, args).exit_code == 0
+    assert len(prompts) == 1
+    assert "status (Inferred)" in (output_dir / "audit_log.md").read_text()
+
+    assert runner.invoke(app, [*args, "--no-cache"]).exit_code == 0
+    assert len(prompts) == 2
+
+    result = runner.invoke(app, ["cache", "prune", "--config", str(config_path), "--all"])
+    assert result.exit_code == 0
+    assert "Removed 1 cached inferences (0 remaining)." in result.output
+
+
+def test_generate_command_only_regenerates_changed_tables(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / "rosetta_map.yaml"
+    output_dir = tmp_path / "generated"
+    config_path.write_text(
+        "\n".join(
+            [
+                "project_name: demo",
+                "database:",
+                "  connection_string: postgresql://example/db",
+                "whitelist_tables:",
+                "  - public.users",
+                "  - public.orders",
+            ]
+        )
+    )
+    schema = {
+        "public.users": [{"name": "c_sts", "type": "text"}],
+        "public.orders": [{"name": "amt_tot_c", "type": "numeric"}],
+    }
+    profiled = []
+    prompts = []
+
+    def fake_build_schema_snapshot(engine, names):
+        return SchemaSnapshot(
+            tables={
+                name: TableSchema(table_name=name, columns=list(schema[name])) for name in names
+            }
+        )
+
+    def fake_profile_table_enums(engine, table, columns, **kwargs):
+        profiled.append(table)
+        return EnumProfile(values={}, strategy="exact", confidence=1.0)
+
+    class DummyGemini:
+        def __init__(self, model_name, **options):
+            self.model_name = model_name
+
+        def generate_description(self, prompt):
+            prompts.append(prompt)
+            return json.dumps({"columns": [{"name": "c_sts", "semantic_name": "status"}]})
+
+    monkeypatch.setattr("rosetta_bridge.main.get_engine", lambda url, **options: "engine")
+    monkeypatch.setattr("rosetta_bridge.main.build_schema_snapshot", fake_build_schema_snapshot)
+    monkeypatch.setattr("rosetta_bridge.analyzer.profile.profile_table_enums", fake_profile_table_enums)
+    monkeypatch.setattr("rosetta_bridge.main.BlockingGeminiClient", DummyGemini)
+
+    args = ["generate", "--config", str(config_path), "--output-dir", str(output_dir), "--no-cache"]
+    runner = CliRunner()
+    assert runner.invoke(app, args).exit_code == 0
+    assert profiled == ["public.users", "public.orders"]
+    assert (output_dir / "manifest.json").exists()
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert "up to date" in result.output
+    assert len(prompts) == 2
+
+    schema["public.orders"].append({"name": "flg_frd", "type": "boolean"})
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert "Regenerated 1 of 2 tables." in result.output
+    assert profiled[-1] == "public.orders"
+    assert len(prompts) == 3
+    assert "flg_frd" in (output_dir / "_models.py").read_text()
+    assert "c_sts" in (output_dir / "_models.py").read_text()
+
+
+def test_generate_command_retries_tables_whose_inference_failed(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / "rosetta_map.yaml"
+    output_dir = tmp_path / "generated"
+    config_path.write_text(
+        "\n".join(
+            [
+                "project_name: demo",
+                "database:",
+                "  connection_string: postgresql://example/db",
+                "whitelist_tables:",
+                "  - public.users",
+            ]
+        )
+    )
+    responses = ["not json", json.dumps({"columns": [{"name": "c_sts", "semantic_name": "status"}]})]
+    prompts = []
+
+    def fake_build_schema_snapshot(engine, names):
+        return SchemaSnapshot(
+            tables={
+                "public.users": TableSchema(
+                    table_name="public.users", columns=[{"name": "c_sts", "type": "text"}]
+                )
+            }
+        )
+
+    class DummyGemini:
+        def __init__(self, model_name, **options):
+            self.model_name = model_name
+
+        def generate_description(self, prompt):
+            prompts.append(prompt)
+            return responses[len(prompts) - 1]
+
+    monkeypatch.setattr("rosetta_bridge.main.get_engine", lambda url, **options: "engine")
+    monkeypatch.setattr("rosetta_bridge.main.build_schema_snapshot", fake_build_schema_snapshot)
+    monkeypatch.setattr(
+        "rosetta_bridge.analyzer.profile.profile_table_enums",
+        lambda engine, table, columns, **kwargs: EnumProfile(values={}, strategy="exact", confidence=1.0),
+    )
+    monkeypatch.setattr("rosetta_bridge.main.BlockingGeminiClient", DummyGemini)
+
+    args = ["generate", "--config", str(config_path), "--output-dir", str(output_dir), "--no-cache"]
+    runner = CliRunner()
+    assert runner.invoke(app, args).exit_code == 0
+    assert "status" not in (output_dir / "audit_log.md").read_text()
+    assert json.loads((output_dir / "manifest.json").read_text())["tables"] == {}
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0
+    assert "Regenerated 1 of 1 tables." in result.output
+    assert len(prompts) == 2
+    assert "status (Inferred)" in (output_dir / "audit_log.md").read_text()
+
+
+def test_generate_command_batches_tables_and_retries_missing(
+    tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / "rosetta_map.yaml"
+    output_dir = tmp_path / "generated"
+    tables = ["public.a", "public.b", "public.c"]
+    config_path.write_text(
+        "\n".join(
+            [
+                "project_name: demo",
+                "database:",
+                "  connection_string: postgresql://example/db",
+                "whitelist_tables:",
+                *[f"  - {table}" for table in tables],
+            ]
+        )
+    )
+    prompts = []
+
+    def fake_build_schema_snapshot(engine, names):
+        return SchemaSnapshot(
+            tables={
+                name: TableSchema(table_name=name, columns=[{"name": "c_sts", "type": "text"}])
+                for name in names
+            }
+        )
+
+    def fake_profile_table_enums(engine, table, columns, **kwargs):
+        return EnumProfile(values={}, strategy="exact", confidence=1.0)
+
+    class DummyGemini:
+        def __init__(self, model_name, **options):
+            self.model_name = model_name
+
+        def generate_description(self, prompt):
+            prompts.append(prompt)
+            if '"tables"' in prompt:
+                return json.dumps(
+                    {
+                        "tables": {
+                            "public.a": {"columns": [{"name": "c_sts", "semantic_name": "a_status"}]},
+                            "public.b": {"columns": [{"name": "c_sts", "semantic_name": "b_status"}]},
+                        }
+                    }
+                )
+            return json.dumps({"columns": [{"name": "c_sts", "semantic_name": "c_status"}]})
+
+    monkeypatch.setattr("rosetta_bridge.main.get_engine", lambda url, **options: "engine")
+    monkeypatch.setattr("rosetta_bridge.main.build_schema_snapshot", fake_build_schema_snapshot)
+    monkeypatch.setattr("rosetta_bridge.analyzer.profile.profile_table_enums", fake_profile_table_enums)
+    monkeypatch.setattr("rosetta_bridge.main.BlockingGeminiClient", DummyGemini)
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "generate",
+            "--config",
+            str(config_path),
+            "--output-dir",
+            str(output_dir),
+            "--no-cache",
+            "--batch-tokens",
+            "100000",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert len(prompts) == 2
+    assert '"public.c"' in prompts[1]
+    audit_log = (output_dir / "audit_log.md").read_text()
+    for name in ["a_status", "b_status", "c_status"]:
+        assert f"{name} (Inferred)" in audit_log
+
+
+@pytest.mark.parametrize(
+    ("scrub_pii", "generate_scans"),
+    [
+        ("false", []),
+        # Saved without samples: only the prompt samples are fetched again.
+        ("true", [("samples", 3)]),
+    ],
+)
+def test_generate_reuses_profiles_from_inspect(
+    tmp_path: Path, monkeypatch, scrub_pii: str, generate_scans: list
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    config_path = tmp_path / "rosetta_map.yaml"
+    config_path.write_text(
+        "\n".join(
+            [
+                "project_name: demo",
+                "database:",
+                "  connection_string: postgresql://example/db",
+                "whitelist_tables:",
+                "  - public.users",
+                "privacy:",
+                "  sample_rows: true",
+                f"  scrub_pii: {scrub_pii}",
+            ]
+        )
+    )
+    scans = []
+    prompts = []
+
+    def fake_build_schema_snapshot(engine, tables):
+        return SchemaSnapshot(
+            tables={
+                "public.users": TableSchema(
+                    table_name="public.users",
+                    columns=[{"name": "c_sts", "type": "varchar"}],
+                )
+            }
+        )
+
+    def fake_stream_sample_rows(engine, table, **kwargs):
+        scans.append(("samples", kwargs["limit"]))
+        return [{"c_sts": "A"}]
+
+    def fake_profile_table_enums(engine, table, columns, **kwargs):
+        scans.append("enums")
+        return EnumProfile(values={"c_sts": ["A", "C"]}, strategy="exact", confidence=1.0)
+
+    class DummyGemini:
+        def __init__(self, model_name, **options):
+            self.model_name = model_name
+
+        def generate_description(self, prompt):
+            prompts.append(prompt)
+            return json.dumps({"columns": [{"name": "c_sts", "semantic_name": "status"}]})
+
+    monkeypatch.setattr("rosetta_bridge.main.get_engine", lambda url, **options: "engine")
+    monkeypatch.setattr("rosetta_bridge.main.build_schema_snapshot", fake_build_schema_snapshot)
+    monkeypatch.setattr("rosetta_bridge.analyzer.profile.stream_sample_rows", fake_stream_sample_rows)
+    monkeypatch.setattr("rosetta_bridge.analyzer.profile.profile_table_enums", fake_profile_table_enums)
+    monkeypatch.setattr("rosetta_bridge.main.BlockingGeminiClient", DummyGemini)
+
+    runner = CliRunner()
+    assert runner.invoke(app, ["inspect", "--config", str(config_path)]).exit_code == 0
+    assert scans == [("samples", 1000), "enums"]
+
+    result = runner.invoke(
+        app,
+        ["generate", "--config", str(config_path), "--output-dir", str(tmp_path / "out")],
+    )
+
+    assert result.exit_code == 0
+    assert scans == [("samples", 1000), "enums", *generate_scans]
+    assert '"A"' in prompts[0]
+    assert "Allowed values: A, C" in (tmp_path / "out" / "_models.py").read_text()
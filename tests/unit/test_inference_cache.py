@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from rosetta_bridge.inference.cache import InferenceCache, make_cache_key
+
+
+def test_make_cache_key_depends_on_model_and_prompts() -> None:
+    key = make_cache_key("gemini-3-flash-preview", "system", "user")
+
+    assert key == make_cache_key("gemini-3-flash-preview", "system", "user")
+    assert key != make_cache_key("gemini-2.5-pro", "system", "user")
+    assert key != make_cache_key("gemini-3-flash-preview", "system", "other user")
+
+
+def test_inference_cache_round_trips_parsed_output(tmp_path: Path) -> None:
+    cache = InferenceCache(tmp_path / "cache" / "inference.sqlite")
+    value = {"c_sts": {"semantic_name": "status", "description": "Account status"}}
+
+    assert cache.get("key") is None
+    cache.set("key", "gemini-3-flash-preview", value)
+
+    reopened = InferenceCache(tmp_path / "cache" / "inference.sqlite")
+    assert reopened.get("key") == value
+    assert len(reopened) == 1
+
+
+def test_inference_cache_expires_entries_after_ttl(tmp_path: Path) -> None:
+    now = [1_000.0]
+    cache = InferenceCache(tmp_path / "inference.sqlite", ttl_seconds=60, clock=lambda: now[0])
+    cache.set("old", "model", {"a": {"semantic_name": "b"}})
+    cache.set("fresh", "model", {"c": {"semantic_name": "d"}})
+
+    now[0] += 61
+    assert cache.get("old") is None
+    cache.set("fresh", "model", {"c": {"semantic_name": "d"}})
+    assert cache.get("fresh") == {"c": {"semantic_name": "d"}}
+
+
+def test_inference_cache_prune_evicts_least_recently_used(tmp_path: Path) -> None:
+    now = [0.0]
+    cache = InferenceCache(tmp_path / "inference.sqlite", max_entries=2, clock=lambda: now[0])
+    for key in ["a", "b", "c"]:
+        now[0] += 1
+        cache.set(key, "model", {key: {"semantic_name": key}})
+    now[0] += 1
+    cache.get("a")
+
+    assert cache.prune() == 1
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
@@ -4,10 +4,13 @@ from pathlib import Path
 
 from typer.testing import CliRunner
 
+from rosetta_bridge.analyzer.enums import EnumProfile
+from rosetta_bridge.inspector.snapshot import SchemaSnapshot, TableSchema
 from rosetta_bridge.main import app
 
 
 def test_inspect_command_reports_summary(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
     config_path = tmp_path / "rosetta_map.yaml"
     config_path.write_text(
         "\n".join(
@@ -27,28 +30,29 @@ def test_inspect_command_reports_summary(tmp_path: Path, monkeypatch) -> None:
     def fake_get_engine(connection_string):
         return "engine"
 
-    def fake_inspect_schema(table, engine):
-        return [
-            {"name": "email", "type": "varchar"},
-            {"name": "status", "type": "varchar"},
-        ]
+    def fake_build_schema_snapshot(engine, tables):
+        return SchemaSnapshot(
+            tables={
+                "users": TableSchema(
+                    table_name="users",
+                    columns=[
+                        {"name": "email", "type": "varchar"},
+                        {"name": "status", "type": "varchar"},
+                    ],
+                )
+            }
+        )
 
-    def fake_fetch_sample_rows(engine, table, limit=3):
+    def fake_stream_sample_rows(engine, table, **kwargs):
         return [{"email": "a@example.com", "status": "active"}]
 
-    def fake_detect_pii(values):
-        return "@" in str(values[0])
-
-    def fake_detect_enum_values(engine, table, column_name, column_type, max_values=20):
-        if column_name == "status":
-            return ["active", "closed"]
-        return None
+    def fake_profile_table_enums(engine, table, columns, **kwargs):
+        return EnumProfile(values={"status": ["active", "closed"]}, strategy="exact", confidence=1.0)
 
     monkeypatch.setattr("rosetta_bridge.main.get_engine", fake_get_engine)
-    monkeypatch.setattr("rosetta_bridge.main.inspect_schema", fake_inspect_schema)
-    monkeypatch.setattr("rosetta_bridge.main.fetch_sample_rows", fake_fetch_sample_rows)
-    monkeypatch.setattr("rosetta_bridge.main.detect_pii", fake_detect_pii)
-    monkeypatch.setattr("rosetta_bridge.main.detect_enum_values", fake_detect_enum_values)
+    monkeypatch.setattr("rosetta_bridge.main.build_schema_snapshot", fake_build_schema_snapshot)
+    monkeypatch.setattr("rosetta_bridge.analyzer.profile.stream_sample_rows", fake_stream_sample_rows)
+    monkeypatch.setattr("rosetta_bridge.analyzer.profile.profile_table_enums", fake_profile_table_enums)
 
     runner = CliRunner()
     result = runner.invoke(app, ["inspect", "--config", str(config_path)])
@@ -59,3 +63,4 @@ def test_inspect_command_reports_summary(tmp_path: Path, monkeypatch) -> None:
     assert "Table users has 2 columns." in result.output
     assert "Detected 1 potential Enums in users." in result.output
     assert "Detected 1 potential PII columns in users." in result.output
+    assert (tmp_path / ".rosetta_cache" / "profiles.json").exists()
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import importlib
+import sys
+
+from rosetta_bridge.codegen.layout import (
+    layout_paths,
+    render_layout,
+    shard_modules,
+    stale_generated_files,
+)
+
+
+def _tables() -> list[dict]:
+    return [
+        {
+            "table_name": name,
+            "columns": [{"original_name": "id", "python_type": "int"}],
+        }
+        for name in ["public.users", "public.orders", "billing.invoices"]
+    ]
+
+
+def test_shard_modules_per_table_and_per_schema() -> None:
+    names = ["public.users", "public_users", "billing.invoices", "events"]
+
+    assert shard_modules(names, "per-table") == {
+        "public.users": "public_users",
+        "public_users": "public_users_2",
+        "billing.invoices": "billing_invoices",
+        "events": "events",
+    }
+    assert shard_modules(names, "per-schema") == {
+        "public.users": "public",
+        "public_users": "default",
+        "billing.invoices": "billing",
+        "events": "default",
+    }
+
+
+def test_render_layout_single_matches_legacy_files() -> None:
+    files = render_layout(_tables(), "single")
+
+    assert list(files) == ["_models.py", "_repos.py"]
+    assert layout_paths(["public.users"], "single") == list(files)
+
+
+def test_per_table_layout_imports_only_the_requested_module(tmp_path, monkeypatch) -> None:
+    files = render_layout(_tables(), "per-table")
+    assert sorted(files) == sorted(
+        layout_paths([table["table_name"] for table in _tables()], "per-table")
+    )
+    package = tmp_path / "generated_shards"
+    for relative_path, code in files.items():
+        target = package / relative_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(code)
+    (package / "__init__.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    try:
+        models = importlib.import_module("generated_shards.models")
+        assert "generated_shards.models.public_users" not in sys.modules
+
+        users = models.PublicUsers(id=1)
+        assert users.id == 1
+        assert "generated_shards.models.public_users" in sys.modules
+        assert "generated_shards.models.public_orders" not in sys.modules
+        assert "BillingInvoices" in dir(models)
+
+        repos = importlib.import_module("generated_shards.repos")
+        assert repos.BillingInvoicesRepository.__module__ == "generated_shards.repos.billing_invoices"
+    finally:
+        for name in list(sys.modules):
+            if name.startswith("generated_shards"):
+                del sys.modules[name]
+
+
+def test_per_schema_layout_groups_tables(tmp_path) -> None:
+    files = render_layout(_tables(), "per-schema")
+
+    assert sorted(files) == [
+        "models/__init__.py",
+        "models/_base.py",
+        "models/billing.py",
+        "models/public.py",
+        "repos/__init__.py",
+        "repos/_base.py",
+        "repos/billing.py",
+        "repos/public.py",
+    ]
+    assert "class PublicUsers(" in files["models/public.py"]
+    assert "class PublicOrders(" in files["models/public.py"]
+    assert '"PublicOrdersRepository": ".public"' in files["repos/__init__.py"]
+    assert files["repos/public.py"].startswith("from ._base import ReadOnlyRepository\n")
+
+    (tmp_path / "models").mkdir()
+    for name in ["public.py", "dropped.py", "helpers.py"]:
+        (tmp_path / "models" / name).write_text("")
+    (tmp_path / "_models.py").write_text("")
+    generated = ["_models.py", "models/public.py", "models/dropped.py", "../outside.py"]
+    assert stale_generated_files(tmp_path, generated, files) == [
+        tmp_path / "_models.py",
+        tmp_path / "models" / "dropped.py",
+    ]
+
+
+def test_sharded_layout_exports_async_repositories() -> None:
+    files = render_layout(_tables(), "per-table", repo_style="both")
+
+    init_text = files["repos/__init__.py"]
+    assert '"PublicUsersRepository": ".public_users"' in init_text
+    assert '"AsyncPublicUsersRepository": ".public_users"' in init_text
+    assert files["repos/public_users.py"].startswith(
+        "from ._base import ReadOnlyRepository, AsyncReadOnlyRepository\n"
+    )
+    assert "class AsyncReadOnlyRepository(" in files["repos/_base.py"]
+
+
+def test_sharded_dataclass_models_import_shared_base(tmp_path, monkeypatch) -> None:
+    tables = [
+        {
+            "table_name": "public.users",
+            "columns": [
+                {"original_name": "id", "python_type": "int"},
+                {"original_name": "c_sts", "python_type": "str", "semantic_name": "status"},
+            ],
+        }
+    ]
+    files = render_layout(tables, "per-table", model_style="dataclass")
+    package = tmp_path / "dataclass_shards"
+    for relative_path, code in files.items():
+        target = package / relative_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(code)
+    (package / "__init__.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    try:
+        models = importlib.import_module("dataclass_shards.models")
+        user = models.PublicUsers.construct_rows([{"id": 1, "c_sts": "A"}])[0]
+        assert (user.id, user.status) == (1, "A")
+    finally:
+        for name in list(sys.modules):
+            if name.startswith("dataclass_shards"):
+                del sys.modules[name]
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from rosetta_bridge.codegen.manifest import (
+    load_generated_files,
+    load_manifest,
+    schema_fingerprint,
+    table_fingerprint,
+    write_manifest,
+)
+from rosetta_bridge.inspector.snapshot import TableSchema
+
+
+def test_schema_fingerprint_tracks_types_and_comments() -> None:
+    base = TableSchema(table_name="users", columns=[{"name": "c_sts", "type": "text"}])
+    retyped = TableSchema(table_name="users", columns=[{"name": "c_sts", "type": "varchar"}])
+    commented = TableSchema(
+        table_name="users",
+        columns=[{"name": "c_sts", "type": "text", "comment": "status"}],
+    )
+
+    assert schema_fingerprint(base) == schema_fingerprint(
+        TableSchema(table_name="users", columns=[{"name": "c_sts", "type": "text"}])
+    )
+    assert schema_fingerprint(base) != schema_fingerprint(retyped)
+    assert schema_fingerprint(base) != schema_fingerprint(commented)
+
+
+def test_table_fingerprint_tracks_enum_values() -> None:
+    assert table_fingerprint("abc", {"c_sts": ["a", "b"]}) != table_fingerprint(
+        "abc", {"c_sts": ["a", "b", "c"]}
+    )
+
+
+def test_manifest_is_ignored_when_settings_change(tmp_path: Path) -> None:
+    entries = {"users": {"schema_hash": "abc", "fingerprint": "def"}}
+    write_manifest(tmp_path, "settings-1", entries)
+
+    assert load_manifest(tmp_path, "settings-1") == entries
+    assert load_manifest(tmp_path, "settings-2") == {}
+    assert load_manifest(tmp_path / "missing", "settings-1") == {}
+
+
+def test_write_manifest_replaces_file_atomically(tmp_path: Path) -> None:
+    path = write_manifest(tmp_path, "settings-1", {})
+    path.chmod(0o600)
+
+    write_manifest(tmp_path, "settings-1", {"users": {"schema_hash": "abc"}})
+
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert [item.name for item in tmp_path.iterdir()] == ["manifest.json"]
+    assert load_manifest(tmp_path, "settings-1") == {"users": {"schema_hash": "abc"}}
+
+
+def test_generated_files_survive_a_settings_change(tmp_path: Path) -> None:
+    write_manifest(tmp_path, "settings-1", {}, files=["repos/users.py", "models/users.py"])
+
+    assert load_manifest(tmp_path, "settings-2") == {}
+    assert load_generated_files(tmp_path) == ["models/users.py", "repos/users.py"]
+    assert load_generated_files(tmp_path / "missing") == []
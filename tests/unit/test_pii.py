@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from rosetta_bridge.analyzer import pii
+from rosetta_bridge.analyzer.pii import PiiFinding, scan_columns, scan_values
+
+
+def test_scan_columns_reports_typed_findings_per_column() -> None:
+    findings = scan_columns(
+        {
+            "contact": ["alice@example.com", "415-555-2671", None],
+            "tax_id": ["123-45-6789", "123-45-6789"],
+            "status": ["A", "C"],
+        }
+    )
+
+    assert findings == {
+        "contact": PiiFinding(column="contact", kinds=("email", "phone"), matches=2),
+        "tax_id": PiiFinding(column="tax_id", kinds=("ssn",), matches=2),
+    }
+
+
+def test_scan_values_does_not_match_across_values() -> None:
+    assert scan_values(["415", "555-2671"]) == ()
+    assert scan_values(["alice", "@example.com"]) == ()
+
+
+def test_scan_values_ignores_digits_followed_by_word_characters() -> None:
+    for value in ["5551234567a", "55494110282ab", "519223-3754b"]:
+        assert scan_values([value]) == (), value
+    assert scan_values(["call 555-123-4567 today"]) == ("phone",)
+
+
+def test_scan_values_matches_each_pattern_searched_alone() -> None:
+    assert scan_values(["B5+9+61)(1@A.abb+"]) == ("email",)
+    assert scan_values(["@B8-A.862822\t8415 +"]) == ("phone",)
+    assert scan_values(["5551234567@example.com"]) == ("email", "phone")
+
+
+def test_scan_values_is_memoized_by_digest(monkeypatch) -> None:
+    pii._scan_cache.clear()
+    scans = []
+    scan_uncached = pii._scan_uncached
+    monkeypatch.setattr(pii, "_scan_uncached", lambda text: scans.append(text) or scan_uncached(text))
+    values = [f"user{i}@example.com" for i in range(100)]
+
+    scan_values(values)
+    scan_values(list(values))
+
+    assert len(scans) == 1
+    assert all(isinstance(key, bytes) and len(key) == 16 for key in pii._scan_cache)
+
+
+def test_scan_columns_can_skip_the_memo() -> None:
+    pii._scan_cache.clear()
+
+    findings = scan_columns({"contact": ["alice@example.com"]}, memoize=False)
+
+    assert findings["contact"].kinds == ("email",)
+    assert not pii._scan_cache
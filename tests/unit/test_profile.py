@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from rosetta_bridge.analyzer import profile as profile_module
+from rosetta_bridge.analyzer.enums import EnumProfile
+from rosetta_bridge.analyzer.profile import (
+    ProfileStore,
+    TableProfile,
+    profile_table,
+    resample_profile,
+)
+from rosetta_bridge.inspector.snapshot import TableSchema
+
+
+def _patch_scans(monkeypatch) -> list[str]:
+    fetched = []
+
+    def fake_stream_sample_rows(engine, table, **kwargs):
+        fetched.append(table)
+        return [
+            {"email": "a@example.com", "status": "A"},
+            {"email": None, "status": "A"},
+        ]
+
+    def fake_profile_table_enums(engine, table, columns, **kwargs):
+        return EnumProfile(values={"status": ["A", "C"]}, strategy="stats", confidence=0.8)
+
+    monkeypatch.setattr(profile_module, "stream_sample_rows", fake_stream_sample_rows)
+    monkeypatch.setattr(profile_module, "profile_table_enums", fake_profile_table_enums)
+    return fetched
+
+
+def test_profile_table_collects_samples_enums_pii_and_stats(monkeypatch) -> None:
+    _patch_scans(monkeypatch)
+    table = TableSchema(
+        table_name="users",
+        columns=[{"name": "email", "type": "varchar"}, {"name": "status", "type": "text"}],
+    )
+
+    profile = profile_table("engine", table, schema_hash="abc")
+
+    assert profile.sample_rows == 2
+    assert profile.pii_columns == ["email"]
+    assert profile.enum_values == {"status": ["A", "C"]}
+    assert profile.enum_profile == EnumProfile({"status": ["A", "C"]}, "stats", 0.8)
+    email = profile.columns[0]
+    assert (email.null_count, email.distinct_count) == (1, 1)
+    assert profile.columns[1].distinct_count == 1
+
+
+def test_profile_store_round_trips_and_checks_schema_hash(tmp_path: Path, monkeypatch) -> None:
+    _patch_scans(monkeypatch)
+    table = TableSchema(table_name="users", columns=[{"name": "status", "type": "text"}])
+    store = ProfileStore()
+    store.put(profile_table("engine", table, schema_hash="abc", sample_rows=False))
+    path = store.save(tmp_path / "profiles.json", "settings-1")
+
+    loaded = ProfileStore.load(path, "settings-1")
+    profile = loaded.get("users", "abc")
+
+    assert isinstance(profile, TableProfile)
+    assert profile.enum_values == {"status": ["A", "C"]}
+    assert loaded.get("users", "changed") is None
+    assert loaded.get("users", "abc", need_samples=True) is None
+    assert len(ProfileStore.load(path, "settings-2")) == 0
+
+
+def test_profile_store_never_persists_pii_samples(tmp_path: Path, monkeypatch) -> None:
+    _patch_scans(monkeypatch)
+    table = TableSchema(
+        table_name="users",
+        columns=[{"name": "email", "type": "varchar"}, {"name": "status", "type": "text"}],
+    )
+    store = ProfileStore()
+    store.put(profile_table("engine", table, schema_hash="abc"))
+
+    path = store.save(tmp_path / "profiles.json", "settings-1")
+    assert "a@example.com" not in path.read_text()
+    saved = json.loads(path.read_text())["tables"]["users"]
+    assert [column["samples"] for column in saved["columns"]] == [[], ["A", "A"]]
+    assert ProfileStore.load(path, "settings-1").get("users", "abc", need_samples=True) is None
+
+    store.save(path, "settings-1", keep_samples=False)
+    saved = json.loads(path.read_text())["tables"]["users"]
+    assert all(column["samples"] == [] for column in saved["columns"])
+    assert store.get("users", "abc", need_samples=True) is not None
+
+
+def test_resample_profile_keeps_saved_enums_and_pii_flags(tmp_path: Path, monkeypatch) -> None:
+    fetched = _patch_scans(monkeypatch)
+    table = TableSchema(
+        table_name="users",
+        columns=[{"name": "email", "type": "varchar"}, {"name": "status", "type": "text"}],
+    )
+    store = ProfileStore()
+    store.put(profile_table("engine", table, schema_hash="abc"))
+    path = store.save(tmp_path / "profiles.json", "settings-1", keep_samples=False)
+    saved = ProfileStore.load(path, "settings-1").get("users", "abc")
+
+    def fail_enums(*args, **kwargs):
+        raise AssertionError("enum values were profiled again")
+
+    monkeypatch.setattr(profile_module, "profile_table_enums", fail_enums)
+
+    profile = resample_profile("engine", table, saved, sample_limit=2)
+
+    assert fetched == ["users", "users"]
+    assert profile.sampled
+    assert [column.samples for column in profile.columns] == [
+        ["a@example.com", None],
+        ["A", "A"],
+    ]
+    assert profile.pii_columns == ["email"]
+    assert profile.enum_values == {"status": ["A", "C"]}
+    assert profile.sample_rows == saved.sample_rows
+
+
+def test_profile_table_streams_budget_but_keeps_few_prompt_samples() -> None:
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE notes (id INTEGER, body TEXT)"))
+        rows = [{"id": i, "body": f"note {i}"} for i in range(20)]
+        rows.append({"id": 20, "body": "reach me at bob@example.com"})
+        connection.execute(text("INSERT INTO notes VALUES (:id, :body)"), rows)
+    table = TableSchema(
+        table_name="notes",
+        columns=[{"name": "id", "type": "INTEGER"}, {"name": "body", "type": "TEXT"}],
+    )
+
+    profile = profile_table(engine, table, sample_limit=3, sample_row_budget=100)
+
+    body = profile.columns[1]
+    assert profile.sample_rows == 21
+    assert body.samples == ["note 0", "note 1", "note 2"]
+    assert body.pii_kinds == ["email"]
+    assert body.stats["count"] == 21
+    assert profile.columns[0].stats["max"] == 20
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from rosetta_bridge.inference.prompts import build_user_prompt, get_system_prompt
+import json
+
+from rosetta_bridge.inference.prompts import (
+    build_batch_user_prompt,
+    build_table_payload,
+    build_user_prompt,
+    get_batch_system_prompt,
+    get_system_prompt,
+    parse_batch_gemini_response,
+)
 
 
 def test_system_prompt_has_role() -> None:
@@ -21,3 +30,43 @@ def test_user_prompt_scrubs_pii_samples() -> None:
     assert "active" in prompt
     assert "closed" in prompt
 
+
+def test_user_prompt_trusts_precomputed_pii_flag() -> None:
+    columns = [
+        {"name": "note", "type": "text", "samples": ["call 415-555-2671"], "pii": False},
+        {"name": "code", "type": "text", "samples": ["X-1"], "pii": True},
+    ]
+
+    prompt = build_user_prompt("users", columns, scrub_pii=True)
+
+    assert "415-555-2671" in prompt
+    assert "X-1" not in prompt
+
+
+def test_batch_prompt_lists_every_table() -> None:
+    payloads = [
+        build_table_payload("users", [{"name": "c_sts", "type": "text", "samples": ["A"]}]),
+        build_table_payload("orders", [{"name": "amt_tot_c", "type": "numeric"}]),
+    ]
+
+    prompt = build_batch_user_prompt(payloads)
+
+    assert '"table": "users"' in prompt
+    assert '"table": "orders"' in prompt
+    assert "tables" in get_batch_system_prompt()
+
+
+def test_parse_batch_response_splits_tables_and_skips_missing() -> None:
+    response = json.dumps(
+        {
+            "tables": {
+                "users": {"columns": [{"name": "c_sts", "semantic_name": "status"}]},
+                "unknown": {"columns": [{"name": "x", "semantic_name": "y"}]},
+            }
+        }
+    )
+
+    parsed = parse_batch_gemini_response(response, ["users", "orders"])
+
+    assert parsed == {"users": {"c_sts": {"semantic_name": "status"}}}
+    assert parse_batch_gemini_response("not json", ["users"]) == {}
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from rosetta_bridge.inference.ratelimit import TokenBucket, estimate_tokens
+
+
+def test_token_bucket_waits_for_refill(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [0.0]
+    sleeps = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        now[0] += delay
+
+    async def run() -> None:
+        bucket = TokenBucket(per_minute=60, clock=lambda: now[0])
+        await bucket.acquire(60)
+        await bucket.acquire(30)
+
+    monkeypatch.setattr("rosetta_bridge.inference.ratelimit.asyncio.sleep", fake_sleep)
+    asyncio.run(run())
+
+    assert sleeps == [30.0]
+
+
+def test_token_bucket_caps_requests_above_capacity() -> None:
+    async def run() -> None:
+        bucket = TokenBucket(per_minute=10)
+        await bucket.acquire(1_000)
+
+    asyncio.run(run())
+
+
+def test_estimate_tokens_is_never_zero() -> None:
+    assert estimate_tokens("") == 1
+    assert estimate_tokens("x" * 400) == 100
@@ -1,6 +1,16 @@
 from __future__ import annotations
 
-from rosetta_bridge.codegen.renderer import render_models
+import types
+
+import pytest
+
+from rosetta_bridge.codegen.renderer import (
+    DEFAULT_TEMPLATE_DIR,
+    get_template,
+    get_template_environment,
+    render_models,
+)
+from rosetta_bridge.codegen.repos import render_repositories
 
 
 def test_render_models_outputs_python_code(tmp_path) -> None:
@@ -45,3 +55,87 @@ def test_render_models_sanitizes_schema_names() -> None:
     output = render_models(tables)
 
     assert "class PublicUsers" in output
+
+
+def test_template_environment_is_shared_across_renders() -> None:
+    first = get_template("models.py.j2")
+    render_repositories([{"table_name": "users", "columns": []}])
+
+    assert get_template("models.py.j2") is first
+    assert get_template("repos.py.j2").environment is first.environment
+
+
+def test_template_environment_can_cache_bytecode_on_disk(tmp_path) -> None:
+    cache_dir = tmp_path / "jinja"
+    env = get_template_environment(DEFAULT_TEMPLATE_DIR, cache_dir)
+
+    env.get_template("models.py.j2")
+
+    assert get_template_environment(DEFAULT_TEMPLATE_DIR, cache_dir) is env
+    assert list(cache_dir.iterdir())
+
+
+def _style_tables() -> list[dict]:
+    return [
+        {
+            "table_name": "public.accounts",
+            "columns": [
+                {"original_name": "id", "python_type": "int"},
+                {
+                    "original_name": "c_sts",
+                    "python_type": "str",
+                    "semantic_name": "status",
+                    "description": 'Allowed values: "A", C',
+                },
+            ],
+        }
+    ]
+
+
+def _load_models(model_style: str) -> types.ModuleType:
+    module = types.ModuleType(f"generated_{model_style}_models")
+    code = render_models(_style_tables(), model_style=model_style)
+    exec(compile(code, module.__name__, "exec", dont_inherit=True), module.__dict__)
+    return module
+
+
+@pytest.mark.parametrize("model_style", ["pydantic", "dataclass", "msgspec"])
+def test_model_styles_validate_and_construct_rows(model_style: str) -> None:
+    accounts = _load_models(model_style).PublicAccounts
+    rows = [{"id": "1", "c_sts": "A"}, {"id": 2, "c_sts": "C"}]
+
+    validated = accounts.validate_rows(rows)
+    assert [(row.id, row.status) for row in validated] == [(1, "A"), (2, "C")]
+
+    constructed = accounts.construct_rows([{"id": 3, "c_sts": "A"}])
+    assert (constructed[0].id, constructed[0].status) == (3, "A")
+
+    with pytest.raises(Exception):
+        accounts.validate_rows([{"id": "not a number", "c_sts": "A"}])
+
+
+def test_dataclass_models_use_slots() -> None:
+    accounts = _load_models("dataclass").PublicAccounts
+
+    row = accounts.construct_rows([{"id": 1, "c_sts": "A"}])[0]
+
+    assert not hasattr(row, "__dict__")
+    assert accounts.__dataclass_fields__["status"].metadata["description"] == 'Allowed values: "A", C'
+
+
+def test_pydantic_construct_rows_matches_validated_models() -> None:
+    accounts = _load_models("pydantic").PublicAccounts
+    rows = [{"id": 1, "c_sts": "A"}, {"id": 2, "c_sts": "C"}]
+
+    constructed = accounts.construct_rows(iter(rows))
+    validated = accounts.validate_rows(rows)
+
+    assert constructed == validated
+    assert constructed[0].model_fields_set == {"id", "status"}
+    assert constructed[0].model_dump(by_alias=True) == rows[0]
+    assert constructed[0].model_fields_set is not constructed[1].model_fields_set
+
+
+def test_model_style_is_validated() -> None:
+    with pytest.raises(ValueError):
+        render_models(_style_tables(), model_style="attrs")
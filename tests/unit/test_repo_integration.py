@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import types
 
-from sqlalchemy import create_engine, text
+import pytest
+from sqlalchemy import create_engine, event, text
 
 from rosetta_bridge.codegen.repos import render_repositories
 
 
+def _load_repositories(tables: list[dict]) -> types.ModuleType:
+    code = render_repositories(tables)
+    module = types.ModuleType("generated_repos")
+    exec(code, module.__dict__)
+    return module
+
+
 def test_generated_repository_fetches_data_and_is_read_only() -> None:
     engine = create_engine("sqlite+pysqlite:///:memory:")
     with engine.begin() as connection:
@@ -14,7 +23,13 @@ def test_generated_repository_fetches_data_and_is_read_only() -> None:
         connection.execute(text("INSERT INTO users (name) VALUES ('Ada')"))
 
     code = render_repositories(
-        [{"table_name": "users", "columns": [{"original_name": "name"}]}]
+        [
+            {
+                "table_name": "users",
+                "columns": [{"original_name": "id"}, {"original_name": "name"}],
+                "primary_key": ["id"],
+            }
+        ]
     )
     assert "UPDATE" not in code
     assert "DELETE" not in code
@@ -33,3 +48,186 @@ def test_generated_repository_fetches_data_and_is_read_only() -> None:
     malicious = "'; DROP TABLE users; --"
     assert repo.fetch_by(name=malicious) == []
     assert repo.fetch_all()[0]["name"] == "Ada"
+
+
+def test_generated_repository_selects_known_columns_and_caches_statements() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as connection:
+        connection.execute(
+            text('CREATE TABLE "order items" (id INTEGER PRIMARY KEY, "sku code" TEXT, secret TEXT)')
+        )
+        connection.execute(
+            text("""INSERT INTO "order items" ("sku code", secret) VALUES ('A', 'x'), ('B', 'y')""")
+        )
+    module = _load_repositories(
+        [
+            {
+                "table_name": "order items",
+                "columns": [{"original_name": "id"}, {"original_name": "sku code"}],
+                "primary_key": ["id"],
+            }
+        ]
+    )
+    repo = module.OrderItemsRepository(engine)
+
+    assert dict(repo.fetch_by(**{"sku code": "B"})[0]) == {"id": 2, "sku code": "B"}
+    first = repo._filter_statement(("sku code",))
+    assert repo._filter_statement(("sku code",)) is first
+    assert "secret" not in first.text
+    with pytest.raises(ValueError):
+        repo.fetch_by(secret="x")
+
+
+def test_generated_repository_streams_and_pages_by_primary_key() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE events (id INTEGER PRIMARY KEY, kind TEXT)"))
+        connection.execute(
+            text("INSERT INTO events (kind) VALUES (:kind)"),
+            [{"kind": "a" if index % 2 else "b"} for index in range(25)],
+        )
+        connection.execute(
+            text("CREATE TABLE pairs (a INTEGER, b INTEGER, PRIMARY KEY (a, b))")
+        )
+        connection.execute(
+            text("INSERT INTO pairs VALUES (1, 1), (1, 2), (2, 1), (2, 2)")
+        )
+    module = _load_repositories(
+        [
+            {
+                "table_name": "events",
+                "columns": [{"original_name": "id"}, {"original_name": "kind"}],
+                "primary_key": ["id"],
+            },
+            {
+                "table_name": "pairs",
+                "columns": [{"original_name": "a"}, {"original_name": "b"}],
+                "primary_key": ["a", "b"],
+            },
+            {"table_name": "no_key", "columns": [{"original_name": "value"}]},
+        ]
+    )
+    events = module.EventsRepository(engine, batch_size=4)
+
+    assert [row["id"] for row in events.stream_all()] == list(range(1, 26))
+    assert len(list(events.iter_by(kind="a"))) == 12
+    with pytest.raises(ValueError):
+        events.iter_by(unknown=1)
+
+    seen = []
+    page = events.fetch_page(limit=10)
+    while page:
+        seen.extend(row["id"] for row in page)
+        page = events.fetch_page(after=page[-1]["id"], limit=10)
+    assert seen == list(range(1, 26))
+
+    pairs = module.PairsRepository(engine)
+    assert [tuple(row.values()) for row in pairs.fetch_page(after=(1, 2), limit=10)] == [
+        (2, 1),
+        (2, 2),
+    ]
+    with pytest.raises(ValueError):
+        module.NoKeyRepository(engine).fetch_page()
+
+
+def test_generated_repository_batches_lookups_into_in_lists() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, team TEXT)"))
+        connection.execute(
+            text("INSERT INTO users (team) VALUES (:team)"),
+            [{"team": "red" if index < 7 else "blue"} for index in range(10)],
+        )
+    module = _load_repositories(
+        [
+            {
+                "table_name": "users",
+                "columns": [{"original_name": "id"}, {"original_name": "team"}],
+                "primary_key": ["id"],
+            }
+        ]
+    )
+    repo = module.UsersRepository(engine)
+    repo._in_chunk_size = 3
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    rows = repo.fetch_many("id", [1, 2, 2, 4, 5, 9, 42, 10])
+
+    assert sorted(row["id"] for row in rows) == [1, 2, 4, 5, 9, 10]
+    assert len(statements) == 3
+    assert all(" IN (" in statement for statement in statements)
+    assert repo.fetch_many("id", []) == []
+    with pytest.raises(ValueError):
+        repo.fetch_many("password", [1])
+
+    assert repo.count_by() == 10
+    assert repo.count_by(team="red") == 7
+    assert repo.exists_by(team="blue") is True
+    assert repo.exists_by(team="green") is False
+
+
+def test_repo_style_controls_generated_classes() -> None:
+    tables = [{"table_name": "users", "columns": [{"original_name": "id"}], "primary_key": ["id"]}]
+
+    sync_code = render_repositories(tables)
+    async_code = render_repositories(tables, repo_style="async")
+    both_code = render_repositories(tables, repo_style="both")
+
+    assert "AsyncEngine" not in sync_code
+    assert "class AsyncUsersRepository" not in sync_code
+    assert "class UsersRepository" not in async_code
+    assert "from sqlalchemy.engine import Engine" not in async_code
+    assert "class UsersRepository(ReadOnlyRepository)" in both_code
+    assert "class AsyncUsersRepository(AsyncReadOnlyRepository)" in both_code
+    with pytest.raises(ValueError):
+        render_repositories(tables, repo_style="threads")
+
+
+def test_generated_async_repository_on_aiosqlite(tmp_path) -> None:
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    database = tmp_path / "repos.sqlite"
+    sync_engine = create_engine(f"sqlite+pysqlite:///{database}")
+    with sync_engine.begin() as connection:
+        connection.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, team TEXT)"))
+        connection.execute(
+            text("INSERT INTO users (team) VALUES (:team)"),
+            [{"team": "red" if index < 3 else "blue"} for index in range(5)],
+        )
+    sync_engine.dispose()
+    code = render_repositories(
+        [
+            {
+                "table_name": "users",
+                "columns": [{"original_name": "id"}, {"original_name": "team"}],
+                "primary_key": ["id"],
+            }
+        ],
+        repo_style="both",
+    )
+    module = types.ModuleType("generated_async_repos")
+    exec(code, module.__dict__)
+
+    async def run() -> None:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{database}")
+        try:
+            repo = module.AsyncUsersRepository(engine, batch_size=2)
+            assert len(await repo.fetch_all()) == 5
+            assert [row["id"] for row in await repo.fetch_by(team="red")] == [1, 2, 3]
+            assert [row["id"] async for row in repo.stream_all()] == [1, 2, 3, 4, 5]
+            assert [row["id"] async for row in repo.iter_by(team="blue")] == [4, 5]
+            assert sorted(row["id"] for row in await repo.fetch_many("id", [5, 1, 1])) == [1, 5]
+            assert await repo.count_by(team="blue") == 2
+            assert await repo.exists_by(team="green") is False
+            page = await repo.fetch_page(after=3, limit=10)
+            assert [row["id"] for row in page] == [4, 5]
+            with pytest.raises(ValueError):
+                repo.iter_by(unknown=1)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
@@ -3,8 +3,17 @@ from __future__ import annotations
 from typing import Any
 
 import pytest
+from sqlalchemy import create_engine, text
 
-from rosetta_bridge.analyzer.sampler import detect_pii, fetch_sample_rows
+from rosetta_bridge.analyzer.sampler import (
+    ColumnStats,
+    SampleProjection,
+    SampleReport,
+    detect_pii,
+    fetch_sample_rows,
+    plan_sample_projection,
+    stream_sample_rows,
+)
 
 
 @pytest.mark.parametrize(
@@ -60,3 +69,86 @@ def test_fetch_sample_rows_uses_limit_and_returns_dicts(
     ]
     assert "LIMIT :limit" in captured["statement"]
     assert captured["params"]["limit"] == 2
+
+
+def _engine_with_rows(count: int):
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE events (id INTEGER, kind TEXT, payload TEXT)"))
+        connection.execute(
+            text("INSERT INTO events VALUES (:id, :kind, :payload)"),
+            [{"id": i, "kind": "click", "payload": "x" * 100} for i in range(count)],
+        )
+    return engine
+
+
+def test_stream_sample_rows_projects_columns_and_respects_limit() -> None:
+    engine = _engine_with_rows(50)
+
+    rows = list(stream_sample_rows(engine, "events", columns=["id", "kind"], limit=10))
+
+    assert len(rows) == 10
+    assert rows[0] == {"id": 0, "kind": "click"}
+
+
+def test_stream_sample_rows_random_and_byte_budget() -> None:
+    engine = _engine_with_rows(50)
+
+    random_rows = list(stream_sample_rows(engine, "events", columns=["id"], method="random"))
+    budgeted = list(stream_sample_rows(engine, "events", columns=["payload"], byte_budget=450))
+
+    assert sorted(row["id"] for row in random_rows) == list(range(50))
+    assert len(budgeted) == 5
+
+
+def test_column_stats_tracks_running_summary() -> None:
+    stats = ColumnStats()
+    for value in ["b", "abcd", None, "abcde", "b"]:
+        stats.add(value)
+
+    assert stats.to_dict() == {
+        "count": 5,
+        "null_ratio": 0.2,
+        "distinct_count": 3,
+        "min": "abcd",
+        "max": "b",
+        "length_histogram": {"<=1": 2, "<=4": 1, "<=8": 1},
+    }
+
+
+def test_plan_sample_projection_skips_binary_and_truncates_wide_columns() -> None:
+    projection = plan_sample_projection(
+        [
+            {"name": "id", "type": "integer"},
+            {"name": "note", "type": "character varying(2000)"},
+            {"name": "payload", "type": "jsonb"},
+            {"name": "avatar", "type": "bytea"},
+            {"name": "blob_data", "type": "BLOB"},
+        ]
+    )
+
+    assert projection == SampleProjection(
+        columns=["id", "note", "payload"],
+        truncated=["note", "payload"],
+        skipped=["avatar", "blob_data"],
+    )
+
+
+def test_stream_sample_rows_truncates_server_side_and_reports_bytes() -> None:
+    engine = _engine_with_rows(4)
+    report = SampleReport()
+
+    rows = list(
+        stream_sample_rows(
+            engine,
+            "events",
+            columns=["id", "payload"],
+            truncate=["payload"],
+            max_value_chars=8,
+            report=report,
+        )
+    )
+
+    assert rows[0] == {"id": 0, "payload": "x" * 8}
+    assert report.rows == 4
+    assert report.bytes == 4 * 9
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import NoSuchTableError
+
+from rosetta_bridge.inspector.snapshot import (
+    SchemaSnapshot,
+    SnapshotCache,
+    TableSchema,
+    build_schema_snapshot,
+)
+
+
+def test_build_schema_snapshot_reflects_whitelist_in_bulk() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as connection:
+        connection.execute(
+            text("CREATE TABLE accounts (id INTEGER PRIMARY KEY, status TEXT NOT NULL)")
+        )
+        connection.execute(
+            text(
+                "CREATE TABLE orders (id INTEGER PRIMARY KEY, "
+                "account_id INTEGER REFERENCES accounts(id), amt_tot_c NUMERIC)"
+            )
+        )
+        connection.execute(text("CREATE TABLE ignored (id INTEGER)"))
+
+    snapshot = build_schema_snapshot(engine, ["orders", "accounts", "missing"])
+
+    assert list(snapshot.tables) == ["orders", "accounts"]
+    assert [c["name"] for c in snapshot.columns("orders")] == ["id", "account_id", "amt_tot_c"]
+    assert snapshot.table("accounts").primary_key == ["id"]
+    assert snapshot.columns("accounts")[1]["nullable"] is False
+    assert snapshot.comment("accounts") is None
+
+    foreign_keys = snapshot.table("orders").foreign_keys
+    assert foreign_keys[0]["constrained_columns"] == ["account_id"]
+    assert foreign_keys[0]["referred_table"] == "accounts"
+
+    assert "ignored" not in snapshot
+    with pytest.raises(NoSuchTableError):
+        snapshot.columns("missing")
+
+
+def test_build_schema_snapshot_includes_views() -> None:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    with engine.begin() as connection:
+        connection.execute(text("CREATE TABLE users (id INTEGER PRIMARY KEY, status TEXT)"))
+        connection.execute(
+            text("CREATE VIEW active_users AS SELECT id, status FROM users WHERE status = 'A'")
+        )
+
+    snapshot = build_schema_snapshot(engine, ["active_users", "users"])
+
+    assert list(snapshot.tables) == ["active_users", "users"]
+    assert [c["name"] for c in snapshot.columns("active_users")] == ["id", "status"]
+    assert snapshot.table("active_users").primary_key == []
+
+
+def test_build_schema_snapshot_uses_pg_catalog_queries() -> None:
+    statements = []
+
+    class DummyResult:
+        def __init__(self, rows):
+            self._rows = rows
+
+        def scalar_one(self):
+            return self._rows
+
+        def mappings(self):
+            return self._rows
+
+    class DummyConnection:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+        def execute(self, statement, params=None):
+            sql = str(statement)
+            statements.append((sql, params))
+            if "current_schema" in sql:
+                return DummyResult("public")
+            if "pg_class c" in sql:
+                return DummyResult(
+                    [
+                        {"oid": 10, "schema_name": "public", "table_name": "users", "comment": "People"},
+                        {"oid": 11, "schema_name": "sales", "table_name": "users", "comment": None},
+                    ]
+                )
+            if "pg_attribute a" in sql and "pg_constraint" not in sql:
+                return DummyResult(
+                    [
+                        {"oid": 10, "name": "id", "type": "integer", "nullable": False, "comment": None},
+                        {"oid": 10, "name": "c_sts", "type": "text", "nullable": True, "comment": "status"},
+                    ]
+                )
+            return DummyResult(
+                [
+                    {
+                        "oid": 10,
+                        "kind": "p",
+                        "name": "users_pkey",
+                        "constrained_columns": ["id"],
+                        "referred_schema": None,
+                        "referred_table": None,
+                        "referred_columns": [],
+                    }
+                ]
+            )
+
+    class DummyDialect:
+        name = "postgresql"
+
+    class DummyEngine:
+        dialect = DummyDialect()
+
+        def connect(self):
+            return DummyConnection()
+
+    snapshot = build_schema_snapshot(DummyEngine(), ["users"])
+
+    assert len(statements) == 4
+    assert statements[1][1] == {"schemas": ["public"], "names": ["users"]}
+    assert list(snapshot.tables) == ["users"]
+    assert snapshot.comment("users") == "People"
+    assert snapshot.columns("users")[1] == {
+        "name": "c_sts",
+        "type": "text",
+        "nullable": True,
+        "comment": "status",
+    }
+    assert snapshot.table("users").primary_key == ["id"]
+
+
+def test_snapshot_cache_reflects_only_missing_tables() -> None:
+    loads = []
+
+    def load(names):
+        loads.append(list(names))
+        return SchemaSnapshot(
+            tables={
+                name: TableSchema(table_name=name, columns=[{"name": "id"}])
+                for name in names
+                if name != "missing"
+            }
+        )
+
+    cache = SnapshotCache()
+    first = cache.get("db", ["a", "b"], load)
+    second = cache.get("db", ["b", "c", "missing"], load)
+    third = cache.get("db", ["a", "missing"], load)
+
+    assert loads == [["a", "b"], ["c", "missing"]]
+    assert list(first.tables) == ["a", "b"]
+    assert list(second.tables) == ["b", "c"]
+    assert list(third.tables) == ["a"]
+
+
+def test_snapshot_cache_expires_and_invalidates() -> None:
+    now = [0.0]
+    loads = []
+
+    def load(names):
+        loads.append(list(names))
+        return SchemaSnapshot(tables={name: TableSchema(name, []) for name in names})
+
+    cache = SnapshotCache(ttl_seconds=60, clock=lambda: now[0])
+    cache.get("db", ["a"], load)
+    now[0] = 30.0
+    cache.get("db", ["a"], load)
+    now[0] = 120.0
+    cache.get("db", ["a"], load)
+    assert cache.invalidate("db") == 1
+    cache.get("db", ["a"], load)
+
+    assert loads == [["a"], ["a"], ["a"]]
+    assert cache.invalidate("other") == 0
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from rosetta_bridge.inspector.catalog import TableSummary
+from rosetta_bridge.web import app as web_app
+
+
+def test_connect_pages_demo_tables_from_catalog(monkeypatch) -> None:
+    calls = []
+
+    def fake_list_tables(engine, schema=None, prefix=None, min_columns=0):
+        calls.append((schema, prefix, min_columns))
+        return [
+            TableSummary("public", "orders", 9, 5000),
+            TableSummary("public", "orders_backup", 9, 5000),
+            TableSummary("public", "order_items", 6, None),
+            TableSummary("public", "order_notes", 4, 10),
+        ]
+
+    monkeypatch.setattr(web_app, "get_cached_engine", lambda url: "engine")
+    monkeypatch.setattr(web_app, "list_tables", fake_list_tables)
+    client = TestClient(web_app.app)
+
+    response = client.post(
+        "/api/connect",
+        json={"database_url": "postgresql://example/db", "search": "ord", "limit": 2, "offset": 1},
+    )
+
+    payload = response.json()
+    assert calls == [("public", "ord", 3)]
+    assert payload["total"] == 3
+    assert payload["tables"] == ["public.order_items", "public.order_notes"]
+    assert payload["details"][0] == {
+        "name": "public.order_items",
+        "column_count": 6,
+        "row_estimate": None,
+    }
+
+
+def test_idle_engine_sweeper_disposes_idle_engines(monkeypatch) -> None:
+    import asyncio
+
+    swept = []
+
+    class DummyRegistry:
+        def dispose_idle(self):
+            swept.append(True)
+            return 0
+
+    monkeypatch.setattr(web_app, "engine_registry", lambda: DummyRegistry())
+
+    async def run_briefly() -> None:
+        task = asyncio.create_task(web_app._sweep_idle_engines(0.01))
+        while not swept:
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+    asyncio.run(asyncio.wait_for(run_briefly(), timeout=5))
+    assert swept
+
+
+def test_profile_stores_are_bounded_and_expire(monkeypatch) -> None:
+    from collections import OrderedDict
+
+    now = [0.0]
+    monkeypatch.setattr(web_app, "_profile_stores", OrderedDict())
+    monkeypatch.setattr(web_app, "_PROFILE_STORE_LIMIT", 2)
+    monkeypatch.setattr(web_app.time, "monotonic", lambda: now[0])
+    monkeypatch.setenv("ROSETTA_SNAPSHOT_TTL_SECONDS", "60")
+
+    first = web_app._profile_store(("a", "exact"))
+    assert web_app._profile_store(("a", "exact")) is first
+    web_app._profile_store(("b", "exact"))
+    web_app._profile_store(("c", "exact"))
+    assert list(web_app._profile_stores) == [("b", "exact"), ("c", "exact")]
+
+    now[0] = 120.0
+    stale = web_app._profile_stores[("c", "exact")][1]
+    assert web_app._profile_store(("c", "exact")) is not stale
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import io
+import json
+import zipfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+from rosetta_bridge.analyzer import profile as profile_module
+from rosetta_bridge.analyzer.enums import EnumProfile
+from rosetta_bridge.inspector.snapshot import SchemaSnapshot, TableSchema
+from rosetta_bridge.web import app as web_app
+
+
+@pytest.fixture(autouse=True)
+def _fresh_snapshot_cache(monkeypatch) -> None:
+    monkeypatch.setattr(web_app, "_snapshot_cache_instance", None)
+    monkeypatch.setattr(web_app, "_profile_stores", OrderedDict())
+
+
+def _patch_pipeline(
+    monkeypatch,
+    reflected: list[list[str]] | None = None,
+    profiled: list[str] | None = None,
+) -> None:
+    def fake_build_schema_snapshot(engine, tables):
+        if reflected is not None:
+            reflected.append(list(tables))
+        return SchemaSnapshot(
+            tables={
+                "public.users": TableSchema(
+                    table_name="public.users",
+                    columns=[{"name": "c_sts", "type": "text"}],
+                )
+            }
+        )
+
+    def fake_profile_table_enums(engine, table, columns, **kwargs):
+        if profiled is not None:
+            profiled.append(table)
+        return EnumProfile(values={"c_sts": ["A", "C"]}, strategy="exact", confidence=1.0)
+
+    class DummyGemini:
+        def __init__(self, model_name, **kwargs):
+            self.model_name = model_name
+
+        async def agenerate_description(self, prompt):
+            return json.dumps({"columns": [{"name": "c_sts", "semantic_name": "status"}]})
+
+    monkeypatch.setattr(web_app, "get_cached_engine", lambda url: "engine")
+    monkeypatch.setattr(web_app, "build_schema_snapshot", fake_build_schema_snapshot)
+    monkeypatch.setattr(profile_module, "stream_sample_rows", lambda engine, table, **kwargs: iter(()))
+    monkeypatch.setattr(profile_module, "profile_table_enums", fake_profile_table_enums)
+    monkeypatch.setattr(web_app, "AsyncGeminiClient", DummyGemini)
+
+
+def test_generate_stream_emits_per_table_progress(monkeypatch) -> None:
+    _patch_pipeline(monkeypatch)
+    client = TestClient(web_app.app)
+
+    response = client.post(
+        "/api/generate/stream",
+        json={
+            "database_url": "postgresql://example/db",
+            "gemini_api_key": "key",
+            "tables": ["public.users", "public.missing"],
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events[0]["event"] == "started"
+    assert events[-1]["event"] == "complete"
+    by_table: dict[str, list[str]] = {}
+    for event in events[1:-1]:
+        by_table.setdefault(event["table"], []).append(event["event"])
+    assert by_table == {
+        "public.users": ["introspected", "sampled", "inferred", "rendered"],
+        "public.missing": ["failed"],
+    }
+    rendered = next(event for event in events if event["event"] == "rendered")
+    assert "class PublicUsers" in rendered["models"]
+    assert "status (Inferred)" in events[-1]["outputs"]["audit_log"]
+    assert events[-1]["failed_tables"][0]["table"] == "public.missing"
+
+
+def test_generate_returns_single_json_result(monkeypatch) -> None:
+    _patch_pipeline(monkeypatch)
+    client = TestClient(web_app.app)
+
+    response = client.post(
+        "/api/generate",
+        json={
+            "database_url": "postgresql://example/db",
+            "gemini_api_key": "key",
+            "tables": ["public.users"],
+        },
+    )
+
+    payload = response.json()
+    assert payload["success"] is True
+    assert "class PublicUsers" in payload["outputs"]["models"]
+    assert payload["failed_tables"] == []
+
+
+def test_generate_archive_streams_zip_of_artifacts(monkeypatch) -> None:
+    _patch_pipeline(monkeypatch)
+    client = TestClient(web_app.app)
+    body = {
+        "database_url": "postgresql://example/db",
+        "gemini_api_key": "key",
+        "tables": ["public.users"],
+    }
+
+    response = client.post("/api/generate/archive", json=body)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert archive.namelist() == ["_models.py", "_repos.py", "audit_log.md", "functions.json"]
+        outputs = client.post("/api/generate", json=body).json()["outputs"]
+        assert archive.read("_models.py").decode() == outputs["models"]
+        assert archive.read("functions.json").decode() == outputs["functions"]
+
+
+def test_inspect_runs_tables_off_the_event_loop(monkeypatch) -> None:
+    _patch_pipeline(monkeypatch)
+    client = TestClient(web_app.app)
+
+    response = client.post(
+        "/api/inspect",
+        json={
+            "request": {"database_url": "postgresql://example/db"},
+            "tables": ["public.users"],
+        },
+    )
+
+    payload = response.json()
+    assert payload["success"] is True
+    assert payload["tables"] == [
+        {
+            "name": "public.users",
+            "column_count": 1,
+            "enum_count": 1,
+            "pii_count": 0,
+            "sample_bytes": 0,
+        }
+    ]
+
+
+def test_generate_reuses_snapshot_and_profile_from_inspect_until_invalidated(monkeypatch) -> None:
+    reflected: list[list[str]] = []
+    profiled: list[str] = []
+    _patch_pipeline(monkeypatch, reflected, profiled)
+    client = TestClient(web_app.app)
+    url = "postgresql://example/db"
+
+    client.post("/api/inspect", json={"request": {"database_url": url}, "tables": ["public.users"]})
+    body = {"database_url": url, "gemini_api_key": "key", "tables": ["public.users"]}
+    assert client.post("/api/generate", json=body).json()["success"] is True
+    assert reflected == [["public.users"]]
+    assert profiled == ["public.users"]
+
+    response = client.post("/api/cache/invalidate", json={"database_url": url})
+    assert response.json() == {"success": True, "invalidated": 1}
+    client.post("/api/generate", json=body)
+    assert reflected == [["public.users"], ["public.users"]]
+    assert profiled == ["public.users", "public.users"]
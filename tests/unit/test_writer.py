@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from rosetta_bridge.codegen.writer import write_python_file
+import pytest
+
+from rosetta_bridge.codegen.writer import write_chunks, write_python_file
 
 
 def test_write_python_file_writes_content(tmp_path: Path) -> None:
@@ -28,3 +30,33 @@ def test_write_python_file_runs_ruff_when_enabled(
 
     assert calls
     assert calls[0][0][:3] == ["uv", "run", "ruff"]
+
+
+def test_write_python_file_streams_chunks_atomically(tmp_path: Path) -> None:
+    target = tmp_path / "generated" / "models.py"
+    write_python_file(target, "old = 1\n")
+
+    def chunks():
+        yield "new = 1\n"
+        assert target.read_text() == "old = 1\n"
+        yield "more = 2\n"
+
+    write_python_file(target, chunks())
+
+    assert target.read_text() == "new = 1\nmore = 2\n"
+    assert [path.name for path in target.parent.iterdir()] == ["models.py"]
+
+
+def test_write_chunks_keeps_previous_file_when_rendering_fails(tmp_path: Path) -> None:
+    target = tmp_path / "models.py"
+    write_chunks(target, ["old = 1\n"])
+
+    def failing():
+        yield "partial"
+        raise RuntimeError("template error")
+
+    with pytest.raises(RuntimeError):
+        write_chunks(target, failing())
+
+    assert target.read_text() == "old = 1\n"
+    assert [path.name for path in tmp_path.iterdir()] == ["models.py"]